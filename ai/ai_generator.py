@@ -1,27 +1,13 @@
-import os
-import io
-from dotenv import load_dotenv
-from PIL import Image
-
-# Load environment variables
-load_dotenv()
-
-# Gemini API Setup
-try:
-    import google.generativeai as genai
-    from google.generativeai.types import HarmCategory, HarmBlockThreshold
-    
-    # Configure Gemini API
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise ValueError("GEMINI_API_KEY not found in environment variables")
-    
-    genai.configure(api_key=api_key)
-except ImportError:
-    raise ImportError("Google Generative AI package not found. Please install with: pip install google-generativeai")
+import json
+import asyncio
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 
-# Model name constant
-GEMINI_MODEL = "gemini-1.5-flash"
+from config.config import AI_CACHE_ENABLED, AI_MAX_CONCURRENCY, AI_CALL_TIMEOUT
+from ai.backends import get_backend
+from ai.response_cache import get_response_cache
+from ai.image_preprocessor import content_hash, preprocess_image
+from utils import tracing
 
 # -------------------------------------------------------------------
 # ✅ General Text Generation
@@ -29,23 +15,58 @@ GEMINI_MODEL = "gemini-1.5-flash"
 def generate_text(prompt):
     return generate_with_gemini(prompt)
 
-def generate_with_gemini(prompt):
-    try:
-        model = genai.GenerativeModel(GEMINI_MODEL)
-        response = model.generate_content(
-            prompt,
-            safety_settings={
-                HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-                HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-                HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-                HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-            }
+def _cache_prompt(prompt, generation_config=None):
+    """Prompts with a generation config are cached separately from plain ones."""
+    if generation_config:
+        return prompt + "\0" + json.dumps(generation_config, sort_keys=True)
+    return prompt
+
+def _cached_generate(prompt, image_path=None, generation_config=None, relaxed_safety=False,
+                     use_cache=AI_CACHE_ENABLED):
+    """Generate through the backend, going through the response cache. Raises on errors."""
+    backend = get_backend()
+    with tracing.span("generate", "ai", model=backend.model, image=bool(image_path)) as span:
+        cache_prompt = _cache_prompt(prompt, generation_config)
+        image_hash = content_hash(image_path) if use_cache and image_path else None
+
+        if use_cache:
+            cached = get_response_cache().get(backend.model, cache_prompt, image_hash)
+            if cached is not None:
+                span.set(cached=True)
+                return cached
+        # Only a cache miss pays for downsizing and uploading the image
+        image = preprocess_image(image_path) if image_path else None
+        text = backend.generate(
+            prompt, image=image, generation_config=generation_config, relaxed_safety=relaxed_safety
         )
-        return response.text.strip()
+        if use_cache:
+            get_response_cache().put(backend.model, cache_prompt, text, image_hash)
+        return text
+
+def generate_with_gemini(prompt, use_cache=AI_CACHE_ENABLED):
+    try:
+        return _cached_generate(prompt, relaxed_safety=True, use_cache=use_cache)
     except Exception as e:
         print(f"[❌] Gemini Error: {e}")
         return "(Error generating with Gemini)"
 
+def generate_json(prompt, schema, image_path=None, use_cache=AI_CACHE_ENABLED):
+    """
+    Generate a structured response constrained to a JSON schema.
+
+    Args:
+        prompt (str): The prompt
+        schema (dict): Response schema in Gemini's OpenAPI subset
+        image_path (str): Optional image sent inline with the prompt
+
+    Returns:
+        str: The raw JSON text (parse it with a strict parser)
+    """
+    generation_config = {"response_mime_type": "application/json", "response_schema": schema}
+    return _cached_generate(
+        prompt, image_path, generation_config, relaxed_safety=True, use_cache=use_cache
+    )
+
 # -------------------------------------------------------------------
 # ✅ LinkedIn Message Enhancement
 # -------------------------------------------------------------------
@@ -104,15 +125,11 @@ def suggest_hashtags_basic(caption_text):
 # -------------------------------------------------------------------
 # ✅ Image Captioning (Gemini)
 # -------------------------------------------------------------------
-def caption_image_with_gemini(image_path):
+IMAGE_CAPTION_PROMPT = "Describe this image for a LinkedIn post:"
+
+def caption_image_with_gemini(image_path, use_cache=AI_CACHE_ENABLED):
     try:
-        model = genai.GenerativeModel(GEMINI_MODEL)
-        image = Image.open(image_path)
-        response = model.generate_content([
-            "Describe this image for a LinkedIn post:",
-            image
-        ])
-        return response.text.strip()
+        return _cached_generate(IMAGE_CAPTION_PROMPT, image_path, use_cache=use_cache)
     except Exception as e:
         print(f"[❌] Gemini Vision Error: {e}")
         return "(Error generating image caption)"
@@ -123,39 +140,73 @@ def generate_caption_from_image(image_path):
 # -------------------------------------------------------------------
 # ✅ Smart Topic & Hashtag Detection (Text + Optional Image)
 # -------------------------------------------------------------------
+TOPIC_HASHTAGS_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "topic": {"type": "STRING"},
+        "hashtags": {"type": "ARRAY", "items": {"type": "STRING"}},
+    },
+    "required": ["topic", "hashtags"],
+}
+
+HASHTAG_GUIDELINES = (
+    "Hashtag guidelines:\n"
+    "1. Be specific and relevant to the professional context\n"
+    "2. Avoid generic hashtags like #motivation, #success, or #life\n"
+    "3. Include at least one industry-specific hashtag\n"
+    "4. Include at least one skill-related hashtag if applicable\n"
+    "5. Maximum 5 hashtags total\n"
+)
+
+def _parse_hashtags(values, limit=5):
+    if not isinstance(values, list) or not all(isinstance(tag, str) for tag in values):
+        raise ValueError("'hashtags' must be a list of strings")
+    hashtags = []
+    for tag in values:
+        tag = "#" + "".join(tag.split()).lstrip("#")
+        if len(tag) > 1 and tag.lower() not in (h.lower() for h in hashtags):
+            hashtags.append(tag)
+    return hashtags[:limit]
+
+def parse_topic_and_hashtags(output):
+    """
+    Strictly parse a JSON topic/hashtags response.
+
+    Returns:
+        tuple: (topic, hashtags)
+
+    Raises:
+        ValueError: If the response is not valid JSON of the expected shape
+    """
+    data = json.loads(output)
+    if not isinstance(data, dict):
+        raise ValueError("Expected a JSON object")
+    topic = data.get("topic")
+    if not isinstance(topic, str) or not topic.strip():
+        raise ValueError("'topic' must be a non-empty string")
+    return topic.strip(), _parse_hashtags(data.get("hashtags"))
+
 def detect_topic_and_hashtags(caption_text, image_path=None):
-    if image_path:
-        image_caption = caption_image_with_gemini(image_path)
-        caption_text += "\n" + image_caption
+    """
+    Detect the topic of a post and suggest hashtags in one structured call.
+    An image, if given, is sent inline instead of being captioned first.
 
+    Returns:
+        tuple: (topic, hashtags), or ("General", []) if generation fails
+    """
     prompt = (
         "You are an assistant that helps generate topics and hashtags for LinkedIn posts.\n"
-        "Analyze the following post content and reply using exactly this format:\n\n"
-        "Topic: <One concise phrase that captures the professional focus>\n"
-        "Hashtags: #tag1 #tag2 #tag3 #tag4 #tag5\n\n"
-        "Hashtag guidelines:\n"
-        "1. Be specific and relevant to the professional context\n"
-        "2. Avoid generic hashtags like #motivation, #success, or #life\n"
-        "3. Include at least one industry-specific hashtag\n"
-        "4. Include at least one skill-related hashtag if applicable\n"
-        "5. Maximum 5 hashtags total\n\n"
-        "No explanations, no options, no introductions. Just output exactly like the format above.\n\n"
-        f"Post:\n{caption_text}"
+        "Analyze the following post content (and image, if attached) and return the topic as "
+        "one concise phrase that captures the professional focus, plus up to 5 hashtags.\n\n"
+        + HASHTAG_GUIDELINES +
+        f"\nPost:\n{caption_text}"
     )
 
-    output = generate_text(prompt)
-    topic, hashtags = "General", []
-    if "Topic:" in output:
-        try:
-            lines = output.splitlines()
-            for line in lines:
-                if line.startswith("Topic:"):
-                    topic = line.split("Topic:")[-1].strip()
-                elif line.startswith("Hashtags:"):
-                    hashtags = line.split("Hashtags:")[-1].strip().split()
-        except Exception as e:
-            print(f"[⚠️] Parsing failed: {e}")
-    return topic, hashtags
+    try:
+        return parse_topic_and_hashtags(generate_json(prompt, TOPIC_HASHTAGS_SCHEMA, image_path))
+    except Exception as e:
+        print(f"[⚠️] Topic/hashtag generation failed: {e}")
+        return "General", []
 
 # -------------------------------------------------------------------
 # ✅ Topic-Only Detection (For Simpler Logic)
@@ -213,3 +264,260 @@ def enhance_caption(caption):
     except Exception as e:
         print(f"[❌] Caption enhancement error: {e}")
         return caption  # Return original caption if enhancement fails
+
+# -------------------------------------------------------------------
+# ✅ Post Package (Caption + Topic + Hashtags in One Call)
+# -------------------------------------------------------------------
+POST_PACKAGE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "caption": {"type": "STRING"},
+        "topic": {"type": "STRING"},
+        "hashtags": {"type": "ARRAY", "items": {"type": "STRING"}},
+    },
+    "required": ["caption", "topic", "hashtags"],
+}
+
+def parse_post_package(output):
+    """
+    Strictly parse a JSON post package response.
+
+    Returns:
+        tuple: (caption, topic, hashtags)
+
+    Raises:
+        ValueError: If the response is not valid JSON of the expected shape
+    """
+    data = json.loads(output)
+    if not isinstance(data, dict):
+        raise ValueError("Expected a JSON object")
+    caption = data.get("caption")
+    if not isinstance(caption, str) or not caption.strip():
+        raise ValueError("'caption' must be a non-empty string")
+    topic, hashtags = parse_topic_and_hashtags(output)
+    return caption.strip(), topic, hashtags
+
+def build_post_package_prompt(caption):
+    return (
+        "You are a professional LinkedIn content writer. Enhance and restructure this post caption "
+        "(taking the attached image into account, if any) following this structure:\n\n"
+        "- Lines 1-2: HOOK - a bold statement, thought-provoking question, or relatable problem\n"
+        "- Lines 3-6: CONTEXT - what you're working on or the value being shared; short sentences, "
+        "line breaks, benefits not just features\n"
+        "- Lines 7-8: CHALLENGE or PERSONAL TOUCH - a roadblock or learning that adds authenticity\n"
+        "- Lines 9-10: WHY IT MATTERS - the impact, value, or relevance to the audience\n"
+        "- Lines 11-12: CALL TO ACTION - a conversational, soft invitation to reply, share, or connect\n\n"
+        "Do not include section headers, tips, or hashtags in the caption itself.\n"
+        "Also return the post's topic as one concise phrase and up to 5 hashtags.\n\n"
+        + HASHTAG_GUIDELINES +
+        f"\nOriginal caption:\n{caption}"
+    )
+
+def generate_post_package(caption, image_path=None):
+    """
+    Enhance a post caption and detect its topic and hashtags with a single
+    model call. An image, if given, is sent inline with the prompt.
+
+    Args:
+        caption (str): The original caption
+        image_path (str): Optional image attached to the post
+
+    Returns:
+        tuple: (enhanced_caption, topic, hashtags). Falls back to
+            (caption, "General", []) if generation or parsing fails.
+    """
+    try:
+        return parse_post_package(generate_json(build_post_package_prompt(caption), POST_PACKAGE_SCHEMA, image_path))
+    except Exception as e:
+        print(f"[❌] Post package generation error: {e}")
+        return caption, "General", []
+
+# -------------------------------------------------------------------
+# ✅ Streaming Generation
+# -------------------------------------------------------------------
+def stream_text(prompt, use_cache=AI_CACHE_ENABLED):
+    """
+    Generate text for a prompt, yielding chunks as they arrive.
+
+    A cached response is yielded in one piece; a completed stream is cached
+    like generate_text. Errors are raised to the caller.
+
+    Yields:
+        str: Text chunks
+    """
+    backend = get_backend()
+    if use_cache:
+        cached = get_response_cache().get(backend.model, prompt)
+        if cached is not None:
+            yield cached
+            return
+
+    chunks = []
+    for chunk in backend.stream(prompt, relaxed_safety=True):
+        chunks.append(chunk)
+        yield chunk
+    if use_cache:
+        get_response_cache().put(backend.model, prompt, "".join(chunks).strip())
+
+def partial_json_string(text, key):
+    """
+    Decode the (possibly still incomplete) string value of ``key`` from a
+    JSON object that is being streamed, e.g. '{"caption": "Hel' -> "Hel".
+
+    Returns:
+        str: The decoded prefix, or "" if the value has not started yet
+    """
+    marker = text.find(f'"{key}"')
+    if marker == -1:
+        return ""
+    start = text.find('"', text.find(":", marker) + 1)
+    if start == -1:
+        return ""
+
+    value, index = [], start + 1
+    escapes = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+    while index < len(text):
+        char = text[index]
+        if char == '"':
+            break
+        if char == "\\":
+            if index + 1 >= len(text):
+                break
+            code = text[index + 1]
+            if code == "u":
+                digits = text[index + 2:index + 6]
+                if len(digits) < 4:
+                    break
+                value.append(chr(int(digits, 16)))
+                index += 6
+                continue
+            value.append(escapes.get(code, code))
+            index += 2
+            continue
+        value.append(char)
+        index += 1
+    return "".join(value)
+
+def stream_post_package(caption, image_path=None, result=None):
+    """
+    Streaming variant of generate_post_package.
+
+    Yields the enhanced caption as it is generated. Once the stream is
+    exhausted, ``result`` (if given) is updated with "caption", "topic" and
+    "hashtags", falling back to the original caption on errors.
+
+    Yields:
+        str: Caption text deltas
+    """
+    result = result if result is not None else {}
+    result.update(caption=caption, topic="General", hashtags=[])
+    backend = get_backend()
+    prompt = build_post_package_prompt(caption)
+    generation_config = {"response_mime_type": "application/json", "response_schema": POST_PACKAGE_SCHEMA}
+    cache_prompt = _cache_prompt(prompt, generation_config)
+    buffer, shown = "", 0
+
+    try:
+        image_hash = content_hash(image_path) if AI_CACHE_ENABLED and image_path else None
+        cached = get_response_cache().get(backend.model, cache_prompt, image_hash) if AI_CACHE_ENABLED else None
+        chunks = [cached] if cached is not None else backend.stream(
+            prompt, image=preprocess_image(image_path) if image_path else None,
+            generation_config=generation_config, relaxed_safety=True
+        )
+        for chunk in chunks:
+            buffer += chunk
+            partial = partial_json_string(buffer, "caption")
+            if len(partial) > shown:
+                yield partial[shown:]
+                shown = len(partial)
+        enhanced, topic, hashtags = parse_post_package(buffer)
+        result.update(caption=enhanced, topic=topic, hashtags=hashtags)
+        if AI_CACHE_ENABLED and cached is None:
+            get_response_cache().put(backend.model, cache_prompt, buffer.strip(), image_hash)
+    except Exception as e:
+        print(f"[❌] Post package streaming error: {e}")
+
+# -------------------------------------------------------------------
+# ✅ Async API (Concurrent Generations)
+# -------------------------------------------------------------------
+# The SDK calls are blocking, so they run on a shared thread pool while a
+# per-event-loop semaphore bounds how many are in flight at once. A timed
+# out call gives up its semaphore slot but its thread stays busy until the
+# HTTP request ends (the backend's request timeout bounds that), so the
+# pool has headroom beyond the semaphore for new calls to start meanwhile.
+_executor = ThreadPoolExecutor(max_workers=AI_MAX_CONCURRENCY * 2, thread_name_prefix="ai")
+_semaphores = weakref.WeakKeyDictionary()
+
+def _get_semaphore():
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(AI_MAX_CONCURRENCY)
+        _semaphores[loop] = semaphore
+    return semaphore
+
+async def _run_blocking(func, *args, timeout=None):
+    """
+    Run a blocking generation function off the event loop.
+
+    Raises:
+        asyncio.TimeoutError: If the call takes longer than ``timeout``
+            (AI_CALL_TIMEOUT by default).
+
+    Timing out or cancelling only stops waiting: the in-flight request is
+    not aborted and runs in its thread until it completes or hits the
+    backend's own request timeout.
+    """
+    async with _get_semaphore():
+        loop = asyncio.get_running_loop()
+        return await asyncio.wait_for(
+            loop.run_in_executor(_executor, func, *args),
+            timeout or AI_CALL_TIMEOUT,
+        )
+
+async def agenerate_text(prompt, timeout=None):
+    return await _run_blocking(generate_text, prompt, timeout=timeout)
+
+async def acaption_image(image_path, timeout=None):
+    return await _run_blocking(caption_image_with_gemini, image_path, timeout=timeout)
+
+async def aenhance_caption(caption, timeout=None):
+    return await _run_blocking(enhance_caption, caption, timeout=timeout)
+
+async def asuggest_hashtags(topic, timeout=None):
+    return await _run_blocking(suggest_hashtags, topic, timeout=timeout)
+
+async def adetect_topic_and_hashtags(caption_text, image_path=None, timeout=None):
+    return await _run_blocking(detect_topic_and_hashtags, caption_text, image_path, timeout=timeout)
+
+async def agenerate_post_package(caption, image_path=None, timeout=None):
+    return await _run_blocking(generate_post_package, caption, image_path, timeout=timeout)
+
+async def agather(*coros, default=None):
+    """
+    Run coroutines concurrently and return their results in order. A call that
+    fails or times out yields ``default`` instead of cancelling the others.
+    """
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            raise result
+    return [default if isinstance(result, Exception) else result for result in results]
+
+def run_async(coro):
+    """Run a coroutine to completion from synchronous code (e.g. a GUI worker thread)."""
+    return asyncio.run(coro)
+
+def generate_many(prompts, timeout=None, default=None):
+    """
+    Generate text for several independent prompts concurrently.
+
+    Args:
+        prompts (list): Prompts to generate for
+        timeout (float): Per-call timeout in seconds
+        default: Value returned for a prompt whose call failed or timed out
+
+    Returns:
+        list: Responses in the same order as ``prompts``
+    """
+    return run_async(agather(*(agenerate_text(prompt, timeout) for prompt in prompts), default=default))
@@ -0,0 +1,163 @@
+import os
+import threading
+
+from config.config import AI_CALL_TIMEOUT
+
+# Model name constant
+GEMINI_MODEL = "gemini-1.5-flash"
+
+
+class GeminiBackend:
+    """
+    Google Gemini backend.
+
+    The API is configured on first use, and each (model, generation config)
+    pair gets one GenerativeModel that is reused by every call and thread.
+
+    Args:
+        model: Default model name
+        request_timeout: Seconds before the HTTP request of a call gives up
+    """
+
+    def __init__(self, model=GEMINI_MODEL, request_timeout=AI_CALL_TIMEOUT):
+        self.model = model
+        self.request_timeout = request_timeout
+        self._genai = None
+        self._safety_settings = None
+        self._models = {}
+        self._lock = threading.Lock()
+
+    def _configure(self):
+        if self._genai is not None:
+            return self._genai
+        with self._lock:
+            if self._genai is None:
+                try:
+                    import google.generativeai as genai
+                    from google.generativeai.types import HarmCategory, HarmBlockThreshold
+                except ImportError:
+                    raise ImportError(
+                        "Google Generative AI package not found. Please install with: pip install google-generativeai"
+                    )
+
+                from dotenv import load_dotenv
+                load_dotenv()
+                api_key = os.getenv("GEMINI_API_KEY")
+                if not api_key:
+                    raise ValueError("GEMINI_API_KEY not found in environment variables")
+                genai.configure(api_key=api_key)
+
+                self._safety_settings = {
+                    HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
+                    HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
+                    HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
+                    HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
+                }
+                self._genai = genai
+        return self._genai
+
+    def get_model(self, model=None, generation_config=None):
+        """Return the shared GenerativeModel for this model/config pair."""
+        genai = self._configure()
+        name = model or self.model
+        config_key = tuple(sorted(generation_config.items())) if generation_config else None
+        key = (name, repr(config_key))
+        instance = self._models.get(key)
+        if instance is None:
+            with self._lock:
+                instance = self._models.get(key)
+                if instance is None:
+                    instance = genai.GenerativeModel(name, generation_config=generation_config)
+                    self._models[key] = instance
+        return instance
+
+    def generate(self, prompt, image=None, model=None, generation_config=None, relaxed_safety=False):
+        """
+        Generate text for a prompt and an optional image.
+
+        Args:
+            prompt: Text prompt
+            image: Optional image path or PIL image
+            model: Model name (defaults to the backend's model)
+            generation_config: Optional generation config dict
+            relaxed_safety: Turn off the default safety blocking
+
+        Returns:
+            str: The stripped response text
+        """
+        instance, contents, kwargs = self._prepare(prompt, image, model, generation_config, relaxed_safety)
+        response = instance.generate_content(contents, **kwargs)
+        return response.text.strip()
+
+    def stream(self, prompt, image=None, model=None, generation_config=None, relaxed_safety=False):
+        """Like generate(), but yield text chunks as the model produces them."""
+        instance, contents, kwargs = self._prepare(prompt, image, model, generation_config, relaxed_safety)
+        for chunk in instance.generate_content(contents, stream=True, **kwargs):
+            if chunk.text:
+                yield chunk.text
+
+    def _prepare(self, prompt, image, model, generation_config, relaxed_safety):
+        instance = self.get_model(model, generation_config)
+        contents = prompt
+        if image is not None:
+            if isinstance(image, str):
+                from PIL import Image
+                image = Image.open(image)
+            contents = [prompt, image]
+        kwargs = {"request_options": {"timeout": self.request_timeout}}
+        if relaxed_safety:
+            kwargs["safety_settings"] = self._safety_settings
+        return instance, contents, kwargs
+
+
+class StubBackend:
+    """
+    Offline backend for tests and benchmarks.
+
+    Returns ``responses[prompt]`` when the prompt is known, otherwise the
+    result of ``default`` (a string or a callable taking the prompt).
+    Streams yield the same text in ``chunk_size`` pieces. Every call is
+    recorded in ``calls``.
+    """
+
+    def __init__(self, responses=None, default="Stub response", model="stub", chunk_size=8):
+        self.model = model
+        self.chunk_size = chunk_size
+        self.responses = responses or {}
+        self.default = default
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def generate(self, prompt, image=None, model=None, generation_config=None, relaxed_safety=False):
+        with self._lock:
+            self.calls.append({"prompt": prompt, "image": image, "model": model or self.model})
+        if prompt in self.responses:
+            return self.responses[prompt]
+        return self.default(prompt) if callable(self.default) else self.default
+
+    def stream(self, prompt, image=None, model=None, generation_config=None, relaxed_safety=False):
+        """Yield the stub response in small chunks."""
+        text = self.generate(prompt, image, model, generation_config, relaxed_safety)
+        for start in range(0, len(text), self.chunk_size):
+            yield text[start:start + self.chunk_size]
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """Return the process-wide AI backend (Gemini unless replaced with set_backend)."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = GeminiBackend()
+    return _backend
+
+
+def set_backend(backend):
+    """Replace the process-wide AI backend, e.g. with a StubBackend in tests."""
+    global _backend
+    with _backend_lock:
+        _backend = backend
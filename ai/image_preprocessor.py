@@ -0,0 +1,91 @@
+import os
+import threading
+
+from config.config import AI_IMAGE_MAX_EDGE, AI_IMAGE_QUALITY, AI_IMAGE_CACHE_MAX_FILES
+from ai.response_cache import hash_file
+
+# Define the cache location
+IMAGE_CACHE_DIR = os.path.join("logs", "image_cache")
+
+_hash_lock = threading.Lock()
+_hash_memo = {}
+
+
+def content_hash(path):
+    """
+    Return the SHA-256 of an image file.
+
+    The hash is memoized per (path, mtime, size), so an unchanged file is
+    only read and hashed once per process.
+    """
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    with _hash_lock:
+        digest = _hash_memo.get(key)
+    if digest is None:
+        digest = hash_file(path)
+        with _hash_lock:
+            _hash_memo[key] = digest
+    return digest
+
+
+def _prune_cache(cache_dir, max_files):
+    files = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir)]
+    if len(files) <= max_files:
+        return
+    files.sort(key=os.path.getmtime)
+    for path in files[:len(files) - max_files]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def preprocess_image(path, max_edge=AI_IMAGE_MAX_EDGE, quality=AI_IMAGE_QUALITY, cache_dir=IMAGE_CACHE_DIR):
+    """
+    Downsize and re-encode an image before it is sent to the model.
+
+    The longest edge is limited to ``max_edge`` pixels, EXIF rotation is
+    applied and the result is saved as an optimized JPEG. Results are cached
+    in ``cache_dir`` by content hash, so each distinct image is processed
+    once no matter how often it is analysed.
+
+    Args:
+        path: Original image path
+        max_edge: Maximum width/height in pixels
+        quality: JPEG quality (1-95)
+        cache_dir: Directory for processed images
+
+    Returns:
+        str: Path of the processed image (the original path if it cannot be processed)
+    """
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+    target = os.path.join(cache_dir, f"{content_hash(path)}_{max_edge}_{quality}.jpg")
+    if os.path.exists(target):
+        return target
+
+    from PIL import Image, ImageOps
+
+    try:
+        with Image.open(path) as image:
+            image.draft("RGB", (max_edge, max_edge))  # Cheap downscale while decoding JPEGs
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+            if image.mode in ("RGBA", "LA", "P"):
+                image = image.convert("RGBA")
+                background = Image.new("RGB", image.size, (255, 255, 255))
+                background.paste(image, mask=image.split()[-1])
+                image = background
+            elif image.mode != "RGB":
+                image = image.convert("RGB")
+
+            tmp_path = target + ".tmp"
+            image.save(tmp_path, "JPEG", quality=quality, optimize=True)
+            os.replace(tmp_path, target)
+    except OSError as e:
+        print(f"[⚠️] Could not preprocess image {path}: {e}")
+        return path
+
+    _prune_cache(cache_dir, AI_IMAGE_CACHE_MAX_FILES)
+    return target
@@ -1,25 +1,20 @@
 # memory/memory_utils.py
 
-import json
-import os
-
-log_path = "logs/message_log.json"
+from utils.contact_store import get_contact_store, MESSAGED
 
 def load_log():
-    if not os.path.exists(log_path):
-        return {}
-    with open(log_path, "r") as f:
-        return json.load(f)
+    return get_contact_store().items(MESSAGED)
 
 def save_log(log):
-    with open(log_path, "w") as f:
-        json.dump(log, f, indent=2)
+    store = get_contact_store()
+    for name, message in log.items():
+        store.add(MESSAGED, name, message)
+    store.flush()
 
 def has_messaged_before(name):
-    log = load_log()
-    return name in log
+    return get_contact_store().contains(MESSAGED, name)
 
 def record_message(name, message):
-    log = load_log()
-    log[name] = message
-    save_log(log)
+    store = get_contact_store()
+    store.add(MESSAGED, name, message)
+    store.flush()
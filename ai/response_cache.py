@@ -0,0 +1,149 @@
+import os
+import time
+import atexit
+import sqlite3
+import hashlib
+import threading
+
+from config.config import AI_CACHE_TTL, AI_CACHE_MAX_ENTRIES
+
+# Define the cache location
+CACHE_DIR = "logs"
+CACHE_FILE = os.path.join(CACHE_DIR, "ai_cache.sqlite3")
+
+
+def hash_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path):
+    """Return the SHA-256 of a file's contents, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def make_key(model, prompt, image_hash=None):
+    """Build the cache key from the model, the prompt hash and the image hash."""
+    prompt_hash = hash_bytes(prompt.encode("utf-8"))
+    return hash_bytes(f"{model}\0{prompt_hash}\0{image_hash or ''}".encode("utf-8"))
+
+
+class ResponseCache:
+    """
+    On-disk LRU cache of model responses with TTL eviction.
+
+    Entries older than ``ttl`` seconds are treated as misses and deleted.
+    Once more than ``max_entries`` are stored, the least recently used ones
+    are evicted. Hit and miss counters are kept for the current process.
+
+    Args:
+        path: SQLite file for the cache
+        ttl: Seconds an entry stays valid (0 disables expiry)
+        max_entries: Maximum number of stored responses
+    """
+
+    def __init__(self, path=CACHE_FILE, ttl=AI_CACHE_TTL, max_entries=AI_CACHE_MAX_ENTRIES):
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+        self._conn.commit()
+
+    def get(self, model, prompt, image_hash=None):
+        """Return the cached response, or None on a miss."""
+        key = make_key(model, prompt, image_hash)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row and self.ttl and now - row[1] > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, model, prompt, response, image_hash=None):
+        """Store a response and evict the least recently used entries over the limit."""
+        key = make_key(model, prompt, image_hash)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, model, response, now, now),
+            )
+            if self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl,))
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def stats(self):
+        """Return the hit/miss counters and the number of stored entries."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": entries,
+        }
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """Return the process-wide response cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                cache = ResponseCache()
+                atexit.register(cache.close)
+                _cache = cache
+    return _cache
@@ -1,6 +1,5 @@
 import os
 import time
-import json
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
@@ -10,32 +9,29 @@ from selenium.webdriver.support import expected_conditions as EC
 from ai.ai_generator import generate_alumni_message
 from automation.message_bot import send_message_to_profile
 from utils.logger import log_action
-
-LOG_FILE = "logs/sent_alumni.json"
+from utils.contact_store import get_contact_store, ALUMNI_MESSAGED
+from config.config import LEAN_MODE_TASKS
+from automation.lean_mode import lean_mode
+from automation.waits import (
+    wait_for_page_ready,
+    wait_for_page_settled,
+    wait_for_network_idle,
+    scroll_into_view,
+)
 
 
 def has_already_messaged(profile_url):
-    if not os.path.exists(LOG_FILE):
-        return False
-    with open(LOG_FILE, "r") as f:
-        data = json.load(f)
-        return profile_url in data.get("sent", [])
+    return get_contact_store().contains(ALUMNI_MESSAGED, profile_url)
 
 
 def log_alumni_message(profile_url):
-    data = {"sent": []}
-    if os.path.exists(LOG_FILE):
-        with open(LOG_FILE, "r") as f:
-            data = json.load(f)
-    data["sent"].append(profile_url)
-    with open(LOG_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    get_contact_store().add(ALUMNI_MESSAGED, profile_url)
 
 
 def get_current_university(driver):
     """Try to extract university name from LinkedIn profile"""
     driver.get("https://www.linkedin.com/in/me/ ")
-    time.sleep(5)
+    wait_for_page_settled(driver)
 
     try:
         # Wait for education section
@@ -68,8 +64,7 @@ def click_people_filter(driver, max_retries=3):
                 EC.element_to_be_clickable((By.XPATH, people_xpath))
             )
 
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", people_button)
-            time.sleep(1)
+            scroll_into_view(driver, people_button)
 
             try:
                 people_button.click()
@@ -77,7 +72,7 @@ def click_people_filter(driver, max_retries=3):
                 driver.execute_script("arguments[0].click();", people_button)
 
             print("✅ People filter clicked.")
-            time.sleep(3)
+            wait_for_network_idle(driver)
             return True
 
         except Exception as e:
@@ -95,11 +90,9 @@ def apply_company_filter(driver):
         company_filter_button = WebDriverWait(driver, 10).until(
             EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Current company')]"))
         )
-        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", company_filter_button)
-        time.sleep(1)
+        scroll_into_view(driver, company_filter_button)
         company_filter_button.click()
         print("✅ Current company filter opened.")
-        time.sleep(2)
 
         # Step 2: Wait for company list
         company_items = WebDriverWait(driver, 10).until(
@@ -145,7 +138,6 @@ def apply_company_filter(driver):
         )
         driver.execute_script("arguments[0].click();", selected_item)
         print(f"✅ Checkbox clicked for: {selected_name}")
-        time.sleep(2)
 
         # Step 6: Click "Show Results"
         show_results = WebDriverWait(driver, 10).until(
@@ -153,7 +145,7 @@ def apply_company_filter(driver):
         )
         show_results.click()
         print("✅ Applied company filter and showing results.")
-        time.sleep(5)
+        wait_for_network_idle(driver)
         return True
 
     except Exception as e:
@@ -170,7 +162,7 @@ def search_for_university(driver, university_name):
         search_input.send_keys(university_name)
         search_input.send_keys(Keys.RETURN)
         print(f"🔍 Searched for university: {university_name}")
-        time.sleep(3)
+        wait_for_page_settled(driver)
         return True
     except Exception as e:
         print(f"[❌] Failed to perform university search: {e}")
@@ -178,21 +170,21 @@ def search_for_university(driver, university_name):
 
 def navigate_to_alumni_page(driver, college_name):
     driver.get("https://www.linkedin.com/school/ ")
-    time.sleep(2)
+    wait_for_page_ready(driver)
 
     search_input = WebDriverWait(driver, 10).until(
         EC.presence_of_element_located((By.XPATH, "//input[contains(@placeholder, 'Search')]"))
     )
     search_input.send_keys(college_name)
     search_input.send_keys(Keys.RETURN)
-    time.sleep(3)
+    wait_for_page_settled(driver)
 
     try:
         school_link = WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.XPATH, "//a[contains(@href, '/school/') and contains(@href, 'linkedin.com/school')]"))
         )
         school_link.click()
-        time.sleep(3)
+        wait_for_page_settled(driver)
     except Exception as e:
         print(f"[❌] Could not open school page: {e}")
         return False
@@ -203,7 +195,7 @@ def navigate_to_alumni_page(driver, college_name):
         )
         driver.execute_script("arguments[0].click();", alumni_link)
         print("✅ Navigated to alumni page.")
-        time.sleep(3)
+        wait_for_page_settled(driver)
         return True
     except Exception as e:
         print(f"[❌] Could not open alumni section: {e}")
@@ -216,7 +208,7 @@ def extract_alumni_profiles(driver, max_profiles=10):
 
     for _ in range(3):  # Scroll to load more profiles
         scroll_area.send_keys(Keys.END)
-        time.sleep(2)
+        wait_for_network_idle(driver)
 
     cards = driver.find_elements(By.XPATH, "//div[contains(@class, 'entity-result__item')]")[:max_profiles]
 
@@ -250,10 +242,11 @@ def extract_college_info(driver):
 
 
 def message_alumni(driver, college_name, department, graduation_year, resume_path, purpose="connect"):
-    if not navigate_to_alumni_page(driver, college_name):
-        return
-
-    profiles = extract_alumni_profiles(driver, max_profiles=10)
+    # Finding alumni only reads names and links; visiting and messaging them loads pages normally
+    with lean_mode(driver, enabled="find_alumni" in LEAN_MODE_TASKS):
+        if not navigate_to_alumni_page(driver, college_name):
+            return
+        profiles = extract_alumni_profiles(driver, max_profiles=10)
 
     for profile in profiles:
         url = profile["profile_url"]
@@ -262,7 +255,7 @@ def message_alumni(driver, college_name, department, graduation_year, resume_pat
             continue
 
         driver.get(url)
-        time.sleep(5)
+        wait_for_page_settled(driver)
 
         edu_entries = extract_college_info(driver)
         matches = any(college_name.lower() in entry.lower() and department.lower() in entry.lower() for entry in edu_entries)
@@ -281,6 +274,8 @@ def message_alumni(driver, college_name, department, graduation_year, resume_pat
         else:
             print(f"❌ Failed to message: {profile['name']}")
 
+    get_contact_store().flush()
+
 
 def run_alumni_outreach(driver):
     """Main function to handle alumni outreach workflow"""
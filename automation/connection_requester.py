@@ -1,17 +1,27 @@
 import time
-import random
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import (
-    NoSuchElementException,
     ElementClickInterceptedException,
     StaleElementReferenceException,
     TimeoutException,
+    WebDriverException,
 )
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from utils.contact_store import (
+    get_contact_store,
+    CONNECTION_SENT,
+    CONNECTION_SKIPPED,
+    CONNECTION_SAVED,
+)
+from automation.waits import wait_for_network_idle, scroll_into_view, dwell
+from automation.incremental_loader import IncrementalLoader
+from automation.selector_registry import get_selector_registry
+from utils import tracing
 
-# Global sets for tracking processed profiles
+# Global sets for tracking profiles processed in the current run.
+# Decisions are also persisted in the contact store so they survive restarts.
 processed_profiles = set()
 skipped_profiles = set()
 saved_for_later = set()
@@ -23,6 +33,107 @@ def reset_counters():
     skipped_profiles = set()
     saved_for_later = set()
 
+# Selector fallback chains shared by the WebDriver and the in-page extraction paths
+CARD_CLASS = "discover-entity-card"
+CARD_FALLBACK_SELECTORS = [
+    "//div[@data-view-name='cohort-card']",
+    "//div[.//button[contains(@aria-label, 'Invite') and contains(@aria-label, 'to connect')]]",
+    "//div[contains(@class, 'artdeco-card') and .//a[contains(@href, '/in/')]]",
+]
+NAME_CLASS = "discover-entity-card__name"
+NAME_SELECTORS = [
+    ".//p[contains(@class, 'ac02ae51 ddce6825')]",
+    ".//p[contains(@class, 'ac02ae51') and contains(@class, '_7d7ce955')]",
+    ".//span[@dir='ltr']",
+]
+HEADLINE_CLASS = "discover-entity-card__title"
+HEADLINE_SELECTORS = [
+    ".//p[contains(@class, 'ac02ae51 b3a25350')]",
+    ".//p[contains(@class, '_5aa7ddba')]",
+    ".//div[contains(@class, 'entity-result__primary-subtitle')]",
+]
+UNIVERSITY_SELECTOR = ".//*[contains(text(), 'University') or contains(text(), 'College') or contains(text(), 'Studied at')]"
+COMPANY_SELECTOR = ".//*[contains(text(), ' at ') and not(contains(text(), 'Studied at'))]"
+CONNECT_SELECTORS = [
+    ".//button[contains(@aria-label, 'Invite')]",
+    ".//button[contains(@aria-label, 'Invite') and contains(@aria-label, 'to connect')]",
+    ".//button[contains(text(), 'Connect') and contains(@class, 'artdeco-button')]",
+]
+
+# The same chains as ranked registry candidates for the WebDriver lookups
+selectors = get_selector_registry()
+PROFILE_NAME = selectors.register(
+    "connection.name", [(By.CLASS_NAME, NAME_CLASS)] + [(By.XPATH, selector) for selector in NAME_SELECTORS]
+)
+PROFILE_HEADLINE = selectors.register(
+    "connection.headline", [(By.CLASS_NAME, HEADLINE_CLASS)] + [(By.XPATH, selector) for selector in HEADLINE_SELECTORS]
+)
+CONNECT_BUTTON = selectors.register(
+    "connection.connect_button", [(By.XPATH, selector) for selector in CONNECT_SELECTORS]
+)
+
+# Runs the whole card lookup and field extraction inside the page so a full
+# page of cards costs one WebDriver round trip instead of several per card.
+CARD_EXTRACTION_SCRIPT = """
+const [cardClass, cardSelectors, nameClass, nameSelectors, headlineClass,
+       headlineSelectors, universitySelector, companySelector, connectSelectors] = arguments;
+
+const xpathAll = (expr, ctx) => {
+    const result = document.evaluate(expr, ctx || document, null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const nodes = [];
+    for (let i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+    return nodes;
+};
+const xpathFirst = (expr, ctx) => document.evaluate(expr, ctx, null,
+    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const textOf = (el) => el ? (el.innerText || el.textContent || '').trim() : '';
+const firstText = (card, className, selectors, reject) => {
+    const byClass = card.getElementsByClassName(className)[0];
+    if (byClass) return textOf(byClass);
+    for (const selector of selectors) {
+        const text = textOf(xpathFirst(selector, card));
+        if (text && text !== reject) return text;
+    }
+    return '';
+};
+
+let cards = Array.from(document.getElementsByClassName(cardClass));
+if (!cards.length) {
+    const seen = new Set();
+    for (const selector of cardSelectors) {
+        for (const el of xpathAll(selector)) {
+            if (!seen.has(el)) {
+                seen.add(el);
+                cards.push(el);
+            }
+        }
+    }
+}
+
+return cards.map((card) => {
+    let connectButton = null;
+    for (const selector of connectSelectors) {
+        connectButton = xpathFirst(selector, card);
+        if (connectButton) break;
+    }
+    const link = card.querySelector('a');
+    let university = textOf(xpathFirst(universitySelector, card));
+    if (university.includes('Studied at ')) university = university.split('Studied at ').pop();
+    let company = textOf(xpathFirst(companySelector, card));
+    if (company) company = company.split(' at ').pop().split(',')[0].trim();
+    return {
+        element: card,
+        name: firstText(card, nameClass, nameSelectors, 'N/A'),
+        headline: firstText(card, headlineClass, headlineSelectors, ''),
+        university: university,
+        company: company,
+        profile_link: link && link.href ? link.href.split('?')[0] : '',
+        connect_button: connectButton,
+    };
+});
+"""
+
 def open_people_you_may_know(driver, output_callback=None):
     """Open the LinkedIn 'My Network' page."""
     if output_callback:
@@ -32,40 +143,146 @@ def open_people_you_may_know(driver, output_callback=None):
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.TAG_NAME, "main"))
         )
-        time.sleep(3)
+        wait_for_network_idle(driver)
         if output_callback:
             output_callback("✅ Network page loaded", level="user")
     except TimeoutException:
         if output_callback:
             output_callback("⚠ Page load timeout, continuing...", level="info")
 
-def scroll_to_load_more(driver, output_callback=None):
-    """Scroll the page to load more profiles."""
+# Profile link and connect button presence of one card, extracted in the page
+PROFILE_CARD_SELECTOR = f".{CARD_CLASS}"
+PROFILE_CARD_EXTRACT_SCRIPT = """(el) => {
+    const link = el.querySelector('a[href]');
+    return {
+        key: link ? link.href.split('?')[0] : '',
+        connectable: !!el.querySelector("button[aria-label*='Invite']"),
+    };
+}"""
+
+def create_profile_card_loader(driver):
+    """Return an IncrementalLoader for the cards on the network page, with the same fallbacks as get_connection_sections."""
+    return IncrementalLoader(
+        driver, "profile_cards", PROFILE_CARD_SELECTOR, PROFILE_CARD_EXTRACT_SCRIPT, CARD_FALLBACK_SELECTORS
+    )
+
+def load_more_profiles(loader, target, output_callback=None, exclude=()):
+    """
+    Scroll until ``target`` cards that can still be sent a request are loaded.
+
+    Cards already sent a request or whose profile link is in ``exclude``
+    do not count. Stops as soon as enough are on the page, or when
+    scrolling no longer adds cards.
+
+    Returns:
+        int: Number of cards loaded by this call
+    """
     if output_callback:
         output_callback("📜 Scrolling to load more profiles...", level="info")
-    last_height = driver.execute_script("return document.body.scrollHeight")
-    while True:
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(random.uniform(2, 4))
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        if new_height == last_height:
-            if output_callback:
-                output_callback("✅ No more profiles to load", level="info")
-            break
-        last_height = new_height
+    contact_store = get_contact_store()
+    loaded = len(loader.items)
+    loader.load(
+        target,
+        accept=lambda item: (
+            item["connectable"]
+            and item["key"] not in exclude
+            and not contact_store.contains(CONNECTION_SENT, item["key"])
+        ),
+        log_callback=output_callback,
+    )
     if output_callback:
         output_callback("✅ Done scrolling", level="info")
+    return len(loader.items) - loaded
+
+def extract_connection_cards(driver, timeout=5):
+    """
+    Extract every connection card on the page with a single execute_script call.
+
+    Waits up to ``timeout`` seconds for cards to appear.
+
+    Returns:
+        List of dicts with element, name, headline, university, company,
+        profile_link and connect_button (a WebElement or None)
+    """
+    args = (
+        CARD_CLASS, CARD_FALLBACK_SELECTORS, NAME_CLASS, NAME_SELECTORS, HEADLINE_CLASS,
+        HEADLINE_SELECTORS, UNIVERSITY_SELECTOR, COMPANY_SELECTOR, CONNECT_SELECTORS,
+    )
+    try:
+        return WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script(CARD_EXTRACTION_SCRIPT, *args) or False
+        )
+    except TimeoutException:
+        return []
+
+def _element_text(element):
+    text = element.text.strip()
+    return text if text and text != "N/A" else ""
+
+def get_connection_sections(driver, output_callback=None, mode="script"):
+    """
+    Get all connection sections (profile cards).
+
+    Args:
+        mode: "script" extracts all cards in one round trip; "elements" uses
+            the per-element WebDriver lookups (kept as a fallback for debugging)
+    """
+    if mode == "elements":
+        return _get_connection_sections_by_elements(driver, output_callback)
 
-def get_connection_sections(driver, output_callback=None):
-    """Get all connection sections (profile cards)."""
+    sections = {}
+    try:
+        cards = extract_connection_cards(driver)
+    except WebDriverException as e:
+        if output_callback:
+            output_callback(f"⚠ In-page card extraction failed ({e.__class__.__name__}), using element lookups...", level="debug")
+        return _get_connection_sections_by_elements(driver, output_callback)
+
+    if output_callback:
+        output_callback(f"📋 Found {len(cards)} profile cards", level="info")
+
+    if not cards:
+        if output_callback:
+            output_callback("⚠ No profile cards found across all selectors", level="user")
+        return sections
+
+    for card in cards:
+        name = card["name"] or "Unknown"
+        # Skip invalid or irrelevant profiles
+        if name == "Unknown" or any(x in name.lower() for x in ["manage", "training", "invited"]):
+            continue
+
+        if not card["connect_button"]:  # Only include cards with a connect button
+            if output_callback:
+                output_callback(f"⚠ Skipping card without connect button: {name}", level="debug")
+            continue
+
+        sections[name] = {
+            "element": card["element"],
+            "profile_link": card["profile_link"],
+            "connect_button": card["connect_button"],
+            "info": {
+                "name": name,
+                "headline": card["headline"] or "N/A",
+                "university": card["university"] or "N/A",
+                "company": card["company"] or "N/A",
+            },
+        }
+
+    if output_callback:
+        output_callback(f"📋 Total valid profile cards: {len(sections)}", level="info")
+    return sections
+
+def _get_connection_sections_by_elements(driver, output_callback=None):
+    """Get connection sections with one WebDriver lookup per card field (slow path)."""
     sections = {}
     
     # Primary selector from the simplified version
     try:
         WebDriverWait(driver, 5).until(
-            EC.presence_of_all_elements_located((By.CLASS_NAME, "discover-entity-card"))
+            EC.presence_of_all_elements_located((By.CLASS_NAME, CARD_CLASS))
         )
-        cards = driver.find_elements(By.CLASS_NAME, "discover-entity-card")
+        cards = driver.find_elements(By.CLASS_NAME, CARD_CLASS)
         if output_callback:
             output_callback(f"📋 Found {len(cards)} profile cards with class 'discover-entity-card'", level="info")
     except TimeoutException:
@@ -75,12 +292,7 @@ def get_connection_sections(driver, output_callback=None):
     
     # Fallback selectors from the detailed version
     if not cards:
-        fallback_selectors = [
-            "//div[@data-view-name='cohort-card']",
-            "//div[.//button[contains(@aria-label, 'Invite') and contains(@aria-label, 'to connect')]]",
-            "//div[contains(@class, 'artdeco-card') and .//a[contains(@href, '/in/')]]",
-        ]
-        for selector in fallback_selectors:
+        for selector in CARD_FALLBACK_SELECTORS:
             try:
                 WebDriverWait(driver, 5).until(
                     EC.presence_of_all_elements_located((By.XPATH, selector))
@@ -98,25 +310,8 @@ def get_connection_sections(driver, output_callback=None):
     
     for card in cards:
         try:
-            # Extract name using simplified selector, fall back to detailed selectors
-            try:
-                name_element = card.find_element(By.CLASS_NAME, "discover-entity-card__name")
-                name = name_element.text.strip()
-            except NoSuchElementException:
-                name_selectors = [
-                    ".//p[contains(@class, 'ac02ae51 ddce6825')]",
-                    ".//p[contains(@class, 'ac02ae51') and contains(@class, '_7d7ce955')]",
-                    ".//span[@dir='ltr']",
-                ]
-                name = "Unknown"
-                for selector in name_selectors:
-                    try:
-                        name_element = card.find_element(By.XPATH, selector)
-                        name = name_element.text.strip()
-                        if name and name != "N/A":
-                            break
-                    except:
-                        continue
+            name_element = selectors.find(card, PROFILE_NAME, predicate=_element_text)
+            name = _element_text(name_element) if name_element else "Unknown"
             
             # Skip invalid or irrelevant profiles
             if not name or name == "Unknown" or any(x in name.lower() for x in ["manage", "training", "invited"]):
@@ -139,59 +334,26 @@ def get_connection_sections(driver, output_callback=None):
         output_callback(f"📋 Total valid profile cards: {len(sections)}", level="info")
     return sections
 
-def extract_profile_cards(section_element, driver, output_callback=None):
+def extract_profile_cards(section_element, driver, output_callback=None, connect_button=None):
     """Treat section element as a profile card."""
-    if get_connect_button(section_element):
+    if connect_button or get_connect_button(section_element):
         return [section_element]
     return []
 
 def extract_profile_info(card):
     """Extract profile information from a card."""
     try:
-        # Name
-        try:
-            name = card.find_element(By.CLASS_NAME, "discover-entity-card__name").text.strip() or "Unknown"
-        except NoSuchElementException:
-            name_selectors = [
-                ".//p[contains(@class, 'ac02ae51 ddce6825')]",
-                ".//p[contains(@class, 'ac02ae51') and contains(@class, '_7d7ce955')]",
-                ".//span[@dir='ltr']",
-            ]
-            name = "Unknown"
-            for selector in name_selectors:
-                try:
-                    name_element = card.find_element(By.XPATH, selector)
-                    name = name_element.text.strip()
-                    if name and name != "N/A":
-                        break
-                except:
-                    continue
-        
-        # Headline
-        try:
-            headline = card.find_element(By.CLASS_NAME, "discover-entity-card__title").text.strip() or "N/A"
-        except NoSuchElementException:
-            headline_selectors = [
-                ".//p[contains(@class, 'ac02ae51 b3a25350')]",
-                ".//p[contains(@class, '_5aa7ddba')]",
-                ".//div[contains(@class, 'entity-result__primary-subtitle')]",
-            ]
-            headline = "N/A"
-            for selector in headline_selectors:
-                try:
-                    headline_element = card.find_element(By.XPATH, selector)
-                    headline = headline_element.text.strip()
-                    if headline:
-                        break
-                except:
-                    continue
+        # Name and headline: the registry tries the currently working selector first
+        name_element = selectors.find(card, PROFILE_NAME, predicate=_element_text)
+        name = _element_text(name_element) if name_element else "Unknown"
+
+        headline_element = selectors.find(card, PROFILE_HEADLINE, predicate=_element_text)
+        headline = _element_text(headline_element) if headline_element else "N/A"
         
         # University
         university = "N/A"
         try:
-            university_element = card.find_element(
-                By.XPATH, ".//*[contains(text(), 'University') or contains(text(), 'College') or contains(text(), 'Studied at')]"
-            )
+            university_element = card.find_element(By.XPATH, UNIVERSITY_SELECTOR)
             university_text = university_element.text.strip()
             university = university_text.split("Studied at ")[-1] if "Studied at " in university_text else university_text
         except:
@@ -200,9 +362,7 @@ def extract_profile_info(card):
         # Company
         company = "N/A"
         try:
-            company_element = card.find_element(
-                By.XPATH, ".//*[contains(text(), ' at ') and not(contains(text(), 'Studied at'))]"
-            )
+            company_element = card.find_element(By.XPATH, COMPANY_SELECTOR)
             company_text = company_element.text.strip()
             company = company_text.split(" at ")[-1].split(",")[0].strip()
         except:
@@ -224,21 +384,7 @@ def extract_profile_info(card):
 
 def get_connect_button(card):
     """Find the connect button in a profile card."""
-    try:
-        return card.find_element(By.XPATH, ".//button[contains(@aria-label, 'Invite')]")
-    except NoSuchElementException:
-        # Fallback selectors from the detailed version
-        connect_selectors = [
-            ".//button[contains(@aria-label, 'Invite') and contains(@aria-label, 'to connect')]",
-            ".//button[contains(text(), 'Connect') and contains(@class, 'artdeco-button')]",
-        ]
-        for selector in connect_selectors:
-            try:
-                button = card.find_element(By.XPATH, selector)
-                return button
-            except NoSuchElementException:
-                continue
-    return None
+    return selectors.find(card, CONNECT_BUTTON)
 
 def send_connection_request(driver, card, connect_button, message, output_callback=None):
     """Send a connection request (simplified version)."""
@@ -246,11 +392,9 @@ def send_connection_request(driver, card, connect_button, message, output_callba
         driver.execute_script(
             "arguments[0].style.border='2px solid green';", card
         )
-        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", card)
-        time.sleep(1)
+        scroll_into_view(driver, card)
         
         ActionChains(driver).move_to_element(connect_button).click().perform()
-        time.sleep(2)
         
         try:
             send_button = WebDriverWait(driver, 3).until(
@@ -286,117 +430,159 @@ def print_profile_info(profile_info, output_callback=None):
     if output_callback:
         output_callback(output, level="user")
 
+@tracing.traced_run("process_connections")
 def process_connections(driver, max_requests=5, output_callback=None, decision_callback=None, counter_callback=None):
     """Process connection requests."""
     global processed_profiles, skipped_profiles, saved_for_later
     processed_count = 0
     
     reset_counters()
+    contact_store = get_contact_store()
     open_people_you_may_know(driver, output_callback)
-    scroll_to_load_more(driver, output_callback=output_callback)
-
-    sections = get_connection_sections(driver, output_callback)
-    if not sections:
-        if output_callback:
-            output_callback("❌ No profiles found to process", level="user")
-        return processed_count
 
     total_requests_sent = 0
     processed_in_this_run = set()
+    # Profile links of every card already offered, whatever was decided
+    offered = set()
+    found_profiles = False
 
-    for section_title, section_data in sections.items():
-        if total_requests_sent >= max_requests:
-            break
-
-        section_element = section_data["element"]
-        profile_link = section_data["profile_link"]
-        if output_callback:
-            output_callback(f"\n🔶 Processing profile: {section_title[:30]}...", level="user")
+    # Decisions other than "y", invalid names and stale cards use up the
+    # loaded cards, so more are loaded whenever they run out
+    loader = create_profile_card_loader(driver)
+    try:
+        load_more_profiles(loader, max_requests, output_callback, offered)
+        while True:
+            sections = {
+                title: data for title, data in get_connection_sections(driver, output_callback).items()
+                if data["profile_link"] not in offered
+            }
+            found_profiles = found_profiles or bool(sections)
+            offered.update(data["profile_link"] for data in sections.values())
+            # Cards get_connection_sections filtered out are not offered again either
+            offered.update(loader.items)
 
-        cards = extract_profile_cards(section_element, driver, output_callback)
-        if not cards:
-            continue
+            for section_title, section_data in sections.items():
+                if total_requests_sent >= max_requests:
+                    break
 
-        for card in cards:
-            if total_requests_sent >= max_requests:
-                break
+                section_element = section_data["element"]
+                profile_link = section_data["profile_link"]
+                if output_callback:
+                    output_callback(f"\n🔶 Processing profile: {section_title[:30]}...", level="user")
 
-            retries = 2
-            while retries > 0:
-                try:
-                    profile_info = extract_profile_info(card)
-                    profile_info["profile_link"] = profile_link
-                    name = profile_info['name']
+                cached_info = section_data.get("info")
+                cached_connect_button = section_data.get("connect_button")
+                cards = extract_profile_cards(section_element, driver, output_callback, cached_connect_button)
+                if not cards:
+                    continue
 
-                    if name == "N/A" or name == "Unknown" or not name.strip():
-                        if output_callback:
-                            output_callback(f"⚠ Skipping invalid profile: {name}", level="user")
+                for card in cards:
+                    if total_requests_sent >= max_requests:
                         break
+
+                    retries = 2
+                    while retries > 0:
+                        try:
+                            # Reuse the fields extracted in-page; re-query only after a stale retry
+                            profile_info = dict(cached_info) if cached_info else extract_profile_info(card)
+                            profile_info["profile_link"] = profile_link
+                            name = profile_info['name']
+
+                            if name == "N/A" or name == "Unknown" or not name.strip():
+                                if output_callback:
+                                    output_callback(f"⚠ Skipping invalid profile: {name}", level="user")
+                                break
                 
-                    if name in processed_in_this_run or name in processed_profiles:
-                        if output_callback:
-                            output_callback(f"⚠ Skipping already processed: {name}", level="user")
-                        break
+                            if name in processed_in_this_run or name in processed_profiles:
+                                if output_callback:
+                                    output_callback(f"⚠ Skipping already processed: {name}", level="user")
+                                break
 
-                    processed_in_this_run.add(name)
-                    driver.execute_script(
-                        "arguments[0].style.border='2px solid green';", card
-                    )
-                    print_profile_info(profile_info, output_callback)
+                            if contact_store.contains(CONNECTION_SENT, profile_link):
+                                if output_callback:
+                                    output_callback(f"⚠ Skipping, request already sent earlier: {name}", level="user")
+                                break
 
-                    while True:
-                        if output_callback:
-                            output_callback("🤖 Send request? [y/n/l]: ", level="user")
-                        decision = decision_callback()
-                        if decision == "y":
-                            connect_button = get_connect_button(card)
-                            if connect_button:
-                                success = send_connection_request(driver, card, connect_button, None, output_callback)
-                                if success:
-                                    total_requests_sent += 1
+                            processed_in_this_run.add(name)
+                            driver.execute_script(
+                                "arguments[0].style.border='2px solid green';", card
+                            )
+                            print_profile_info(profile_info, output_callback)
+
+                            while True:
+                                if output_callback:
+                                    output_callback("🤖 Send request? [y/n/l]: ", level="user")
+                                with tracing.span("decision", "decision"):
+                                    decision = decision_callback()
+                                if decision == "y":
+                                    connect_button = cached_connect_button or get_connect_button(card)
+                                    if connect_button:
+                                        success = send_connection_request(driver, card, connect_button, None, output_callback)
+                                        if success:
+                                            total_requests_sent += 1
+                                            processed_count += 1
+                                            processed_profiles.add(name)
+                                            contact_store.add(CONNECTION_SENT, profile_link, name)
+                                            if output_callback:
+                                                output_callback(f"📊 Progress: {total_requests_sent}/{max_requests} requests sent", level="user")
+                                    else:
+                                        if output_callback:
+                                            output_callback("❌ No connect button found", level="user")
+                                    break
+                                elif decision == "n":
+                                    skipped_profiles.add(name)
+                                    contact_store.add(CONNECTION_SKIPPED, profile_link, name)
+                                    if output_callback:
+                                        output_callback("⏭ Skipped", level="user")
+                                    driver.execute_script(
+                                        "arguments[0].style.border='2px solid gray';", card
+                                    )
                                     processed_count += 1
-                                    processed_profiles.add(name)
+                                    break
+                                elif decision == "l":
+                                    saved_for_later.add(name)
+                                    contact_store.add(CONNECTION_SAVED, profile_link, name)
                                     if output_callback:
-                                        output_callback(f"📊 Progress: {total_requests_sent}/{max_requests} requests sent", level="user")
-                            else:
-                                if output_callback:
-                                    output_callback("❌ No connect button found", level="user")
+                                        output_callback("📌 Saved for later", level="user")
+                                    processed_count += 1
+                                    break
+                                else:
+                                    if output_callback:
+                                        output_callback("⚠ Invalid option. Choose [y/n/l]", level="user")
+
+                            dwell()
                             break
-                        elif decision == "n":
-                            skipped_profiles.add(name)
+
+                        except StaleElementReferenceException:
                             if output_callback:
-                                output_callback("⏭ Skipped", level="user")
-                            driver.execute_script(
-                                "arguments[0].style.border='2px solid gray';", card
-                            )
-                            processed_count += 1
-                            break
-                        elif decision == "l":
-                            saved_for_later.add(name)
+                                output_callback("⚠ Stale element, retrying...", level="info")
+                            cached_info = None
+                            cached_connect_button = None
+                            retries -= 1
+                            time.sleep(1)
+                            continue
+                        except Exception as e:
                             if output_callback:
-                                output_callback("📌 Saved for later", level="user")
-                            processed_count += 1
+                                output_callback(f"❌ Error processing profile: {str(e)}", level="user")
                             break
-                        else:
-                            if output_callback:
-                                output_callback("⚠ Invalid option. Choose [y/n/l]", level="user")
+                    if retries == 0:
+                        if output_callback:
+                            output_callback("❌ Failed to process profile after retries", level="user")
+                        continue
 
-                    time.sleep(random.uniform(1, 2))
-                    break
+            if total_requests_sent >= max_requests:
+                break
+            if not load_more_profiles(loader, max_requests - total_requests_sent, output_callback, offered):
+                if found_profiles and output_callback:
+                    output_callback("⚠ No more profiles to load", level="user")
+                break
+    finally:
+        loader.stop()
 
-                except StaleElementReferenceException:
-                    if output_callback:
-                        output_callback("⚠ Stale element, retrying...", level="info")
-                    retries -= 1
-                    time.sleep(1)
-                    continue
-                except Exception as e:
-                    if output_callback:
-                        output_callback(f"❌ Error processing profile: {str(e)}", level="user")
-                    break
-            if retries == 0:
-                if output_callback:
-                    output_callback("❌ Failed to process profile after retries", level="user")
-                continue
-    
+    if not found_profiles:
+        if output_callback:
+            output_callback("❌ No profiles found to process", level="user")
+        return processed_count
+
+    contact_store.flush()
     return processed_count
\ No newline at end of file
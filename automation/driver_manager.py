@@ -0,0 +1,232 @@
+import os
+import sys
+import json
+import time
+import signal
+import logging
+import subprocess
+from selenium.common.exceptions import WebDriverException
+
+from config.config import DRIVER_PROCESS_EXIT_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+# Resolved chromedriver path, keyed by the installed Chrome version
+DRIVER_CACHE_FILE = os.path.join("config", "driver_cache.json")
+# Processes started by this app, so leftovers from a crash can be cleaned up
+DRIVER_PID_FILE = os.path.join("logs", "driver_pids.json")
+
+CHROME_VERSION_COMMANDS = [
+    ["google-chrome", "--version"],
+    ["google-chrome-stable", "--version"],
+    ["chromium", "--version"],
+    ["chromium-browser", "--version"],
+    ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"],
+]
+
+
+def _load_json(path, default):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return default
+
+
+def _save_json(path, data):
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=4)
+    os.replace(tmp_path, path)
+
+
+# -------------------------------------------------------------------
+# Driver resolution cache
+# -------------------------------------------------------------------
+def get_chrome_version():
+    """
+    Return the installed Chrome version (e.g. "124.0.6367.91"), or None if it
+    cannot be determined cheaply.
+    """
+    if os.name == "nt":
+        try:
+            import winreg
+            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon")
+            version, _ = winreg.QueryValueEx(key, "version")
+            return version
+        except OSError:
+            return None
+
+    for command in CHROME_VERSION_COMMANDS:
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, timeout=5).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        for token in output.split():
+            if token[:1].isdigit() and "." in token:
+                return token
+    return None
+
+
+def resolve_driver_path():
+    """
+    Return the chromedriver path for the installed Chrome.
+
+    The path resolved by ChromeDriverManager is cached in DRIVER_CACHE_FILE
+    together with the Chrome version. As long as Chrome has not been updated
+    and the binary still exists, the cached path is reused without any
+    version probing or downloads.
+    """
+    chrome_version = get_chrome_version()
+    cache = _load_json(DRIVER_CACHE_FILE, {})
+
+    cached_path = cache.get("driver_path")
+    if (chrome_version and cache.get("chrome_version") == chrome_version
+            and cached_path and os.path.exists(cached_path)):
+        logger.info(f"Using cached chromedriver for Chrome {chrome_version}")
+        return cached_path
+
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    logger.info("Resolving chromedriver with ChromeDriverManager...")
+    driver_path = ChromeDriverManager().install()
+    if chrome_version:
+        _save_json(DRIVER_CACHE_FILE, {
+            "chrome_version": chrome_version,
+            "driver_path": driver_path,
+            "resolved_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        })
+    return driver_path
+
+
+def clear_driver_cache():
+    """Forget the cached chromedriver path, e.g. after it failed to start."""
+    if os.path.exists(DRIVER_CACHE_FILE):
+        os.remove(DRIVER_CACHE_FILE)
+
+
+# -------------------------------------------------------------------
+# Targeted process cleanup
+# -------------------------------------------------------------------
+def get_driver_pids(driver):
+    """
+    Return the PIDs of the chromedriver service and the Chrome processes it
+    launched for ``driver``.
+    """
+    pids = set()
+    process = getattr(getattr(driver, "service", None), "process", None)
+    if process is not None:
+        pids.add(process.pid)
+    try:
+        info = driver.execute_cdp_cmd("SystemInfo.getProcessInfo", {})
+        pids.update(entry["id"] for entry in info.get("processInfo", []) if entry.get("id"))
+    except (WebDriverException, KeyError, TypeError):
+        pass
+    return sorted(pids)
+
+
+def register_driver(driver):
+    """
+    Record the processes of a freshly started driver in DRIVER_PID_FILE.
+
+    The PIDs are merged into the existing record so the processes of an
+    earlier driver (e.g. before a reconnect) are still cleaned up if they
+    are left behind; only PIDs that have exited are dropped.
+
+    Returns:
+        list: PIDs of ``driver``
+    """
+    pids = get_driver_pids(driver)
+    record = _load_json(DRIVER_PID_FILE, {})
+    known = {pid for pid in record.get("pids", []) if _is_running(pid)}
+    _save_json(DRIVER_PID_FILE, {"owner": os.getpid(), "pids": sorted(known.union(pids))})
+    return pids
+
+
+def _is_running(pid):
+    if os.name == "nt":
+        result = subprocess.run(
+            ["tasklist", "/FI", f"PID eq {pid}", "/NH"], capture_output=True, text=True
+        )
+        return str(pid) in result.stdout
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Exists but belongs to someone else, so it is not ours to kill
+        return False
+    return True
+
+
+def _is_chrome_process(pid):
+    """Guard against PID reuse: only touch processes that still look like Chrome."""
+    if os.name == "nt" or sys.platform == "darwin":
+        return True
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            cmdline = f.read().decode(errors="ignore").lower()
+    except OSError:
+        return False
+    return "chrome" in cmdline or "chromium" in cmdline
+
+
+def _terminate(pid):
+    if os.name == "nt":
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(pid)], capture_output=True)
+    else:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+
+def cleanup_stale_processes(timeout=DRIVER_PROCESS_EXIT_TIMEOUT):
+    """
+    Terminate Chrome/chromedriver processes left behind by a previous run of
+    this app, as recorded in DRIVER_PID_FILE. Other Chrome windows are left
+    alone. Waits until the processes have exited rather than sleeping for a
+    fixed time.
+
+    Returns:
+        int: Number of processes that were terminated
+    """
+    record = _load_json(DRIVER_PID_FILE, {})
+    owner = record.get("owner")
+    if owner == os.getpid() or (owner and _is_running(owner)):
+        # Drivers of this process are closed with quit(); a still-running
+        # owner is another live instance of the app
+        return 0
+
+    pids = [
+        pid for pid in record.get("pids", [])
+        if _is_running(pid) and _is_chrome_process(pid)
+    ]
+    if not pids:
+        if os.path.exists(DRIVER_PID_FILE):
+            os.remove(DRIVER_PID_FILE)
+        return 0
+
+    for pid in pids:
+        _terminate(pid)
+
+    deadline = time.monotonic() + timeout
+    remaining = pids
+    while remaining and time.monotonic() < deadline:
+        time.sleep(0.05)
+        remaining = [pid for pid in remaining if _is_running(pid)]
+
+    if remaining and os.name != "nt":
+        for pid in remaining:
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                pass
+
+    os.remove(DRIVER_PID_FILE)
+    logger.info(f"Cleaned up {len(pids)} leftover Chrome processes from a previous run")
+    return len(pids)
+
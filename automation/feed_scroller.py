@@ -5,57 +5,132 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import time
-import re
+import json
 import hashlib
 import random
+from itertools import islice
+from automation.waits import wait_for_element_stable, wait_for_network_idle, dwell
+from automation.incremental_loader import IncrementalLoader
+from automation.selector_registry import get_selector_registry
+from automation.lean_mode import lean_mode
+from config.config import LEAN_MODE_TASKS
+from utils import tracing
 
-def scroll_slowly(driver, log_callback, max_posts):
-    log_callback("Scrolling to load posts...", level="info")
-    last_height = driver.execute_script("return document.body.scrollHeight")
-    attempts = 0
-    scroll_attempts = 0
-    
-    while scroll_attempts < 15:
-        posts = driver.find_elements(By.XPATH, "//div[contains(@class, 'feed-shared-update-v2')]")
-        current_count = len(posts)
-        log_callback(f"Found {current_count} posts so far...", level="debug")
-
-        if current_count >= max_posts * 2:
-            break
-
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(random.uniform(1, 2))  # Reduced delay
-
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        if new_height == last_height:
-            scroll_attempts += 1
-            log_callback(f"No new content loaded, attempt {scroll_attempts}/15", level="debug")
-            if scroll_attempts >= 3:
-                log_callback("No more new posts loading.", level="debug")
-                break
-        else:
-            scroll_attempts = 0
-            
-        last_height = new_height
-        attempts += 1
-        if attempts > 20:
-            log_callback("Max scroll attempts reached.", level="warn")
-            break
+# Author name candidates, ranked by the selector registry
+selectors = get_selector_registry()
+POST_AUTHOR = selectors.register("feed.author", [
+    (By.XPATH, ".//span[contains(@class, 'update-components-actor__name')]//span[@dir='ltr']//span[@aria-hidden='true']"),
+    (By.XPATH, ".//span[contains(@class, 'update-components-actor__title')]//span[@dir='ltr']//span[@aria-hidden='true']"),
+    (By.XPATH, ".//a[contains(@class, 'update-components-actor__meta')]//span"),
+])
+
+# Extracts id, permalink, author and cleaned text of one feed post in the
+# page. Called with the author XPaths, best first, it returns the per-post
+# function; ``key`` identifies the post for the incremental loader.
+POST_EXTRACT_FUNCTION = """(authorSelectors) => (post) => {
+    const xpathFirst = (expr, ctx) => document.evaluate(expr, ctx, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    const collectText = (nodes) => Array.from(nodes)
+        .map((el) => (el.textContent || '').trim())
+        .filter((text) => text.length > 3)
+        .map((text) => text.replace(/\\s+/g, ' '))
+        .join(' ');
+
+    const link = post.querySelector("a.app-aware-link[href*='/feed/update/']");
+    let author = '';
+    let authorSelector = -1;
+    for (let i = 0; i < authorSelectors.length && !author; i++) {
+        const el = xpathFirst(authorSelectors[i], post);
+        author = el ? (el.innerText || el.textContent || '').trim() : '';
+        if (author) authorSelector = i;
+    }
+    const textBlock = post.querySelector('div.update-components-text, div[class*="update-components-text"]');
+    let text = textBlock ? collectText(textBlock.querySelectorAll('span[dir="ltr"]:not([aria-hidden="true"])')) : '';
+    let textSource = 'text';
+    if (text.length < 10) {
+        text = collectText(post.querySelectorAll('span[dir="ltr"]:not([aria-hidden="true"])'));
+        textSource = 'fallback';
+    }
+    const id = post.getAttribute('data-id') || post.getAttribute('data-urn') || '';
+    const permalink = link ? link.href.split('?')[0] : '';
+    return {
+        key: id || permalink || author + text,
+        id: id,
+        permalink: permalink,
+        author: author,
+        author_selector: authorSelector,
+        text: text,
+        text_source: textSource,
+        has_text: !!textBlock,
+        has_images: !!post.querySelector('img.ivm-view-attr__img, img[class*="ivm-view-attr__img"]'),
+    };
+}"""
+
+# Snapshots the post passed as arguments[0], or every feed post on the page
+# when it is null. The author XPaths are passed as arguments[1].
+POST_SNAPSHOT_SCRIPT = """
+const extract = (%s)(arguments[1]);
+const posts = arguments[0] ? [arguments[0]] : Array.from(document.querySelectorAll('div.feed-shared-update-v2'));
+return posts.map((post) => {
+    const snapshot = extract(post);
+    snapshot.element = post;
+    return snapshot;
+});
+""" % POST_EXTRACT_FUNCTION
+
+POST_SELECTOR = "div.feed-shared-update-v2"
+
+
+def _finish_snapshot(snapshot, author_candidates):
+    """Record which author selector matched and fill in the defaults of a raw snapshot."""
+    selectors.record_index(POST_AUTHOR, author_candidates, snapshot["author_selector"])
+    snapshot["text"] = snapshot["text"] or "No text found"
+    snapshot["author"] = snapshot["author"] or "Unknown Author"
+    if not snapshot["id"]:
+        snapshot["id"] = snapshot["permalink"] or hashlib.md5(
+            (snapshot["author"] + snapshot["text"]).encode('utf-8')
+        ).hexdigest()
+    return snapshot
+
+
+def snapshot_posts(driver, post=None):
+    """
+    Snapshot feed posts with a single execute_script call.
 
-    final_count = len(driver.find_elements(By.XPATH, "//div[contains(@class, 'feed-shared-update-v2')]"))
-    log_callback(f"Finished scrolling. Found {final_count} posts.", level="info")
-    return final_count
+    Without ``post``, returns every feed post on the page; with ``post``,
+    returns a one-item list for that element.
+
+    Each snapshot is a dict with element, id, permalink, author, text,
+    has_text and has_images. ``id`` falls back to the permalink and then to
+    a hash of the author and text when the post has no data-id/data-urn.
+    """
+    author_candidates = selectors.ordered(POST_AUTHOR)
+    snapshots = driver.execute_script(
+        POST_SNAPSHOT_SCRIPT, post, [value for _, value in author_candidates]
+    ) or []
+    return [_finish_snapshot(snapshot, author_candidates) for snapshot in snapshots]
+
+
+def create_post_loader(driver):
+    """
+    Return an IncrementalLoader whose items are raw post snapshots, and the
+    author candidates it extracts with (for _finish_snapshot).
+    """
+    author_candidates = selectors.ordered(POST_AUTHOR)
+    extract_script = "(%s)(%s)" % (
+        POST_EXTRACT_FUNCTION, json.dumps([value for _, value in author_candidates])
+    )
+    return IncrementalLoader(driver, "feed_posts", POST_SELECTOR, extract_script), author_candidates
 
 def scroll_to_element(driver, element):
     driver.execute_script("arguments[0].scrollIntoView({block: 'center', inline: 'center'});", element)
-    time.sleep(random.uniform(0.5, 1))  # Reduced delay
+    wait_for_element_stable(driver, element)
 
-def summarize_post(post_text, post_index):
-    if not post_text or post_text.strip() == "No text found":
-        return "There is no LinkedIn post provided to summarize. The provided text indicates no content was found. Therefore, no summary can be created."
-    
-    prompt = f"""
-    Summarize the following LinkedIn post (Post {post_index} at {time.time()}) in 2-3 sentences (max 100 words):
+NO_TEXT_SUMMARY = "There is no LinkedIn post provided to summarize. The provided text indicates no content was found. Therefore, no summary can be created."
+
+def build_summary_prompt(post_text):
+    return f"""
+    Summarize the following LinkedIn post in 2-3 sentences (max 100 words):
     '{post_text}'
     
     Rules:
@@ -63,17 +138,51 @@ def summarize_post(post_text, post_index):
     2. Keep it concise, clear, and professional.
     3. Avoid adding external information or opinions.
     """
+
+def summarize_post(post_text, post_index):
+    if not post_text or post_text.strip() == "No text found":
+        return NO_TEXT_SUMMARY
+    
     try:
         from ai.ai_generator import generate_text
-        summary = generate_text(prompt)
+        summary = generate_text(build_summary_prompt(post_text))
         return summary.strip('"\'') if summary else "Summary not available."
     except Exception as e:
         return f"Error summarizing post: {e}"
 
+def summarize_posts(snapshots):
+    """
+    Summarize several posts concurrently.
+
+    Args:
+        snapshots: Post snapshots from snapshot_posts
+
+    Returns:
+        dict: Summaries keyed by post id
+    """
+    summaries = {}
+    to_generate = []
+    for snapshot in snapshots:
+        if not snapshot["text"] or snapshot["text"].strip() == "No text found":
+            summaries[snapshot["id"]] = NO_TEXT_SUMMARY
+        else:
+            to_generate.append(snapshot)
+    if not to_generate:
+        return summaries
+
+    try:
+        from ai.ai_generator import generate_many
+        results = generate_many([build_summary_prompt(snapshot["text"]) for snapshot in to_generate])
+    except Exception as e:
+        results = [f"Error summarizing post: {e}"] * len(to_generate)
+    for snapshot, summary in zip(to_generate, results):
+        summaries[snapshot["id"]] = summary.strip('"\'') if summary else "Summary not available."
+    return summaries
+
 def perform_action(driver, post, action, custom_comment, index, log_callback):
     try:
         scroll_to_element(driver, post)
-        time.sleep(random.uniform(1, 2))  # Reduced delay
+        dwell()
         
         if action == "like":
             try:
@@ -81,7 +190,7 @@ def perform_action(driver, post, action, custom_comment, index, log_callback):
                 scroll_to_element(driver, like_button)
                 like_button.click()
                 log_callback(f"Liked post {index}", level="user")
-                time.sleep(random.uniform(1, 2))  # Reduced delay
+                wait_for_network_idle(driver)
             except NoSuchElementException:
                 log_callback(f"Like button not found for post {index}", level="debug")
                 return False
@@ -89,39 +198,33 @@ def perform_action(driver, post, action, custom_comment, index, log_callback):
         elif action == "comment":
             try:
                 scroll_to_element(driver, post)
-                time.sleep(random.uniform(1, 2))  # Reduced delay
                 
                 comment_button = post.find_element(By.XPATH, ".//button[contains(@class, 'social-actions-button') and contains(@class, 'comment-button')]")
                 scroll_to_element(driver, comment_button)
-                time.sleep(random.uniform(0.5, 1))  # Reduced delay
                 comment_button.click()
                 log_callback(f"Clicked comment button for post {index}", level="debug")
                 
-                time.sleep(random.uniform(1, 2))  # Reduced delay
-                
                 comment_box = WebDriverWait(driver, 10).until(
                     EC.element_to_be_clickable((By.XPATH, ".//div[contains(@class, 'comments-comment-box')]//div[contains(@class, 'ql-editor') and @contenteditable='true']"))
                 )
                 
                 comment_box.click()
-                time.sleep(random.uniform(0.5, 1))  # Reduced delay
                 
                 comment_box.clear()
                 comment_text = custom_comment or "Great post!"
                 
                 for char in comment_text:
                     comment_box.send_keys(char)
-                    time.sleep(random.uniform(0.05, 0.1))  # Reduced delay
+                    time.sleep(random.uniform(0.05, 0.1))  # Per-keystroke typing cadence, deliberately fixed
                 
                 log_callback(f"Typed comment for post {index}: {comment_text}", level="debug")
-                time.sleep(random.uniform(1, 2))  # Reduced delay
+                dwell()
                 
                 try:
                     post_button = WebDriverWait(driver, 5).until(
                         EC.element_to_be_clickable((By.XPATH, ".//button[contains(@class, 'comments-comment-box__submit-button') and not(@disabled)]"))
                     )
                     scroll_to_element(driver, post_button)
-                    time.sleep(random.uniform(0.5, 1))  # Reduced delay
                     post_button.click()
                     log_callback(f"Clicked Post button for post {index}", level="user")
                 except (NoSuchElementException, TimeoutException):
@@ -130,7 +233,7 @@ def perform_action(driver, post, action, custom_comment, index, log_callback):
                     log_callback(f"Sent ENTER key for post {index}", level="debug")
                 
                 # Wait and check for LinkedIn error message
-                time.sleep(random.uniform(2, 3))  # Reduced delay
+                wait_for_network_idle(driver)
                 try:
                     error_message = driver.find_element(By.XPATH, "//*[contains(text(), 'comment could not be created') or contains(text(), 'error')]")
                     log_callback(f"LinkedIn error detected: {error_message.text}", level="user")
@@ -139,7 +242,6 @@ def perform_action(driver, post, action, custom_comment, index, log_callback):
                     pass
                 
                 # Verify comment was actually posted
-                time.sleep(random.uniform(2, 3))  # Reduced delay
                 try:
                     WebDriverWait(driver, 5).until(
                         EC.presence_of_element_located((By.XPATH, f".//span[contains(@class, 'comments-comment-item__comment-content') and contains(text(), '{comment_text}')]"))
@@ -149,7 +251,7 @@ def perform_action(driver, post, action, custom_comment, index, log_callback):
                     log_callback(f"Comment not found on page for post {index}, assuming failure", level="user")
                     return False
                 
-                time.sleep(random.uniform(2, 3))  # Reduced delay
+                dwell()
                 log_callback(f"Commented on post {index}: {comment_text}", level="user")
                 return True
             
@@ -162,121 +264,38 @@ def perform_action(driver, post, action, custom_comment, index, log_callback):
         log_callback(f"Error performing action on post {index}: {str(e)}", level="user")
         return False
 
-def process_post(driver, post, index, log_callback, get_action_callback):
+@tracing.traced("process_post", "task")
+def process_post(driver, post, index, log_callback, get_action_callback, snapshot=None, summary=None):
     try:
         scroll_to_element(driver, post)
-        time.sleep(random.uniform(1, 2))  # Reduced delay
-        
-        post_id = "unknown"
-        post_content_hash = None
+        dwell()
 
-        try:
-            post_id = driver.execute_script("return arguments[0].getAttribute('data-id');", post) or \
-                      driver.execute_script("return arguments[0].getAttribute('data-urn');", post) or "unknown"
-            log_callback(f"Post {index} ID (data-id/data-urn): {post_id}", level="debug")
-        except Exception as e:
-            log_callback(f"Error extracting data-id/data-urn for post {index}: {str(e)}", level="debug")
+        if snapshot is None:
+            snapshots = snapshot_posts(driver, post)
+            if not snapshots:
+                raise Exception("Could not read post contents")
+            snapshot = snapshots[0]
 
-        if post_id == "unknown":
-            try:
-                post_link = post.find_element(
-                    By.XPATH,
-                    ".//a[contains(@class, 'app-aware-link') and contains(@href, '/feed/update/')]"
-                )
-                post_url = post_link.get_attribute("href").split('?')[0]
-                post_id = post_url
-                log_callback(f"Post {index} ID (URL): {post_id}", level="debug")
-            except NoSuchElementException:
-                log_callback(f"No post URL found for post {index}", level="debug")
-
-        if post_id == "unknown":
-            try:
-                post_html = driver.execute_script("return arguments[0].outerHTML;", post)
-                post_id = hashlib.md5(post_html.encode('utf-8')).hexdigest()
-                log_callback(f"Post {index} ID (HTML hash fallback): {post_id[:10]}...", level="debug")
-            except Exception as e:
-                log_callback(f"Failed to extract HTML hash for post {index}: {str(e)}", level="error")
-
-        author_name = "Unknown Author"
-        try:
-            author_element = post.find_element(
-                By.XPATH,
-                ".//span[contains(@class, 'update-components-actor__name')]//span[@dir='ltr']//span[@aria-hidden='true']"
-            )
-            author_name = author_element.text.strip()
-            log_callback(f"Author of post {index}: {author_name}", level="debug")
-        except NoSuchElementException:
-            try:
-                author_element = post.find_element(
-                    By.XPATH,
-                    ".//span[contains(@class, 'update-components-actor__title')]//span[@dir='ltr']//span[@aria-hidden='true']"
-                )
-                author_name = author_element.text.strip()
-                log_callback(f"Author of post {index} (fallback 1): {author_name}", level="debug")
-            except NoSuchElementException:
-                try:
-                    author_element = post.find_element(
-                        By.XPATH,
-                        ".//a[contains(@class, 'update-components-actor__meta')]//span"
-                    )
-                    author_name = author_element.text.strip()
-                    log_callback(f"Author of post {index} (fallback 2): {author_name}", level="debug")
-                except NoSuchElementException:
-                    log_callback(f"Author name not found for post {index}", level="debug")
-
-        try:
-            WebDriverWait(driver, 3).until(
-                EC.presence_of_element_located((By.XPATH, ".//img[contains(@class, 'ivm-view-attr__img')]"))
-            )
+        post_id = snapshot["id"]
+        author_name = snapshot["author"]
+        post_text = snapshot["text"]
+        log_callback(f"Post {index} ID: {post_id}", level="debug")
+        log_callback(f"Author of post {index}: {author_name}", level="debug")
+        if snapshot["has_images"]:
             log_callback(f"Images loaded for post {index}", level="debug")
-        except TimeoutException:
-            log_callback(f"No images found for post {index}", level="debug")
-
-        post_text = "No text found"
-        try:
-            time.sleep(random.uniform(0.5, 1))  # Reduced delay
-            
-            post_text_elements = post.find_elements(
-                By.XPATH,
-                ".//div[contains(@class, 'update-components-text')]//span[@dir='ltr' and not(@aria-hidden='true')]"
-            )
-            
-            if post_text_elements:
-                raw_texts = []
-                for elem in post_text_elements:
-                    text = driver.execute_script("return arguments[0].textContent;", elem).strip()
-                    if text and len(text) > 3:
-                        raw_texts.append(text)
-                
-                if raw_texts:
-                    post_text = " ".join([re.sub(r'\s+', ' ', text) for text in raw_texts if text.strip()])
-                    log_callback(f"Extracted text for post {index}: {post_text[:100]}...", level="debug")
-            
-            if post_text == "No text found" or len(post_text) < 10:
-                post_text_elements = post.find_elements(
-                    By.XPATH,
-                    ".//span[@dir='ltr' and not(@aria-hidden='true')]"
-                )
-                raw_texts = []
-                for elem in post_text_elements:
-                    text = driver.execute_script("return arguments[0].textContent;", elem).strip()
-                    if text and len(text) > 3:
-                        raw_texts.append(text)
-                
-                if raw_texts:
-                    post_text = " ".join([re.sub(r'\s+', ' ', text) for text in raw_texts if text.strip()])
-                    log_callback(f"Fallback text for post {index}: {post_text[:100]}...", level="debug")
-                
-        except Exception as e:
-            log_callback(f"Error extracting text for post {index}: {str(e)}", level="debug")
+        if post_text != "No text found":
+            label = "Extracted" if snapshot["text_source"] == "text" else "Fallback"
+            log_callback(f"{label} text for post {index}: {post_text[:100]}...", level="debug")
 
         post_content_hash = hashlib.md5(post_text.encode('utf-8')).hexdigest()
         log_callback(f"Post {index} content hash: {post_content_hash}", level="debug")
 
-        summary = summarize_post(post_text, index)
+        if summary is None:
+            summary = summarize_post(post_text, index)
         log_callback(f"Summary for post {index}: {summary[:100]}...", level="user")
 
-        action, custom_comment = get_action_callback(summary, index, author_name)
+        with tracing.span("decision", "decision"):
+            action, custom_comment = get_action_callback(summary, index, author_name)
         log_callback(f"Selected action for post {index}: {action}", level="user")
 
         success = True
@@ -289,89 +308,103 @@ def process_post(driver, post, index, log_callback, get_action_callback):
         log_callback(f"Error processing post {index}: {str(e)}", level="user")
         return False, None, None
     
+@tracing.traced_run("engage_feed")
 def engage_feed(driver, max_posts=5, get_action_callback=None, log_callback=lambda msg, level: print(msg)):
+    # Loading the feed only reads it; likes and comments happen with lean mode off
+    lean = "read_feed" in LEAN_MODE_TASKS
     try:
-        driver.get("https://www.linkedin.com/feed/") 
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'feed-shared-update-v2')]"))
-        )
+        with lean_mode(driver, enabled=lean, log_callback=log_callback):
+            driver.get("https://www.linkedin.com/feed/")
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'feed-shared-update-v2')]"))
+            )
 
         processed_posts = 0
         processed_post_ids = set()
         processed_content_hashes = set()
+        # Snapshots by post id, in feed order; each post is scraped only once
+        snapshot_cache = {}
+        # Summaries by post id, generated ahead of time in concurrent batches
+        summaries = {}
+        scrolled_for_more = False
+
+        # Posts are snapshotted in the page as they load; each pass only
+        # drains the ones added since the last pass
+        loader, author_candidates = create_post_loader(driver)
+        try:
+            # Initial scroll to load posts; stops once twice the wanted posts are on the page
+            with lean_mode(driver, enabled=lean, log_callback=log_callback):
+                loader.load(max_posts * 2, log_callback=log_callback)
+            finished = 0
 
-        # Initial scroll to load posts
-        scroll_slowly(driver, log_callback, max_posts)
+            while processed_posts < max_posts:
+                loader.drain()
+                for snapshot in islice(loader.items.values(), finished, None):
+                    snapshot_cache.setdefault(_finish_snapshot(snapshot, author_candidates)["id"], snapshot)
+                finished = len(loader.items)
 
-        while processed_posts < max_posts:
-            post_containers = driver.find_elements(
-                By.XPATH,
-                "//div[contains(@class, 'feed-shared-update-v2') and .//div[contains(@class, 'update-components-text')]]"
-            )
-            
-            log_callback(f"Found {len(post_containers)} total posts in feed", level="info")
-            
-            if not post_containers:
-                log_callback("No posts found in feed", level="user")
-                break
-
-            # Process each post in the list
-            found_new_post = False
-            for idx, post in enumerate(post_containers):
-                # Generate a unique identifier for this post
-                try:
-                    post_id = driver.execute_script("return arguments[0].getAttribute('data-id') || arguments[0].getAttribute('data-urn');", post)
-                    if not post_id:
-                        temp_content = driver.execute_script("return arguments[0].textContent;", post)[:100]
-                        post_id = hashlib.md5((temp_content + str(idx)).encode('utf-8')).hexdigest()
-                except:
-                    post_id = f"post_{idx}_{processed_posts}"
-                
-                # Skip if we've already processed this post
-                if post_id in processed_post_ids:
-                    log_callback(f"Skipping already processed post at index {idx} (ID: {post_id})", level="debug")
+                log_callback(f"Found {len(snapshot_cache)} total posts in feed", level="info")
+
+                if not snapshot_cache:
+                    log_callback("No posts found in feed", level="user")
+                    break
+
+                pending = [
+                    snapshot for post_id, snapshot in snapshot_cache.items()
+                    if snapshot["has_text"] and post_id not in processed_post_ids
+                ]
+
+                if not pending:
+                    if scrolled_for_more:
+                        log_callback("No new posts found after scrolling, stopping...", level="user")
+                        break
+                    log_callback("Reached end of loaded posts, scrolling to load more...", level="info")
+                    with lean_mode(driver, enabled=lean, log_callback=log_callback):
+                        loader.load(len(loader.items) + max_posts - processed_posts, log_callback=log_callback)
+                    scrolled_for_more = True
+                    continue
+                scrolled_for_more = False
+
+                snapshot = pending[0]
+                processed_post_ids.add(snapshot["id"])
+
+                # Skip reposts of content we have already handled before asking the user
+                snapshot_hash = hashlib.md5(snapshot["text"].encode('utf-8')).hexdigest()
+                if snapshot_hash in processed_content_hashes:
+                    log_callback(f"Skipping duplicate post (ID: {snapshot['id']}, Hash: {snapshot_hash})", level="debug")
                     continue
 
+                # Summarize the next batch of posts concurrently instead of one at a time
+                if snapshot["id"] not in summaries:
+                    batch = [s for s in pending[:max_posts - processed_posts] if s["id"] not in summaries]
+                    log_callback(f"Summarizing {len(batch)} posts...", level="debug")
+                    summaries.update(summarize_posts(batch))
+
                 # Process the post
                 success, extracted_post_id, post_content_hash = process_post(
-                    driver, post, processed_posts + 1, log_callback, get_action_callback
+                    driver, snapshot["element"], processed_posts + 1, log_callback, get_action_callback,
+                    snapshot, summaries.get(snapshot["id"])
                 )
 
                 if not extracted_post_id or not post_content_hash:
-                    log_callback(f"Skipping post at index {idx} due to processing error", level="debug")
+                    log_callback(f"Skipping post {snapshot['id']} due to processing error", level="debug")
                     continue
 
-                # Check for duplicates using extracted IDs
-                if extracted_post_id in processed_post_ids or post_content_hash in processed_content_hashes:
-                    log_callback(f"Skipping duplicate post at index {idx} (ID: {extracted_post_id}, Hash: {post_content_hash})", level="debug")
-                    continue
-                
-                processed_post_ids.add(extracted_post_id)
-                processed_post_ids.add(post_id)  # Add both IDs to avoid reprocessing
                 processed_content_hashes.add(post_content_hash)
                 processed_posts += 1
-                found_new_post = True
-                
+
                 log_callback(f"Processed {processed_posts}/{max_posts} posts", level="user")
-                
-                # Scroll to the next post or load more
-                if idx + 1 < len(post_containers):
-                    scroll_to_element(driver, post_containers[idx + 1])
-                else:
-                    log_callback("Reached end of loaded posts, scrolling to load more...", level="info")
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(random.uniform(1, 2))  # Reduced delay
-                    scroll_slowly(driver, log_callback, max_posts - processed_posts)
-                
-                time.sleep(random.uniform(2, 3))  # Reduced delay between posts
-                break  # Process one post at a time to ensure scrolling
 
-            if not found_new_post:
-                log_callback("No new posts found after scrolling, stopping...", level="user")
-                break
+                # Scroll to the next post
+                if len(pending) > 1:
+                    scroll_to_element(driver, pending[1]["element"])
+
+                dwell()  # Human-like pause between posts
 
-        log_callback(f"Completed processing {processed_posts} posts", level="user")
-        log_callback("✅ Feed interaction completed", level="user")
+            log_callback(f"Completed processing {processed_posts} posts", level="user")
+            log_callback("✅ Feed interaction completed", level="user")
+        finally:
+            loader.stop()
 
     except Exception as e:
         log_callback(f"Error in feed engagement: {str(e)}", level="user")
\ No newline at end of file
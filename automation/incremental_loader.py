@@ -0,0 +1,166 @@
+from selenium.common.exceptions import WebDriverException
+
+from config.config import LOADER_MAX_SCROLLS, LOADER_MAX_IDLE_SCROLLS
+from automation.waits import wait_for_network_idle
+
+# Installs one MutationObserver per loader name. Every element matching the
+# CSS selector, present now or added later, is pushed to a buffer once.
+# While the selector matches nothing in the page, the fallback XPaths are
+# evaluated over the whole document instead (on install and every drain).
+OBSERVER_SCRIPT = """
+const [name, selector, fallbackXpaths] = arguments;
+const loaders = window.__automatorLoaders = window.__automatorLoaders || {};
+if (loaders[name]) return false;
+const loader = { buffer: [], seen: new WeakSet() };
+const add = (el) => {
+    if (!loader.seen.has(el)) {
+        loader.seen.add(el);
+        loader.buffer.push(el);
+    }
+};
+loader.fallback = () => {
+    if (!fallbackXpaths.length || document.querySelector(selector)) return;
+    for (const xpath of fallbackXpaths) {
+        const result = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (let i = 0; i < result.snapshotLength; i++) add(result.snapshotItem(i));
+    }
+};
+document.querySelectorAll(selector).forEach(add);
+loader.fallback();
+loader.observer = new MutationObserver((mutations) => {
+    for (const mutation of mutations) {
+        for (const node of mutation.addedNodes) {
+            if (node.nodeType !== Node.ELEMENT_NODE) continue;
+            if (node.matches(selector)) add(node);
+            node.querySelectorAll(selector).forEach(add);
+        }
+    }
+});
+loader.observer.observe(document.body, { childList: true, subtree: true });
+loaders[name] = loader;
+return true;
+"""
+
+# Empties the buffer and returns the extracted fields of each buffered
+# element. %s is replaced by the loader's extract function.
+DRAIN_SCRIPT_TEMPLATE = """
+const loader = (window.__automatorLoaders || {})[arguments[0]];
+if (!loader) return null;
+loader.fallback();
+const extract = %s;
+return loader.buffer.splice(0).filter((el) => el.isConnected).map((el) => {
+    const item = extract(el) || {};
+    item.element = el;
+    return item;
+});
+"""
+
+STOP_SCRIPT = """
+const loaders = window.__automatorLoaders || {};
+const loader = loaders[arguments[0]];
+if (loader) {
+    loader.observer.disconnect();
+    delete loaders[arguments[0]];
+}
+"""
+
+SCROLL_TO_BOTTOM_SCRIPT = "window.scrollTo(0, document.body.scrollHeight);"
+
+
+class IncrementalLoader:
+    """
+    Loads list items (cards, posts, search results) on an infinite-scroll page.
+
+    A MutationObserver in the page buffers every new element matching
+    ``selector``. Each pass Python drains only the new elements in one
+    round trip and stores them in ``items``, a dict keyed by the ``key``
+    field returned by ``extract_script``. Scrolling stops as soon as the
+    target is reached or the page stops producing new items.
+
+    Args:
+        driver: Selenium WebDriver instance
+        name: Name of the loader in the page (one observer per name)
+        selector: CSS selector of the items
+        extract_script: JavaScript function expression ``(el) => ({key: ..., ...})``
+            run in the page for each new item
+        fallback_xpaths: Optional XPaths of the items, used while ``selector``
+            matches nothing (e.g. after a class rename)
+    """
+
+    def __init__(self, driver, name, selector, extract_script, fallback_xpaths=None):
+        self.driver = driver
+        self.name = name
+        self.selector = selector
+        self.fallback_xpaths = list(fallback_xpaths or [])
+        self.drain_script = DRAIN_SCRIPT_TEMPLATE % extract_script
+        self.items = {}
+
+    def install(self):
+        self.driver.execute_script(OBSERVER_SCRIPT, self.name, self.selector, self.fallback_xpaths)
+
+    def drain(self):
+        """Collect the items added since the last drain. Returns the new ones."""
+        drained = self.driver.execute_script(self.drain_script, self.name)
+        if drained is None:
+            # The page was replaced and the observer with it
+            self.install()
+            drained = self.driver.execute_script(self.drain_script, self.name) or []
+
+        new_items = []
+        for item in drained:
+            key = item.get("key")
+            if key and key not in self.items:
+                self.items[key] = item
+                new_items.append(item)
+        return new_items
+
+    def load(self, target, accept=None, log_callback=None,
+             max_scrolls=LOADER_MAX_SCROLLS, max_idle_scrolls=LOADER_MAX_IDLE_SCROLLS):
+        """
+        Scroll until ``target`` accepted items are loaded.
+
+        Args:
+            target: Number of accepted items wanted
+            accept: Optional predicate; items it rejects are kept in ``items``
+                but do not count toward the target
+            log_callback: Optional callback(message, level)
+            max_scrolls: Maximum number of scrolls
+            max_idle_scrolls: Stop after this many scrolls in a row add nothing
+
+        Returns:
+            list: Accepted items in page order
+        """
+        self.install()
+        self.drain()
+        accepted = [item for item in self.items.values() if accept is None or accept(item)]
+        scrolls = 0
+        idle_scrolls = 0
+
+        while len(accepted) < target and scrolls < max_scrolls and idle_scrolls < max_idle_scrolls:
+            try:
+                self.driver.execute_script(SCROLL_TO_BOTTOM_SCRIPT)
+                wait_for_network_idle(self.driver)
+                new_items = self.drain()
+            except WebDriverException as e:
+                if log_callback:
+                    log_callback(f"Stopped loading more items: {e.__class__.__name__}", level="debug")
+                break
+            scrolls += 1
+            accepted.extend(item for item in new_items if accept is None or accept(item))
+            idle_scrolls = 0 if new_items else idle_scrolls + 1
+            if log_callback:
+                log_callback(f"Loaded {len(self.items)} items ({len(accepted)}/{target} wanted)", level="debug")
+
+        if log_callback:
+            if len(accepted) >= target:
+                log_callback(f"Loaded {len(accepted)} items after {scrolls} scrolls", level="info")
+            else:
+                log_callback(f"No more items loading; found {len(accepted)}/{target} after {scrolls} scrolls", level="info")
+        return accepted
+
+    def stop(self):
+        """Disconnect the observer in the page."""
+        try:
+            self.driver.execute_script(STOP_SCRIPT, self.name)
+        except WebDriverException:
+            pass
@@ -0,0 +1,240 @@
+import os
+import sys
+import json
+import math
+import time
+import random
+import datetime
+import threading
+
+import selenium
+
+from config.config import INSTRUMENT_MAX_SAMPLES, INSTRUMENT_REPORT_ROWS
+from utils import tracing
+
+# Define the stats location
+STATS_DIR = os.path.join("logs", "driver_stats")
+
+# Report labels of the WebDriver commands behind the common driver calls
+COMMAND_LABELS = {
+    "findElement": "find_element",
+    "findChildElement": "find_element",
+    "findElements": "find_elements",
+    "findChildElements": "find_elements",
+    "executeScript": "execute_script",
+    "w3cExecuteScript": "execute_script",
+    "executeAsyncScript": "execute_async_script",
+    "w3cExecuteScriptAsync": "execute_async_script",
+    "get": "get",
+    "clickElement": "click",
+}
+LOOKUP_LABELS = {"find_element", "find_elements"}
+
+# WebDriver commands that load a page are traced as navigation
+NAVIGATION_COMMANDS = {"get", "refresh", "goBack", "goForward"}
+
+_THIS_FILE = os.path.abspath(__file__)
+_SELENIUM_DIR = os.path.dirname(os.path.abspath(selenium.__file__))
+
+# Shared helpers that issue WebDriver calls for whoever called them. Their
+# calls are charged to the first caller outside them, e.g.
+# "feed_scroller.py:engage_feed:123 via waits.is_idle"
+_HELPER_MODULES = ("waits", "selector_registry", "incremental_loader")
+_HELPER_FILES = {
+    os.path.join(os.path.dirname(_THIS_FILE), f"{module}.py"): module for module in _HELPER_MODULES
+}
+
+
+def _call_site():
+    """
+    Return "file.py:function:line" of the first caller outside Selenium and
+    this module, with " via module.function" when it went through a helper.
+    """
+    frame = sys._getframe(2)
+    helper = None
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if filename != _THIS_FILE and not filename.startswith(_SELENIUM_DIR):
+            module = _HELPER_FILES.get(filename)
+            if module is None:
+                site = f"{os.path.basename(filename)}:{frame.f_code.co_name}:{frame.f_lineno}"
+                return f"{site} via {helper}" if helper else site
+            # The outermost helper frame is the helper the caller used
+            helper = f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return helper or "unknown"
+
+
+def _percentile(sorted_samples, percent):
+    index = max(0, math.ceil(percent / 100 * len(sorted_samples)) - 1)
+    return sorted_samples[index]
+
+
+class CallStats:
+    """
+    Per call site counts and latencies of WebDriver commands.
+
+    Counts, totals and maxima are exact; percentiles come from a reservoir
+    of at most ``max_samples`` latencies per (command, call site).
+    """
+
+    def __init__(self, max_samples=INSTRUMENT_MAX_SAMPLES):
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        # (command, site) -> [count, total seconds, max seconds, samples]
+        self._calls = {}
+
+    def add(self, command, site, seconds):
+        with self._lock:
+            entry = self._calls.get((command, site))
+            if entry is None:
+                entry = self._calls[(command, site)] = [0, 0.0, 0.0, []]
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+            samples = entry[3]
+            if len(samples) < self.max_samples:
+                samples.append(seconds)
+            else:
+                slot = random.randrange(entry[0])
+                if slot < self.max_samples:
+                    samples[slot] = seconds
+
+    def reset(self):
+        with self._lock:
+            self._calls.clear()
+
+    def count(self, commands=None):
+        """Number of recorded calls, optionally only of the given command labels."""
+        with self._lock:
+            return sum(
+                entry[0] for (command, _), entry in self._calls.items()
+                if commands is None or command in commands
+            )
+
+    def by_command(self):
+        """Return {command: count}."""
+        counts = {}
+        with self._lock:
+            for (command, _), entry in self._calls.items():
+                counts[command] = counts.get(command, 0) + entry[0]
+        return counts
+
+    def rows(self):
+        """Return one dict per (command, call site), most total time first."""
+        with self._lock:
+            calls = [(key, entry[0], entry[1], entry[2], sorted(entry[3])) for key, entry in self._calls.items()]
+        rows = []
+        for (command, site), count, total, longest, samples in calls:
+            rows.append({
+                "command": command,
+                "site": site,
+                "count": count,
+                "total_ms": total * 1000,
+                "p50_ms": _percentile(samples, 50) * 1000,
+                "p95_ms": _percentile(samples, 95) * 1000,
+                "max_ms": longest * 1000,
+            })
+        rows.sort(key=lambda row: -row["total_ms"])
+        return rows
+
+    def format(self, rows=INSTRUMENT_REPORT_ROWS):
+        """Return the stats as a printable table."""
+        all_rows = self.rows()
+        if not all_rows:
+            return "No WebDriver calls recorded."
+        total_calls = sum(row["count"] for row in all_rows)
+        total_ms = sum(row["total_ms"] for row in all_rows)
+        lines = [
+            f"{total_calls} WebDriver calls, {total_ms / 1000:.2f}s total",
+            f"{'command':<22}{'call site':<72}{'count':>7}{'total ms':>10}{'p50':>8}{'p95':>8}{'max':>8}",
+        ]
+        for row in all_rows[:rows]:
+            lines.append(
+                f"{row['command'][:21]:<22}{row['site'][-71:]:<72}{row['count']:>7}{row['total_ms']:>10.0f}"
+                f"{row['p50_ms']:>8.1f}{row['p95_ms']:>8.1f}{row['max_ms']:>8.1f}"
+            )
+        if len(all_rows) > rows:
+            lines.append(f"... {len(all_rows) - rows} more call sites")
+        return "\n".join(lines)
+
+
+def instrument_driver(driver, max_samples=INSTRUMENT_MAX_SAMPLES):
+    """
+    Count and time every WebDriver command ``driver`` sends, per call site.
+
+    Element calls (find_element on an element, click, ...) go through the
+    driver too, so they are included. The stats are attached to the driver
+    as ``driver.call_stats``. Instrumenting a driver twice is a no-op.
+
+    Returns:
+        WebDriver: The same driver
+    """
+    if get_call_stats(driver) is not None:
+        return driver
+    stats = CallStats(max_samples)
+    execute = driver.execute
+
+    def instrumented_execute(driver_command, params=None):
+        start = time.perf_counter()
+        try:
+            return execute(driver_command, params)
+        finally:
+            stats.add(COMMAND_LABELS.get(driver_command, driver_command), _call_site(), time.perf_counter() - start)
+
+    driver.execute = instrumented_execute
+    driver.call_stats = stats
+    return driver
+
+
+def get_call_stats(driver):
+    """Return the CallStats of an instrumented driver, or None."""
+    return getattr(driver, "call_stats", None) if driver is not None else None
+
+
+def dump_call_stats(driver, label="task", reset=True, stats_dir=STATS_DIR):
+    """
+    Print the call stats of an instrumented driver and save them as JSON.
+
+    Args:
+        driver: Instrumented WebDriver
+        label: Name used in the output and the file name
+        reset: Start counting from zero afterwards
+        stats_dir: Directory for the JSON files
+
+    Returns:
+        str: The printed table, or None if the driver is not instrumented
+    """
+    stats = get_call_stats(driver)
+    if stats is None:
+        return None
+    report = stats.format()
+    print(f"WebDriver calls for {label}:\n{report}")
+    try:
+        if not os.path.exists(stats_dir):
+            os.makedirs(stats_dir)
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        with open(os.path.join(stats_dir, f"{label}_{timestamp}.json"), "w") as f:
+            json.dump(stats.rows(), f, indent=2)
+    except OSError as e:
+        print(f"[⚠️] Could not save WebDriver call stats: {e}")
+    if reset:
+        stats.reset()
+    return report
+
+
+def trace_driver_commands(driver):
+    """Record every WebDriver command as a span while a trace run is recording."""
+    execute = driver.execute
+
+    def traced_execute(driver_command, params=None):
+        if not tracing.is_recording():
+            return execute(driver_command, params)
+        if driver_command in NAVIGATION_COMMANDS:
+            with tracing.span(driver_command, "navigation", url=(params or {}).get("url", "")):
+                return execute(driver_command, params)
+        with tracing.span(driver_command, "webdriver"):
+            return execute(driver_command, params)
+
+    driver.execute = traced_execute
+    return driver
@@ -0,0 +1,201 @@
+import re
+import json
+import logging
+from contextlib import contextmanager
+
+from selenium.common.exceptions import WebDriverException
+
+from config.config import LEAN_MODE_BLOCK
+
+logger = logging.getLogger(__name__)
+
+# URL patterns blocked per resource category (Network.setBlockedURLs
+# wildcards). LinkedIn serves images and video from media.licdn.com and
+# dms.licdn.com without file extensions, so those are matched by path.
+BLOCK_PATTERNS = {
+    "image": [
+        "*media.licdn.com/dms/image/*",
+        "*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.avif*",
+    ],
+    "media": [
+        "*dms.licdn.com/playlist/*",
+        "*media.licdn.com/dms/video/*",
+        "*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*",
+    ],
+    "font": ["*.woff*", "*.ttf*", "*.otf*", "*.eot*"],
+    "tracker": [
+        "*px.ads.linkedin.com/*",
+        "*snap.licdn.com/li.lms-analytics/*",
+        "*linkedin.com/li/track*",
+        "*linkedin.com/realtime/*/ping*",
+        "*google-analytics.com/*",
+        "*googletagmanager.com/*",
+        "*doubleclick.net/*",
+        "*connect.facebook.net/*",
+        "*bat.bing.com/*",
+    ],
+}
+
+# Rough transfer size of one resource per category, used to estimate the
+# bytes saved from the number of blocked requests
+TYPICAL_BYTES = {
+    "image": 30_000,
+    "media": 500_000,
+    "font": 40_000,
+    "tracker": 25_000,
+}
+
+# Counts resources the browser failed to load because they were blocked,
+# per category, in sessionStorage so the counts survive navigations within
+# LinkedIn. Load errors of elements are only seen in the capture phase;
+# fonts requested from CSS report through document.fonts instead.
+COUNTER_SCRIPT = """
+(() => {
+    if (window.__automatorLeanCounter) return;
+    window.__automatorLeanCounter = true;
+    const KEY = '__automatorLeanBlocked';
+    const patterns = %s;
+    const categories = Object.keys(patterns).map((name) => [name, patterns[name].map((p) => new RegExp(p))]);
+    const bump = (category, n) => {
+        try {
+            const counts = JSON.parse(sessionStorage.getItem(KEY) || '{}');
+            counts[category] = (counts[category] || 0) + n;
+            sessionStorage.setItem(KEY, JSON.stringify(counts));
+        } catch (e) {}
+    };
+    window.addEventListener('error', (event) => {
+        const el = event.target;
+        const url = el && el !== window ? String(el.currentSrc || el.src || el.href || '') : '';
+        const match = url && categories.find(([, regexes]) => regexes.some((regex) => regex.test(url)));
+        if (match) bump(match[0], 1);
+    }, true);
+    if (document.fonts && patterns.font) {
+        document.fonts.addEventListener('loadingerror', (event) => bump('font', event.fontfaces.length));
+    }
+})();
+"""
+
+READ_COUNTS_SCRIPT = """
+try {
+    const counts = JSON.parse(sessionStorage.getItem('__automatorLeanBlocked') || '{}');
+    sessionStorage.removeItem('__automatorLeanBlocked');
+    return counts;
+} catch (e) {
+    return {};
+}
+"""
+
+
+def _pattern_regex(pattern):
+    """Translate a Network.setBlockedURLs wildcard pattern to a JS regex source."""
+    return "^" + ".*".join(re.escape(part) for part in pattern.split("*")) + "$"
+
+
+def is_lean(driver):
+    return getattr(driver, "lean_mode", None) is not None
+
+
+def enable_lean_mode(driver, categories=LEAN_MODE_BLOCK):
+    """
+    Block heavy resources for the pages the driver loads from now on.
+
+    Requests matching the BLOCK_PATTERNS of ``categories`` are dropped by
+    the browser before they are sent. Enabling an already lean driver is
+    a no-op.
+
+    Args:
+        driver: Selenium WebDriver instance (Chrome)
+        categories: Resource categories to block, keys of BLOCK_PATTERNS
+
+    Returns:
+        bool: True if lean mode was turned on by this call
+    """
+    if is_lean(driver):
+        return False
+    patterns = {category: BLOCK_PATTERNS[category] for category in categories}
+    counter = COUNTER_SCRIPT % json.dumps(
+        {category: [_pattern_regex(p) for p in urls] for category, urls in patterns.items()}
+    )
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": [p for urls in patterns.values() for p in urls]})
+        script = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": counter})
+        # The current page keeps loading lazy content while we scroll
+        driver.execute_script(counter)
+        driver.execute_script(READ_COUNTS_SCRIPT)
+    except WebDriverException as e:
+        logger.warning(f"Could not enable lean mode: {e}")
+        return False
+    driver.lean_mode = {"categories": list(patterns), "script": script.get("identifier")}
+    return True
+
+
+def disable_lean_mode(driver):
+    """
+    Stop blocking resources and return what was blocked since enabling.
+
+    Returns:
+        dict: {"blocked": {category: count}, "bytes_saved": estimate}, or
+            None if the driver was not lean
+    """
+    state = getattr(driver, "lean_mode", None)
+    if state is None:
+        return None
+    driver.lean_mode = None
+    blocked = {}
+    try:
+        blocked = driver.execute_script(READ_COUNTS_SCRIPT) or {}
+    except WebDriverException:
+        pass
+    try:
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+        if state["script"]:
+            driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": state["script"]})
+    except WebDriverException as e:
+        logger.warning(f"Could not disable lean mode: {e}")
+    return {
+        "blocked": blocked,
+        "bytes_saved": sum(TYPICAL_BYTES.get(category, 0) * count for category, count in blocked.items()),
+    }
+
+
+def format_report(report):
+    """Return a one-line summary of a disable_lean_mode() report."""
+    blocked = report["blocked"]
+    if not blocked:
+        return "Lean mode: no heavy resources blocked"
+    counts = ", ".join(f"{count} {category}" for category, count in sorted(blocked.items()))
+    return f"Lean mode: blocked {counts} (~{report['bytes_saved'] / 1_000_000:.1f} MB saved)"
+
+
+@contextmanager
+def lean_mode(driver, enabled=True, categories=LEAN_MODE_BLOCK, log_callback=None):
+    """
+    Run the enclosed block with heavy resources blocked.
+
+    For read-only work (scraping contacts, search results, reading the
+    feed) where images, video, fonts and trackers are never looked at.
+    Blocking is lifted on exit and the estimated savings are logged. If
+    the driver is already lean the block simply runs in the outer mode.
+
+        with lean_mode(driver, log_callback=log):
+            contacts = get_contacts(driver)
+
+    Args:
+        driver: Selenium WebDriver instance (Chrome)
+        enabled: Run lean; with False the block runs normally
+        categories: Resource categories to block, keys of BLOCK_PATTERNS
+        log_callback: Optional callback(message, level) for the savings report
+    """
+    if not enabled or not enable_lean_mode(driver, categories):
+        yield driver
+        return
+    try:
+        yield driver
+    finally:
+        report = disable_lean_mode(driver)
+        if report is not None:
+            if log_callback:
+                log_callback(format_report(report), level="info")
+            else:
+                logger.info(format_report(report))
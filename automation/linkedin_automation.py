@@ -8,7 +8,6 @@ from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException, WebDriverException, TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 
 # Set up logging
@@ -23,7 +22,20 @@ logger = logging.getLogger(__name__)
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
-from config.config import RETRY_LIMIT, HEADLESS, LOGIN_URL
+from config.config import RETRY_LIMIT, HEADLESS, LOGIN_URL, INSTRUMENT_DRIVER
+from automation.driver_manager import (
+    resolve_driver_path,
+    clear_driver_cache,
+    register_driver,
+    cleanup_stale_processes,
+)
+from automation.waits import wait_for_page_ready, wait_for_page_settled, dwell
+from automation.incremental_loader import IncrementalLoader
+from automation.instrumented_driver import instrument_driver, trace_driver_commands
+
+FEED_URL = "https://www.linkedin.com/feed/"
+COOKIE_FILE = os.path.join(project_root, "config", "linkedin_cookies.json")
+AUTH_COOKIE = "li_at"  # LinkedIn's session cookie
 
 def load_credentials():
     try:
@@ -50,18 +62,11 @@ def create_driver():
 
     options = webdriver.ChromeOptions()
 
-    # Kill all existing Chrome instances first
+    # Clean up only the Chrome processes a previous run of this app left behind
     try:
-        if os.name == 'nt':  # Windows
-            os.system("taskkill /f /im chrome.exe >nul 2>&1")
-            os.system("taskkill /f /im chromedriver.exe >nul 2>&1")
-        else:  # Linux/Mac
-            os.system("pkill -f chrome")
-            os.system("pkill -f chromedriver")
-        time.sleep(2)  # Give time for processes to terminate
-        logger.info("Killed existing Chrome processes")
+        cleanup_stale_processes()
     except Exception as e:
-        logger.warning(f"Could not kill Chrome processes: {e}")
+        logger.warning(f"Could not clean up leftover Chrome processes: {e}")
 
     logger.info("Trying Method 3: Using temporary profile with cookies...")
 
@@ -77,8 +82,17 @@ def create_driver():
         options.add_argument("--headless=new")
         options.add_argument("--window-size=1920,1080")
 
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
+    try:
+        driver = webdriver.Chrome(service=Service(resolve_driver_path()), options=options)
+    except WebDriverException:
+        # The cached binary may no longer match Chrome; resolve it again once
+        logger.warning("Cached chromedriver failed to start, resolving it again")
+        clear_driver_cache()
+        driver = webdriver.Chrome(service=Service(resolve_driver_path()), options=options)
+    register_driver(driver)
+    trace_driver_commands(driver)
+    if INSTRUMENT_DRIVER:
+        instrument_driver(driver)
 
     # Add anti-detection script
     driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
@@ -97,7 +111,7 @@ def is_logged_in(driver):
     """Check if we're already logged in to LinkedIn"""
     try:
         # Wait briefly for the page to load
-        time.sleep(2)
+        wait_for_page_ready(driver)
         
         # Check URL for feed or home indication
         if "feed" in driver.current_url or "/home" in driver.current_url:
@@ -131,58 +145,100 @@ def is_logged_in(driver):
         logger.error(f"Error checking login status: {e}")
         return False
 
+def load_valid_cookies(path=COOKIE_FILE):
+    """
+    Load saved cookies and drop the ones that have already expired.
+
+    Returns:
+        list: Unexpired cookies, or an empty list if the auth cookie is
+            missing or expired (restoring the rest would be pointless)
+    """
+    if not os.path.exists(path):
+        return []
+    try:
+        with open(path, "r") as f:
+            cookies = json.load(f)
+    except json.JSONDecodeError:
+        logger.warning(f"Invalid JSON in cookie file {path}")
+        return []
+
+    now = time.time()
+    valid = [cookie for cookie in cookies if cookie.get("expiry") is None or cookie["expiry"] > now]
+    if not any(cookie.get("name") == AUTH_COOKIE for cookie in valid):
+        logger.info("Saved LinkedIn session has expired")
+        return []
+    return valid
+
+def _to_cdp_cookie(cookie):
+    """Convert a cookie from driver.get_cookies() to the CDP Network.CookieParam format."""
+    param = {
+        "name": cookie["name"],
+        "value": cookie["value"],
+        "domain": cookie.get("domain", ".linkedin.com"),
+        "path": cookie.get("path", "/"),
+        "secure": cookie.get("secure", False),
+        "httpOnly": cookie.get("httpOnly", False),
+    }
+    if cookie.get("sameSite") in ("Strict", "Lax", "None"):
+        param["sameSite"] = cookie["sameSite"]
+    if cookie.get("expiry") is not None:
+        param["expires"] = float(cookie["expiry"])
+    return param
+
+def is_authenticated_url(url):
+    """Return True if LinkedIn kept us on the feed instead of redirecting to a login wall."""
+    if any(marker in url for marker in ("/login", "/authwall", "/checkpoint", "/uas/")):
+        return False
+    return "/feed" in url
+
+def restore_session(driver):
+    """
+    Restore a saved LinkedIn session in a single page load.
+
+    Unexpired cookies are injected in bulk with CDP Network.setCookies before
+    the first navigation, then the feed is opened once. LinkedIn redirects to
+    a login wall when the session is not valid, so the resulting URL alone
+    tells whether we are logged in.
+
+    Returns:
+        bool: True if the feed loaded as a logged-in user
+    """
+    driver.execute_cdp_cmd("Network.enable", {})
+    live = driver.execute_cdp_cmd("Network.getCookies", {"urls": [FEED_URL]}).get("cookies", [])
+    # A reused browser that already holds a session keeps its own cookies
+    cookies = [] if any(c["name"] == AUTH_COOKIE for c in live) else load_valid_cookies()
+    if cookies:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": [_to_cdp_cookie(c) for c in cookies]})
+        logger.info(f"Restored {len(cookies)} saved cookies")
+
+    driver.get(FEED_URL)
+    wait_for_page_ready(driver)
+    return is_authenticated_url(driver.current_url)
+
+def save_cookies(driver, path=COOKIE_FILE):
+    """Save the current session cookies for restore_session."""
+    cookies = driver.get_cookies()
+    with open(path, "w") as f:
+        json.dump(cookies, f)
+    logger.info(f"Saved {len(cookies)} cookies for future use")
+
 def login_linkedin(driver, username, password):
     """Log in to LinkedIn"""
     logger.info("Attempting to access LinkedIn...")
-    
-    # Navigate directly to LinkedIn homepage
-    try:
-        driver.get("https://www.linkedin.com/")
-        logger.info("Successfully loaded LinkedIn homepage")
-    except Exception as e:
-        logger.error(f"Failed to load LinkedIn homepage: {e}")
-        return False
-    
-    time.sleep(3)
-    
-    # Check if we're already logged in
-    if is_logged_in(driver):
-        logger.info("Already logged in to LinkedIn!")
-        return True
-    
-    # Extract cookies from original profile (if this is Method 3 and cookies can be accessed)
+
+    # Fast path: saved cookies (or a browser that is already logged in)
     try:
-        cookie_file = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 
-                                 "config", "linkedin_cookies.json")
-        if os.path.exists(cookie_file):
-            with open(cookie_file, 'r') as f:
-                cookies = json.load(f)
-                
-            logger.info(f"Loading {len(cookies)} saved cookies")
-            for cookie in cookies:
-                if 'expiry' in cookie:
-                    cookie['expiry'] = int(cookie['expiry'])
-                try:
-                    driver.add_cookie(cookie)
-                except Exception as e:
-                    logger.warning(f"Could not add cookie: {e}")
-            
-            # Refresh the page after adding cookies
-            driver.refresh()
-            time.sleep(3)
-            
-            # Check if we're logged in after adding cookies
-            if is_logged_in(driver):
-                logger.info("Login successful via cookies!")
-                return True
+        if restore_session(driver):
+            logger.info("Already logged in to LinkedIn!")
+            return True
     except Exception as e:
-        logger.warning(f"Error loading cookies: {e}")
-    
+        logger.warning(f"Could not restore session from cookies: {e}")
+
     # If not logged in, proceed with manual login
     try:
         logger.info(f"Navigating to login page: {LOGIN_URL}")
         driver.get(LOGIN_URL)
-        time.sleep(3)
+        wait_for_page_ready(driver)
 
         # Wait for login form elements to be present
         try:
@@ -196,7 +252,6 @@ def login_linkedin(driver, username, password):
                 sign_in_buttons = driver.find_elements(By.XPATH, "//a[contains(@class, 'nav__button-secondary') or text()='Sign in']")
                 if sign_in_buttons:
                     sign_in_buttons[0].click()
-                    time.sleep(2)
                     WebDriverWait(driver, 10).until(
                         EC.presence_of_element_located((By.ID, "username"))
                     )
@@ -225,7 +280,7 @@ def login_linkedin(driver, username, password):
         login_button.click()
         
         # Wait for login to complete
-        time.sleep(5)
+        wait_for_page_settled(driver)
         
         # Verify login success
         if is_logged_in(driver):
@@ -233,12 +288,7 @@ def login_linkedin(driver, username, password):
             
             # Save cookies for future use
             try:
-                cookies = driver.get_cookies()
-                cookie_file = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 
-                                         "config", "linkedin_cookies.json")
-                with open(cookie_file, 'w') as f:
-                    json.dump(cookies, f)
-                logger.info(f"Saved {len(cookies)} cookies for future use")
+                save_cookies(driver)
             except Exception as e:
                 logger.warning(f"Could not save cookies: {e}")
                 
@@ -264,32 +314,31 @@ def login_linkedin(driver, username, password):
         return False
 
 def start_login_process():
+    from automation.session_manager import SessionManager
+
     creds = load_credentials()
     success = False
     attempts = 0
-    driver = None
+    session = SessionManager()
 
     while not success and attempts < RETRY_LIMIT:
         try:
             logger.info(f"Login attempt {attempts + 1}/{RETRY_LIMIT}")
-            
-            if driver:
-                driver.quit()
-                
-            driver = create_driver()
-            success = login_linkedin(driver, creds["username"], creds["password"])
+
+            # Reuse the browser across retries; it is only relaunched if it died
+            success = session.login(creds["username"], creds["password"])
             
             if success:
                 logger.info("Successfully logged in to LinkedIn")
                 
                 # Optional: Wait a bit before proceeding
-                time.sleep(3)
+                dwell()
                 
                 # After successful login, start the connection process
                 try:
                     from automation.connection_requester import process_connections
                     logger.info("Starting connection requests process")
-                    process_connections(driver, max_requests=5)
+                    process_connections(session.driver, max_requests=5)
                 except ImportError:
                     logger.error("Could not import process_connections module")
                 except Exception as e:
@@ -305,11 +354,6 @@ def start_login_process():
             if not success:
                 logger.info(f"Retrying... ({attempts + 1}/{RETRY_LIMIT})")
                 attempts += 1
-                if driver:
-                    try:
-                        driver.quit()
-                    except:
-                        pass
                 # Wait before retrying
                 time.sleep(5)
             else:
@@ -319,14 +363,24 @@ def start_login_process():
         logger.error(f"Failed to log in after {RETRY_LIMIT} attempts")
     
     # Cleanup
-    if driver:
-        try:
-            driver.quit()
-        except:
-            pass
+    session.close()
             
     return success
 
+# Name, profile URL and headline of one search result, extracted in the page
+SEARCH_RESULT_SELECTOR = "li.reusable-search__result-container"
+SEARCH_RESULT_EXTRACT_SCRIPT = """(el) => {
+    const link = el.querySelector('span.entity-result__title-text a');
+    const headline = el.querySelector('div.entity-result__primary-subtitle');
+    const url = link && link.href ? link.href.split('?')[0] : '';
+    return {
+        key: url,
+        url: url,
+        name: link ? (link.innerText || link.textContent || '').trim() : '',
+        headline: headline ? (headline.innerText || headline.textContent || '').trim() : '',
+    };
+}"""
+
 def scroll_and_collect_profiles(driver, max_profiles=10):
     """
     Scrolls through the search results page and collects profile information.
@@ -339,68 +393,25 @@ def scroll_and_collect_profiles(driver, max_profiles=10):
         List of dictionaries containing profile information
     """
     logger.info(f"Collecting up to {max_profiles} profiles...")
-    
+
+    loader = IncrementalLoader(driver, "search_results", SEARCH_RESULT_SELECTOR, SEARCH_RESULT_EXTRACT_SCRIPT)
+    try:
+        results = loader.load(max_profiles, accept=lambda item: bool(item["name"]))
+    except WebDriverException as e:
+        logger.warning(f"Error collecting profiles: {e}")
+        results = [item for item in loader.items.values() if item["name"]]
+    finally:
+        loader.stop()
+
     profiles = []
-    last_height = driver.execute_script("return document.body.scrollHeight")
-    
-    while len(profiles) < max_profiles:
-        # Find all profile cards
-        try:
-            profile_cards = WebDriverWait(driver, 10).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//li[contains(@class, 'reusable-search__result-container')]"))
-            )
-            
-            for card in profile_cards:
-                if len(profiles) >= max_profiles:
-                    break
-                    
-                try:
-                    # Extract profile information
-                    name_element = card.find_element(By.XPATH, ".//span[@class='entity-result__title-text']//a")
-                    name = name_element.text.strip()
-                    url = name_element.get_attribute("href")
-                    
-                    # Try to get headline
-                    try:
-                        headline = card.find_element(By.XPATH, ".//div[@class='entity-result__primary-subtitle']").text.strip()
-                    except:
-                        headline = "No headline available"
-                    
-                    # Check if we already have this profile
-                    if not any(p["url"] == url for p in profiles):
-                        profiles.append({
-                            "name": name,
-                            "headline": headline,
-                            "url": url
-                        })
-                        logger.info(f"Collected profile: {name}")
-                except Exception as e:
-                    logger.warning(f"Error collecting profile: {str(e)}")
-                    continue
-        except TimeoutException:
-            logger.warning("Timed out waiting for profile cards")
-            break
-        except Exception as e:
-            logger.warning(f"Error finding profile cards: {str(e)}")
-            break
-        
-        # Scroll down
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
-        
-        # Check if we've reached the bottom
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        if new_height == last_height:
-            # Try one more scroll
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-            new_height = driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
-                logger.info("Reached end of page")
-                break
-                
-        last_height = new_height
-    
+    for item in results[:max_profiles]:
+        profiles.append({
+            "name": item["name"],
+            "headline": item["headline"] or "No headline available",
+            "url": item["url"],
+        })
+        logger.info(f"Collected profile: {item['name']}")
+
     logger.info(f"Collected {len(profiles)} profiles")
     return profiles
 
@@ -8,6 +8,8 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 import os
 
+from automation.waits import wait_for_network_idle, scroll_into_view, dwell
+
 def remove_non_bmp_characters(text):
     """Remove non-BMP Unicode characters from the given text."""
     return ''.join(char for char in text if ord(char) <= 0xFFFF)
@@ -129,8 +131,7 @@ def send_message(driver, name, thread_element, message, resume_path, log_callbac
         while attempt <= max_attempts:
             try:
                 log_callback(f"[debug] Clicking conversation thread for {name} (attempt {attempt})", level="debug")
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", current_thread)
-                time.sleep(1)
+                scroll_into_view(driver, current_thread)
                 current_thread.click()
                 break
             except (StaleElementReferenceException, NoSuchElementException) as e:
@@ -160,7 +161,7 @@ def send_message(driver, name, thread_element, message, resume_path, log_callbac
                 file_input = driver.find_element(By.XPATH, "//input[@type='file']")
                 file_input.send_keys(os.path.abspath(resume_path))
                 log_callback("Resume attached successfully", level="info")
-                time.sleep(2)  # Short delay to ensure LinkedIn processes the upload
+                wait_for_network_idle(driver)  # Let LinkedIn finish processing the upload
 
             except Exception as e:
                 log_callback(f"Failed to attach resume: {str(e)}", level="user")
@@ -171,7 +172,7 @@ def send_message(driver, name, thread_element, message, resume_path, log_callbac
         )
         send_button.click()
 
-        time.sleep(2)
+        wait_for_network_idle(driver)
         log_callback(f"[debug] Message sent successfully to {name}", level="debug")
         return True
 
@@ -203,4 +204,4 @@ def start_bulk_messaging(driver, contacts, message_template, log_callback=lambda
             log_callback(f"Message sent to {name}", level="user")
         else:
             log_callback(f"Failed to send message to {name}", level="user")
-        time.sleep(2)
\ No newline at end of file
+        dwell()
\ No newline at end of file
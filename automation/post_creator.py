@@ -1,5 +1,4 @@
 import os
-import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
@@ -9,6 +8,33 @@ import sys
 # Add the parent directory to the path so we can import from ai
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from ai.ai_generator import suggest_hashtags, detect_topic_and_hashtags, enhance_caption
+from automation.waits import (
+    wait_for_page_ready,
+    wait_for_page_settled,
+    wait_for_network_idle,
+    wait_for_modal_open,
+    scroll_into_view,
+    dwell,
+)
+from automation.selector_registry import get_selector_registry
+from utils import tracing
+
+# "Start a post" button candidates, best guess first
+selectors = get_selector_registry()
+START_POST_BUTTON = selectors.register("post.start_button", [
+    (By.XPATH, "//*[starts-with(@id, 'ember') and contains(@class, 'artdeco-button') and contains(., 'Start a post')]"),
+    (By.CSS_SELECTOR, ".iJgxIKBnhIZuvAnUHEGlRLCUgQuzvthjEUODyac"),
+    (By.XPATH, "//*[contains(text(), 'Start a post')]"),
+])
+
+HIDE_OVERLAYS_SCRIPT = """
+var overlays = document.querySelectorAll('[class*="overlay"], [class*="popup"], [class*="modal"]');
+for (var i = 0; i < overlays.length; i++) {
+    if (overlays[i].style.display !== 'none') {
+        overlays[i].style.display = 'none';
+    }
+}
+"""
 
 def submit_post(driver, log_callback=None):
     try:
@@ -55,8 +81,7 @@ def submit_post(driver, log_callback=None):
                         raise Exception("Post button not found")
 
         # Ensure the button is visible
-        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", post_btn)
-        time.sleep(1)
+        scroll_into_view(driver, post_btn)
 
         # Try different click methods
         try:
@@ -72,7 +97,7 @@ def submit_post(driver, log_callback=None):
                 post_btn.click()
 
         log("✅ Post submitted.")
-        time.sleep(5)
+        wait_for_network_idle(driver)
 
         # Verify post was successful
         try:
@@ -102,74 +127,21 @@ def open_post_modal(driver, log_callback=None):
         log("Navigating to LinkedIn feed...")
         
         # Wait longer for the feed to fully load and stabilize
-        time.sleep(5)
+        wait_for_page_settled(driver)
         
         # Get screenshot for debugging
         driver.save_screenshot("before_click.png")
         
-        # Try multiple methods with better targeting
-        try:
-            # Method 1: Target the specific button by ID
-            log("Trying to locate 'Start a post' button by ID...")
-            # Use the ember ID (but note that these IDs can change between sessions)
-            ember_buttons = driver.find_elements(By.CSS_SELECTOR, "[id^='ember'][class*='artdeco-button']")
-            
-            for btn in ember_buttons:
-                if "Start a post" in btn.text:
-                    log(f"Found button with text: {btn.text}")
-                    # Scroll to ensure it's in view
-                    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", btn)
-                    time.sleep(2)
-                    # Try to remove any overlays that might intercept
-                    driver.execute_script("""
-                        var overlays = document.querySelectorAll('[class*="overlay"], [class*="popup"], [class*="modal"]');
-                        for(var i=0; i<overlays.length; i++) {
-                            if(overlays[i].style.display !== 'none') {
-                                overlays[i].style.display = 'none';
-                            }
-                        }
-                    """)
-                    time.sleep(1)
-                    # Click using JavaScript
-                    driver.execute_script("arguments[0].click();", btn)
-                    break
-            else:
-                raise Exception("Button with 'Start a post' text not found")
-                
-        except Exception as e:
-            log(f"ID method failed: {e}")
-            try:
-                # Method 2: Try direct XPath with contains for the specific class you shared
-                log("Trying specific class selector...")
-                post_button = WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".iJgxIKBnhIZuvAnUHEGlRLCUgQuzvthjEUODyac"))
-                )
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", post_button)
-                time.sleep(1)
-                # Click using Actions
-                from selenium.webdriver.common.action_chains import ActionChains
-                ActionChains(driver).move_to_element(post_button).click().perform()
-                
-            except Exception as e2:
-                log(f"Class selector method failed: {e2}")
-                # Method 3: Try clicking any element that has "Start a post" text
-                log("Trying text search...")
-                try:
-                    elements = driver.find_elements(By.XPATH, "//*[contains(text(), 'Start a post')]")
-                    if elements:
-                        for elem in elements:
-                            try:
-                                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", elem)
-                                time.sleep(1)
-                                driver.execute_script("arguments[0].click();", elem)
-                                break
-                            except:
-                                continue
-                    else:
-                        raise Exception("No elements with 'Start a post' text found")
-                except Exception as e3:
-                    log(f"Text search failed: {e3}")
-                    raise Exception("Could not open post modal with any method")
+        # The registry tries the selector that worked last time first and waits
+        # on all candidates at once, so stale ones no longer cost a timeout each
+        log("Looking for the 'Start a post' button...")
+        post_button = selectors.find(driver, START_POST_BUTTON, timeout=10)
+        if post_button is None:
+            raise Exception("Could not open post modal with any method")
+        scroll_into_view(driver, post_button)
+        # Hide overlays that might intercept the click
+        driver.execute_script(HIDE_OVERLAYS_SCRIPT)
+        driver.execute_script("arguments[0].click();", post_button)
 
         # Verify the post modal is open
         WebDriverWait(driver, 10).until(
@@ -221,8 +193,7 @@ def upload_image(driver, image_path, log_callback=None):
                 )
                 
                 # Scroll to ensure button is visible
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", image_button)
-                time.sleep(1)
+                scroll_into_view(driver, image_button)
                 
                 # Try JavaScript click first (less likely to be intercepted)
                 try:
@@ -255,9 +226,6 @@ def upload_image(driver, image_path, log_callback=None):
                 return false;
             """)
         
-        # Wait for file input to appear
-        time.sleep(2)
-        
         # Try multiple ways to find the file input
         try:
             log("Looking for file input...")
@@ -275,7 +243,7 @@ def upload_image(driver, image_path, log_callback=None):
             file_input.send_keys(abs_path)
             
             log("🖼️ Image selected.")
-            time.sleep(3)
+            wait_for_network_idle(driver)
             
             # Check if there's a "Done" button and click it
             try:
@@ -329,8 +297,7 @@ def schedule_post(driver):
                 clock_icon = WebDriverWait(driver, 3).until(
                     EC.element_to_be_clickable((By.XPATH, selector))
                 )
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", clock_icon)
-                time.sleep(1)
+                scroll_into_view(driver, clock_icon)
                 driver.execute_script("arguments[0].click();", clock_icon)
                 print(f"Clicked schedule button using selector: {selector}")
                 break
@@ -351,7 +318,7 @@ def schedule_post(driver):
                 return false;
             """)
         
-        time.sleep(2)
+        wait_for_modal_open(driver)
 
         # Wait for scheduling modal to appear
         WebDriverWait(driver, 5).until(
@@ -399,14 +366,14 @@ def schedule_post(driver):
         date_input.clear()
         date_input.send_keys(date_str)
         print(f"Date set to: {date_str}")
-        time.sleep(1)
+        dwell()
 
         # Input time field
         time_input = driver.find_element(By.ID, "share-post__scheduled-time")
         time_input.clear()
         time_input.send_keys(time_str)
         print(f"Time set to: {time_str}")
-        time.sleep(1)
+        dwell()
 
         # Updated Code
         next_button_selectors = [
@@ -421,8 +388,7 @@ def schedule_post(driver):
                     EC.element_to_be_clickable((By.XPATH, selector))
                 )
                 print(f"Found 'Next' button using selector: {selector}")
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_btn)
-                time.sleep(1)
+                scroll_into_view(driver, next_btn)
                 driver.execute_script("arguments[0].click();", next_btn)
                 print("Clicked 'Next' button using JavaScript")
                 break
@@ -431,7 +397,7 @@ def schedule_post(driver):
         else:
             raise Exception("Could not find or click the 'Next' button.")
         
-        time.sleep(2)
+        wait_for_network_idle(driver)
         
         # Wait for and click the final "Schedule" button that appears after clicking Next
         # Using multiple selectors to find the final Schedule button
@@ -449,8 +415,7 @@ def schedule_post(driver):
                 )
                 print(f"Found final Schedule button with selector: {selector}")
                 # Scroll to ensure it's visible
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", schedule_btn)
-                time.sleep(1)
+                scroll_into_view(driver, schedule_btn)
                 # Click using JavaScript
                 driver.execute_script("arguments[0].click();", schedule_btn)
                 break
@@ -472,7 +437,7 @@ def schedule_post(driver):
             """)
         
         # Wait for confirmation that the post was scheduled
-        time.sleep(3)
+        wait_for_network_idle(driver)
         driver.save_screenshot("schedule_confirmation.png")
         
         print(f"✅ Post scheduled for {date_str} at {time_str}")
@@ -497,7 +462,7 @@ def create_post_alternative_route(driver, caption, image_path=None, smart=False,
         
         # Go directly to the post creation page
         driver.get("https://www.linkedin.com/post/new/")
-        time.sleep(5)
+        wait_for_page_ready(driver)
 
         # Fill in the caption
         try:
@@ -536,7 +501,7 @@ def create_post_alternative_route(driver, caption, image_path=None, smart=False,
                 
             text_area.send_keys(full_caption)
             log(f"📝 Post caption filled:\n{full_caption}")
-            time.sleep(2)
+            dwell()
         except Exception as e:
             log(f"❌ Failed to fill post caption: {e}")
             return False
@@ -548,20 +513,19 @@ def create_post_alternative_route(driver, caption, image_path=None, smart=False,
                 media_buttons = driver.find_elements(By.XPATH, "//button[contains(@aria-label, 'Add media') or contains(@aria-label, 'photo') or contains(@aria-label, 'image')]")
                 if media_buttons:
                     media_buttons[0].click()
-                    time.sleep(2)
                     # Locate the file input field and upload the image
                     file_input = WebDriverWait(driver, 5).until(
                         EC.presence_of_element_located((By.XPATH, "//input[@type='file']"))
                     )
                     file_input.send_keys(os.path.abspath(image_path))
                     log("🖼️ Image selected.")
-                    time.sleep(3)
+                    wait_for_network_idle(driver)
                     # Look for a Done button
                     done_buttons = driver.find_elements(By.XPATH, "//button[contains(@aria-label, 'Done') or contains(text(), 'Done')]")
                     if done_buttons:
                         done_buttons[0].click()
                         log("✅ Image uploaded.")
-                        time.sleep(2)
+                        wait_for_network_idle(driver)
             except Exception as e:
                 log(f"❌ Failed to upload image: {e}")
 
@@ -586,6 +550,7 @@ def create_post_alternative_route(driver, caption, image_path=None, smart=False,
         driver.save_screenshot("alternative_post_failure.png")
         return False
 
+@tracing.traced_run("create_linkedin_post")
 def create_linkedin_post(driver, caption, image_path=None, smart=False, log_callback=None):
     try:
         # Helper function for logging
@@ -0,0 +1,196 @@
+import os
+import json
+import time
+import atexit
+import threading
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from config.config import SELECTOR_SCORE_DECAY, SELECTOR_STATS_SAVE_EVERY
+
+# Define the stats location
+STATS_DIR = "logs"
+STATS_FILE = os.path.join(STATS_DIR, "selector_stats.json")
+
+
+def _candidate_id(candidate):
+    by, value = candidate
+    return f"{by}:{value}"
+
+
+class SelectorRegistry:
+    """
+    Ranked selector candidates for each logical page element.
+
+    Every lookup records a hit or a miss (and the lookup latency) for the
+    candidates it tried. Candidates are tried in order of a decayed hit
+    score, so the selector that currently works moves to the front and
+    stale fallbacks sink to the back. Stats are kept in ``path`` so the
+    ranking survives restarts.
+
+    Args:
+        path: JSON file with the per-candidate stats
+        decay: Weight of the previous score when a result is recorded (0-1)
+        save_every: Save the stats after this many recorded results
+    """
+
+    def __init__(self, path=STATS_FILE, decay=SELECTOR_SCORE_DECAY, save_every=SELECTOR_STATS_SAVE_EVERY):
+        self.path = path
+        self.decay = decay
+        self.save_every = save_every
+        self._lock = threading.Lock()
+        self._candidates = {}
+        self._stats = self._load()
+        self._unsaved = 0
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                stats = json.load(f)
+            return stats if isinstance(stats, dict) else {}
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save(self):
+        with self._lock:
+            if not self._unsaved:
+                return
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self._stats, f, indent=2)
+            os.replace(tmp_path, self.path)
+            self._unsaved = 0
+
+    def register(self, name, candidates):
+        """
+        Register the candidates of a logical element, best guess first.
+
+        Args:
+            name: Logical element name, e.g. "connection.connect_button"
+            candidates: List of (By, value) pairs
+
+        Returns:
+            str: ``name``, for use as a module constant
+        """
+        self._candidates[name] = [tuple(candidate) for candidate in candidates]
+        return name
+
+    def _candidate_stats(self, name, candidate):
+        element_stats = self._stats.setdefault(name, {})
+        return element_stats.setdefault(
+            _candidate_id(candidate), {"hits": 0, "misses": 0, "score": 0.5, "avg_ms": None}
+        )
+
+    def ordered(self, name):
+        """Return the candidates of ``name``, best first."""
+        candidates = self._candidates[name]
+        element_stats = self._stats.get(name, {})
+
+        def rank(candidate):
+            stats = element_stats.get(_candidate_id(candidate))
+            if stats is None:
+                return (-0.5, float("inf"))
+            return (-stats["score"], stats["avg_ms"] if stats["avg_ms"] is not None else float("inf"))
+
+        # sorted() is stable, so untried candidates keep their registered order
+        return sorted(candidates, key=rank)
+
+    def record(self, name, candidate, hit, elapsed=None):
+        """Record one lookup result for a candidate; ``elapsed`` is in seconds."""
+        with self._lock:
+            stats = self._candidate_stats(name, candidate)
+            stats["hits" if hit else "misses"] += 1
+            stats["score"] = stats["score"] * self.decay + (1 - self.decay) * (1 if hit else 0)
+            if hit and elapsed is not None:
+                ms = elapsed * 1000
+                stats["avg_ms"] = ms if stats["avg_ms"] is None else stats["avg_ms"] * 0.8 + ms * 0.2
+            self._unsaved += 1
+            save_now = self._unsaved >= self.save_every
+        if save_now:
+            self.save()
+
+    def record_index(self, name, ordered, index):
+        """
+        Record the result of an in-page lookup that tried ``ordered`` in order
+        and matched ``ordered[index]`` (-1 when nothing matched).
+        """
+        tried = ordered if index < 0 else ordered[:index + 1]
+        for position, candidate in enumerate(tried):
+            self.record(name, candidate, hit=position == index)
+
+    def _find_first(self, context, name, predicate=None, record=True):
+        for candidate in self.ordered(name):
+            start = time.perf_counter()
+            try:
+                elements = context.find_elements(*candidate)
+            except WebDriverException:
+                elements = []
+            element = next((e for e in elements if predicate is None or predicate(e)), None)
+            if record:
+                self.record(name, candidate, element is not None, time.perf_counter() - start)
+            if element is not None:
+                return candidate, element
+        return None, None
+
+    def find(self, context, name, timeout=0, predicate=None, driver=None):
+        """
+        Find the first element matching any candidate of ``name``.
+
+        Candidates are tried best first with find_elements, so a missing
+        candidate costs one round trip rather than a timeout. With a
+        ``timeout``, all candidates are polled together until one matches,
+        so the whole lookup waits at most ``timeout`` seconds.
+
+        Args:
+            context: WebDriver or WebElement to search in
+            name: Registered logical element name
+            timeout: Seconds to wait for any candidate to appear
+            predicate: Optional check an element must pass, e.g. non-empty text
+            driver: WebDriver to wait with when ``context`` is an element
+
+        Returns:
+            WebElement or None
+        """
+        candidate, element = self._find_first(context, name, predicate)
+        if element is not None or not timeout:
+            return element
+
+        # The first pass already recorded a miss for every candidate; while
+        # polling only the candidate that finally appears is recorded
+        def any_candidate(_):
+            found = self._find_first(context, name, predicate, record=False)
+            return found if found[1] is not None else False
+
+        start = time.perf_counter()
+        try:
+            candidate, element = WebDriverWait(driver or context, timeout).until(any_candidate)
+        except TimeoutException:
+            return None
+        self.record(name, candidate, True, time.perf_counter() - start)
+        return element
+
+    def stats(self, name=None):
+        """Return a copy of the stats, for one element or all of them."""
+        with self._lock:
+            stats = json.loads(json.dumps(self._stats))
+        return stats.get(name, {}) if name else stats
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_selector_registry():
+    """Return the process-wide selector registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                registry = SelectorRegistry()
+                atexit.register(registry.save)
+                _registry = registry
+    return _registry
@@ -0,0 +1,222 @@
+import logging
+import threading
+from contextlib import contextmanager
+from selenium.common.exceptions import WebDriverException, TimeoutException
+
+from config.config import SESSION_HEALTH_TIMEOUT, LEAN_MODE_TASKS
+from automation.waits import wait_for_page_ready, get_wait_stats, reset_wait_stats, format_wait_stats
+from automation.instrumented_driver import dump_call_stats
+from automation.lean_mode import lean_mode
+
+logger = logging.getLogger(__name__)
+
+# Closes any LinkedIn modal left open by a previous task
+DISMISS_MODALS_SCRIPT = """
+const buttons = document.querySelectorAll(
+    '.artdeco-modal button[aria-label="Dismiss"], .artdeco-modal__dismiss, ' +
+    '.msg-overlay-bubble-header__control--close-btn'
+);
+buttons.forEach((button) => button.click());
+return buttons.length;
+"""
+
+
+class SessionManager:
+    """
+    Owns one long-lived WebDriver shared by every GUI tab and task.
+
+    The driver is created lazily, health-checked before reuse and recreated
+    (and logged back in) only when the browser session has died.
+
+    Args:
+        driver_factory: Callable returning a new WebDriver (create_driver by default)
+        health_timeout: Seconds the window has to answer a health check
+    """
+
+    def __init__(self, driver_factory=None, health_timeout=SESSION_HEALTH_TIMEOUT):
+        if driver_factory is None:
+            from automation.linkedin_automation import create_driver
+            driver_factory = create_driver
+        self.driver_factory = driver_factory
+        self.health_timeout = health_timeout
+        self.logged_in = False
+        self._driver = None
+        self._credentials = None
+        self._lock = threading.RLock()
+
+    @property
+    def driver(self):
+        """The current driver, or None if no browser has been started."""
+        return self._driver
+
+    def start(self):
+        """Start the browser if it is not running yet and return the driver."""
+        with self._lock:
+            if self._driver is None:
+                self._driver = self.driver_factory()
+            return self._driver
+
+    # -------------------------------------------------------------------
+    # Health checks
+    # -------------------------------------------------------------------
+    def is_alive(self):
+        """Return True if the WebDriver session still has an open window."""
+        if self._driver is None:
+            return False
+        try:
+            return bool(self._driver.window_handles)
+        except WebDriverException:
+            return False
+
+    def is_responsive(self):
+        """Return True if the page answers a trivial script within health_timeout."""
+        if self._driver is None:
+            return False
+        try:
+            self._driver.set_script_timeout(self.health_timeout)
+            state = self._driver.execute_async_script(
+                "arguments[arguments.length - 1](document.readyState);"
+            )
+            return state is not None
+        except (TimeoutException, WebDriverException):
+            return False
+
+    def is_healthy(self):
+        return self.is_alive() and self.is_responsive()
+
+    def ensure_healthy(self):
+        """
+        Make sure a usable driver exists, reconnecting if the session died.
+
+        Returns:
+            WebDriver: A healthy driver
+        """
+        with self._lock:
+            if self._driver is None:
+                return self.start()
+            if self.is_healthy():
+                return self._driver
+            logger.warning("Browser session is not responding, reconnecting...")
+            return self.reconnect()
+
+    # -------------------------------------------------------------------
+    # Session lifecycle
+    # -------------------------------------------------------------------
+    def login(self, username, password):
+        """
+        Log in with the shared driver, starting the browser if needed. The
+        credentials are kept so a reconnect can log back in.
+
+        Returns:
+            bool: True if logged in
+        """
+        from automation.linkedin_automation import login_linkedin
+
+        with self._lock:
+            driver = self.ensure_healthy()
+            self.logged_in = login_linkedin(driver, username, password)
+            if self.logged_in:
+                self._credentials = (username, password)
+            return self.logged_in
+
+    def soft_reset(self, url=None):
+        """
+        Cheap reset between tasks: close stray windows and tabs, dismiss open
+        modals and optionally navigate to ``url``. The browser is not restarted.
+        """
+        with self._lock:
+            driver = self.ensure_healthy()
+            try:
+                handles = driver.window_handles
+                for handle in handles[1:]:
+                    driver.switch_to.window(handle)
+                    driver.close()
+                driver.switch_to.window(handles[0])
+                driver.execute_script(DISMISS_MODALS_SCRIPT)
+                if url and driver.current_url.rstrip("/") != url.rstrip("/"):
+                    driver.get(url)
+                    wait_for_page_ready(driver)
+            except WebDriverException as e:
+                logger.warning(f"Soft reset failed, reconnecting: {e}")
+                driver = self.reconnect()
+            return driver
+
+    @contextmanager
+    def task(self, url=None, name="task", lean=None, log_callback=None):
+        """
+        Run one automation task on the shared driver.
+
+        The session is health-checked and soft-reset first, and held for the
+        duration of the task so background checks never interleave with it.
+        When the task ends the time spent in each wait step is logged and,
+        if the driver is instrumented, its WebDriver call stats are dumped
+        under ``name``.
+
+        Args:
+            url: Optional page to start the task on
+            name: Task name used in reports
+            lean: Block images, video, fonts and trackers during the task;
+                defaults to whether ``name`` is in LEAN_MODE_TASKS. Only for
+                read-only tasks; tasks that also write (like engage_feed)
+                scope lean mode to their reading steps instead
+            log_callback: Optional callback(message, level) for the lean mode report
+
+        Yields:
+            WebDriver: The shared driver
+        """
+        if lean is None:
+            lean = name in LEAN_MODE_TASKS
+        with self._lock:
+            driver = self.soft_reset(url)
+            reset_wait_stats()
+            try:
+                with lean_mode(driver, enabled=lean, log_callback=log_callback):
+                    yield driver
+            finally:
+                if get_wait_stats():
+                    logger.info(f"Wait steps for {name}:\n{format_wait_stats()}")
+                dump_call_stats(driver, name)
+
+    def check_idle(self):
+        """
+        Health-check the session unless a task is currently using it.
+
+        Returns:
+            bool: True if a check ran (reconnecting if needed), False if busy
+        """
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            self.ensure_healthy()
+            return True
+        finally:
+            self._lock.release()
+
+    def reconnect(self):
+        """Replace a dead driver with a new one and log back in if we were logged in."""
+        with self._lock:
+            self._quit()
+            self._driver = self.driver_factory()
+            if self._credentials:
+                from automation.linkedin_automation import login_linkedin
+                self.logged_in = login_linkedin(self._driver, *self._credentials)
+            else:
+                self.logged_in = False
+            return self._driver
+
+    def _quit(self):
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception as e:
+                logger.warning(f"Error closing browser: {e}")
+            self._driver = None
+
+    def close(self):
+        """
+        Quit the browser and forget the login. Does not wait for a running
+        task, so closing the window never hangs on a busy browser.
+        """
+        self._credentials = None
+        self.logged_in = False
+        self._quit()
@@ -0,0 +1,226 @@
+import time
+import random
+import threading
+from contextlib import contextmanager
+from selenium.common.exceptions import TimeoutException, WebDriverException, StaleElementReferenceException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from utils import tracing
+from config.config import (
+    WAIT_TIMEOUT,
+    WAIT_POLL_INTERVAL,
+    NETWORK_IDLE_TIME,
+    MIN_DWELL_SECONDS,
+    MAX_DWELL_SECONDS,
+)
+
+# -------------------------------------------------------------------
+# Per-step timing stats
+# -------------------------------------------------------------------
+_stats_lock = threading.Lock()
+_step_stats = {}
+
+
+def record_step(step, elapsed, timed_out=False):
+    """Record how long a wait step took."""
+    with _stats_lock:
+        stats = _step_stats.setdefault(step, {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0})
+        stats["count"] += 1
+        stats["total"] += elapsed
+        stats["max"] = max(stats["max"], elapsed)
+        if timed_out:
+            stats["timeouts"] += 1
+
+
+@contextmanager
+def timed_step(step):
+    """Time the enclosed block and record it under ``step``."""
+    start = time.perf_counter()
+    timed_out = False
+    try:
+        yield
+    except TimeoutException:
+        timed_out = True
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        record_step(step, elapsed, timed_out)
+        tracing.record(step, "wait", start, elapsed, **({"timed_out": True} if timed_out else {}))
+
+
+def get_wait_stats():
+    """Return a copy of the per-step stats with the mean added."""
+    with _stats_lock:
+        return {
+            step: dict(stats, mean=stats["total"] / stats["count"] if stats["count"] else 0.0)
+            for step, stats in _step_stats.items()
+        }
+
+
+def reset_wait_stats():
+    with _stats_lock:
+        _step_stats.clear()
+
+
+def format_wait_stats():
+    """Return the per-step stats as a printable table."""
+    stats = get_wait_stats()
+    if not stats:
+        return "No wait steps recorded."
+    lines = [f"{'step':<28}{'count':>7}{'mean s':>9}{'max s':>9}{'total s':>10}{'timeouts':>10}"]
+    for step, row in sorted(stats.items(), key=lambda item: -item[1]["total"]):
+        lines.append(
+            f"{step:<28}{row['count']:>7}{row['mean']:>9.2f}{row['max']:>9.2f}"
+            f"{row['total']:>10.2f}{row['timeouts']:>10}"
+        )
+    return "\n".join(lines)
+
+
+# -------------------------------------------------------------------
+# Condition-driven waits
+# -------------------------------------------------------------------
+def _wait(driver, timeout):
+    return WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_INTERVAL)
+
+
+def wait_for_page_ready(driver, timeout=WAIT_TIMEOUT, step="page_ready"):
+    """Wait until ``document.readyState`` is "complete". Returns False on timeout."""
+    try:
+        with timed_step(step):
+            _wait(driver, timeout).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+        return True
+    except TimeoutException:
+        return False
+
+
+def wait_for_element(driver, locator, timeout=WAIT_TIMEOUT, clickable=False, step=None):
+    """
+    Wait for an element to be present (or clickable) and return it.
+
+    Raises:
+        TimeoutException: If the element does not appear in time
+    """
+    condition = EC.element_to_be_clickable(locator) if clickable else EC.presence_of_element_located(locator)
+    with timed_step(step or ("element_clickable" if clickable else "element_present")):
+        return _wait(driver, timeout).until(condition)
+
+
+def wait_for_element_stable(driver, element, timeout=WAIT_TIMEOUT, step="element_stable"):
+    """
+    Wait until an element stops moving, e.g. after a smooth scroll or an
+    animated layout change. Returns False on timeout or if it went stale.
+    """
+    last_rect = [None]
+
+    def is_stable(d):
+        rect = d.execute_script(
+            "const r = arguments[0].getBoundingClientRect(); return [r.x, r.y, r.width, r.height];",
+            element,
+        )
+        stable = rect == last_rect[0]
+        last_rect[0] = rect
+        return stable
+
+    try:
+        with timed_step(step):
+            _wait(driver, timeout).until(is_stable)
+        return True
+    except (TimeoutException, StaleElementReferenceException):
+        return False
+
+
+def scroll_into_view(driver, element, timeout=WAIT_TIMEOUT):
+    """Scroll an element to the middle of the viewport and wait until it settles."""
+    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+    return wait_for_element_stable(driver, element, timeout, step="scroll_into_view")
+
+
+def wait_for_modal_open(driver, timeout=WAIT_TIMEOUT, step="modal_open"):
+    """Wait for a visible dialog or artdeco modal. Returns False on timeout."""
+    script = """
+        const modals = document.querySelectorAll('[role="dialog"], .artdeco-modal');
+        return Array.from(modals).some((el) => el.offsetParent !== null || el.getClientRects().length > 0);
+    """
+    try:
+        with timed_step(step):
+            _wait(driver, timeout).until(lambda d: d.execute_script(script))
+        return True
+    except TimeoutException:
+        return False
+
+
+# Counts in-flight fetch/XHR requests and the time since the last network
+# activity. The hooks are installed once per document.
+NETWORK_PROBE_SCRIPT = """
+const probe = window.__automatorNetworkProbe || (function () {
+    const state = { pending: 0, last: performance.now() };
+    const done = () => { state.pending = Math.max(0, state.pending - 1); state.last = performance.now(); };
+    const originalFetch = window.fetch;
+    if (originalFetch) {
+        window.fetch = function () {
+            state.pending++;
+            state.last = performance.now();
+            return originalFetch.apply(this, arguments).finally(done);
+        };
+    }
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        state.pending++;
+        state.last = performance.now();
+        this.addEventListener('loadend', done, { once: true });
+        return originalSend.apply(this, arguments);
+    };
+    window.__automatorNetworkProbe = state;
+    return state;
+})();
+const resources = performance.getEntriesByType('resource');
+const lastResource = resources.length ? resources[resources.length - 1].responseEnd : 0;
+const last = Math.max(probe.last, lastResource);
+return { pending: probe.pending, idle_ms: performance.now() - last, resources: resources.length };
+"""
+
+
+def wait_for_network_idle(driver, idle_time=NETWORK_IDLE_TIME, timeout=WAIT_TIMEOUT, step="network_idle"):
+    """
+    Wait until no fetch/XHR request is in flight and no resource has finished
+    loading for ``idle_time`` seconds. Returns False on timeout.
+    """
+    def is_idle(d):
+        state = d.execute_script(NETWORK_PROBE_SCRIPT)
+        return state["pending"] == 0 and state["idle_ms"] >= idle_time * 1000
+
+    try:
+        with timed_step(step):
+            _wait(driver, timeout).until(is_idle)
+        return True
+    except (TimeoutException, WebDriverException):
+        return False
+
+
+def wait_for_page_settled(driver, timeout=WAIT_TIMEOUT):
+    """Wait for the document to load and its follow-up requests to finish."""
+    ready = wait_for_page_ready(driver, timeout)
+    return wait_for_network_idle(driver, timeout=timeout) and ready
+
+
+# -------------------------------------------------------------------
+# Explicit human-like pauses
+# -------------------------------------------------------------------
+def dwell(min_seconds=None, max_seconds=None):
+    """
+    Pause for a random human-like interval between MIN_DWELL_SECONDS and
+    MAX_DWELL_SECONDS. This is the only intentional fixed delay; everything
+    else should wait on a page condition.
+    """
+    low = MIN_DWELL_SECONDS if min_seconds is None else min_seconds
+    high = MAX_DWELL_SECONDS if max_seconds is None else max_seconds
+    if high <= 0:
+        return
+    start = time.perf_counter()
+    time.sleep(random.uniform(low, max(low, high)))
+    elapsed = time.perf_counter() - start
+    record_step("dwell", elapsed)
+    tracing.record("dwell", "pause", start, elapsed)
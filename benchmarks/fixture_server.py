@@ -0,0 +1,108 @@
+"""
+Local HTTP server for the benchmark fixture pages.
+
+Serves the synthetic snapshots in benchmarks/fixtures under the same paths
+the automation uses on LinkedIn, so scraping code can run against
+http://127.0.0.1:<port>/feed/ and friends without network access.
+
+Usage:
+    python -m benchmarks.fixture_server [--port 8765] [--latency 0.05]
+"""
+import os
+import time
+import base64
+import argparse
+import threading
+from urllib.parse import urlsplit
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# LinkedIn path -> fixture file
+ROUTES = {
+    "/mynetwork/": "network.html",
+    "/messaging/": "messaging.html",
+    "/feed/": "feed.html",
+    "/search/results/people/": "search.html",
+}
+
+# Default delay of the /ping endpoint the pages call before loading more items
+DEFAULT_LATENCY = 0.05
+
+# Stand-in for post images under /media/: a 1x1 GIF padded to a realistic size
+MEDIA_IMAGE_BYTES = 150_000
+_GIF = base64.b64decode("R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7")
+MEDIA_IMAGE = _GIF + b"\0" * (MEDIA_IMAGE_BYTES - len(_GIF))
+
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    latency = DEFAULT_LATENCY
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=FIXTURE_DIR, **kwargs)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/ping":
+            time.sleep(self.latency)
+            self.send_response(204)
+            self.end_headers()
+            return
+        if path.startswith("/media/"):
+            self.send_response(200)
+            self.send_header("Content-Type", "image/gif")
+            self.send_header("Content-Length", str(len(MEDIA_IMAGE)))
+            self.end_headers()
+            self.wfile.write(MEDIA_IMAGE)
+            return
+        if path in ROUTES:
+            self.path = "/" + ROUTES[path]
+        super().do_GET()
+
+    def end_headers(self):
+        # Every run should load the fixtures fresh
+        self.send_header("Cache-Control", "no-store")
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fixture_server(port=0, latency=DEFAULT_LATENCY):
+    """
+    Start the fixture server in a background thread.
+
+    Args:
+        port: Port to listen on (0 picks a free one)
+        latency: Seconds the /ping endpoint waits before answering
+
+    Returns:
+        tuple: (server, base_url); call server.shutdown() to stop it
+    """
+    handler = type("ConfiguredFixtureHandler", (FixtureHandler,), {"latency": latency})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the benchmark fixture pages")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY,
+                        help="Seconds the /ping endpoint waits before answering")
+    args = parser.parse_args()
+
+    server, base_url = start_fixture_server(args.port, args.latency)
+    print(f"Serving fixtures on {base_url}")
+    for path in ROUTES:
+        print(f"  {base_url}{path}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+// Renders the items of a fixture page from its <template> and appends one
+// more page whenever the window is scrolled to the bottom. Each extra page
+// waits for a request to /ping first, so network-idle waits see real traffic.
+(function () {
+    const list = document.querySelector('[data-fixture-list]');
+    const template = document.getElementById('item-template');
+    const perPage = Number(list.dataset.perPage);
+    const pages = Number(list.dataset.pages);
+    let loadedPages = 0;
+    let loading = false;
+    let count = 0;
+
+    function renderPage() {
+        const html = [];
+        for (let i = 0; i < perPage; i++) {
+            count++;
+            html.push(template.innerHTML.replace(/\{\{n\}\}/g, count));
+        }
+        list.insertAdjacentHTML('beforeend', html.join(''));
+        loadedPages++;
+    }
+
+    renderPage();
+    window.addEventListener('scroll', function () {
+        if (loading || loadedPages >= pages) return;
+        if (window.innerHeight + window.scrollY < document.body.scrollHeight - 200) return;
+        loading = true;
+        fetch('/ping?page=' + loadedPages).then(function () {
+            renderPage();
+            loading = false;
+        });
+    });
+})();
@@ -0,0 +1,240 @@
+"""
+Benchmark the scraping functions against the local fixture pages.
+
+Starts the fixture server and a headless Chrome, then runs each benchmark
+``--runs`` times and reports wall time, WebDriver round trips and element
+lookups per function. AI calls go to a StubBackend and human-like dwell
+pauses are turned off (unless --dwell), so the numbers only reflect the
+automation itself and need no network access. Round trips are counted by
+the instrumented driver; --sites also prints them per call site, along
+with the time spent in each wait step. After each
+run the bytes the page transferred and the resident memory of all Chrome
+processes (Linux only) are recorded, so load_feed and load_feed[lean] show
+what lean mode saves.
+
+Usage:
+    python -m benchmarks.run_benchmarks [--runs 3] [--only process_post] [--json results.json]
+"""
+import sys
+import json
+import time
+import argparse
+import statistics
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.service import Service
+
+from ai.backends import StubBackend, set_backend
+from automation import waits
+from automation.connection_requester import get_connection_sections
+from automation.message_bot import get_contacts
+from automation.feed_scroller import process_post, create_post_loader
+from automation.linkedin_automation import scroll_and_collect_profiles
+from automation.instrumented_driver import instrument_driver, LOOKUP_LABELS
+from automation.driver_manager import get_driver_pids
+from automation.lean_mode import lean_mode
+from benchmarks.fixture_server import start_fixture_server, DEFAULT_LATENCY
+
+
+def create_benchmark_driver(chromedriver=None):
+    """Start a headless Chrome with a throwaway profile."""
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--window-size=1920,1080")
+    service = Service(chromedriver) if chromedriver else Service()
+    return webdriver.Chrome(service=service, options=options)
+
+
+def _quiet_log(message, level="info"):
+    pass
+
+
+# Bytes the current page transferred: the document and every resource it
+# loaded (blocked requests never show up here)
+TRANSFER_SIZE_SCRIPT = """
+const entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+return entries.reduce((total, entry) => total + (entry.transferSize || 0), 0);
+"""
+
+
+def chrome_rss_mb(driver):
+    """Resident memory of all Chrome processes of the driver in MB, or None where /proc is missing."""
+    total_kb = 0
+    for pid in get_driver_pids(driver):
+        try:
+            with open(f"/proc/{pid}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+    return total_kb / 1024 if total_kb else None
+
+
+# -------------------------------------------------------------------
+# Benchmarks
+# Each setup function loads its page (not measured) and returns the call
+# to measure; the call returns the number of items it produced.
+# -------------------------------------------------------------------
+def setup_connection_sections(driver, base_url, args, mode="script"):
+    driver.get(base_url + "/mynetwork/")
+    return lambda: len(get_connection_sections(driver, _quiet_log, mode=mode))
+
+
+def setup_connection_sections_elements(driver, base_url, args):
+    return setup_connection_sections(driver, base_url, args, mode="elements")
+
+
+def setup_get_contacts(driver, base_url, args):
+    driver.get(base_url + "/messaging/")
+    return lambda: len(get_contacts(driver))
+
+
+def setup_process_post(driver, base_url, args):
+    driver.get(base_url + "/feed/")
+    post = driver.find_element(By.CSS_SELECTOR, "div.feed-shared-update-v2")
+
+    def run():
+        success, post_id, _ = process_post(
+            driver, post, 1, _quiet_log, lambda summary, index, author: (args.feed_action, None)
+        )
+        return 1 if success and post_id else 0
+    return run
+
+
+def setup_load_feed(driver, base_url, args, lean=False):
+    # Start from a blank page so every run loads the feed and its images anew
+    driver.get("about:blank")
+
+    def run():
+        with lean_mode(driver, enabled=lean, log_callback=lambda message, level: print(message, file=sys.stderr)):
+            driver.get(base_url + "/feed/")
+            loader, _ = create_post_loader(driver)
+            try:
+                return len(loader.load(args.max_posts))
+            finally:
+                loader.stop()
+    return run
+
+
+def setup_load_feed_lean(driver, base_url, args):
+    return setup_load_feed(driver, base_url, args, lean=True)
+
+
+def setup_scroll_and_collect_profiles(driver, base_url, args):
+    driver.get(base_url + "/search/results/people/")
+    return lambda: len(scroll_and_collect_profiles(driver, max_profiles=args.max_profiles))
+
+
+BENCHMARKS = {
+    "get_connection_sections": setup_connection_sections,
+    "get_connection_sections[elements]": setup_connection_sections_elements,
+    "get_contacts": setup_get_contacts,
+    "process_post": setup_process_post,
+    "load_feed": setup_load_feed,
+    "load_feed[lean]": setup_load_feed_lean,
+    "scroll_and_collect_profiles": setup_scroll_and_collect_profiles,
+}
+
+
+def run_benchmark(name, setup, driver, base_url, args):
+    """Run one benchmark ``args.runs`` times and return its summary."""
+    stats = driver.call_stats
+    samples = []
+    for _ in range(args.runs):
+        measured = setup(driver, base_url, args)
+        stats.reset()
+        waits.reset_wait_stats()
+        start = time.perf_counter()
+        items = measured()
+        elapsed = time.perf_counter() - start
+        samples.append({
+            "wall_ms": elapsed * 1000,
+            "round_trips": stats.count(),
+            "lookups": stats.count(LOOKUP_LABELS),
+            "items": items,
+            "commands": stats.by_command(),
+            "call_sites": stats.rows(),
+            "wait_steps": waits.get_wait_stats(),
+        })
+        samples[-1]["wait_ms"] = sum(step["total"] for step in samples[-1]["wait_steps"].values()) * 1000
+        samples[-1]["transfer_kb"] = (driver.execute_script(TRANSFER_SIZE_SCRIPT) or 0) / 1024
+        samples[-1]["chrome_mb"] = chrome_rss_mb(driver)
+    if args.sites:
+        print(f"{name}:\n{stats.format()}\n{waits.format_wait_stats()}", file=sys.stderr)
+    return {
+        "name": name,
+        "runs": len(samples),
+        "wall_ms": statistics.median(s["wall_ms"] for s in samples),
+        "wall_ms_min": min(s["wall_ms"] for s in samples),
+        "round_trips": statistics.median(s["round_trips"] for s in samples),
+        "lookups": statistics.median(s["lookups"] for s in samples),
+        "wait_ms": statistics.median(s["wait_ms"] for s in samples),
+        "transfer_kb": statistics.median(s["transfer_kb"] for s in samples),
+        "chrome_mb": samples[-1]["chrome_mb"],
+        "items": samples[-1]["items"],
+        "commands": samples[-1]["commands"],
+        "call_sites": samples[-1]["call_sites"],
+        "wait_steps": samples[-1]["wait_steps"],
+    }
+
+
+def format_results(results):
+    lines = [
+        f"{'function':<36}{'items':>7}{'round trips':>13}{'lookups':>9}{'median ms':>11}{'min ms':>9}"
+        f"{'wait ms':>9}{'page KB':>10}{'Chrome MB':>11}"
+    ]
+    for result in results:
+        chrome_mb = f"{result['chrome_mb']:>11.0f}" if result["chrome_mb"] is not None else f"{'-':>11}"
+        lines.append(
+            f"{result['name']:<36}{result['items']:>7}{result['round_trips']:>13g}{result['lookups']:>9g}"
+            f"{result['wall_ms']:>11.1f}{result['wall_ms_min']:>9.1f}{result['wait_ms']:>9.1f}{result['transfer_kb']:>10.0f}{chrome_mb}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark scraping functions against local fixture pages")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per benchmark (the median is reported)")
+    parser.add_argument("--only", action="append", choices=sorted(BENCHMARKS), help="Run only these benchmarks")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    parser.add_argument("--chromedriver", help="Path to chromedriver (defaults to the one Selenium finds)")
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY,
+                        help="Seconds the fixture server takes to answer load-more requests")
+    parser.add_argument("--max-profiles", type=int, default=30, help="max_profiles for scroll_and_collect_profiles")
+    parser.add_argument("--max-posts", type=int, default=20, help="Posts load_feed loads")
+    parser.add_argument("--feed-action", default="like", choices=["like", "skip"], help="Action process_post takes")
+    parser.add_argument("--dwell", action="store_true", help="Keep the human-like dwell pauses")
+    parser.add_argument("--sites", action="store_true", help="Print per-call-site WebDriver stats of the last run")
+    args = parser.parse_args(argv)
+
+    if not args.dwell:
+        waits.MIN_DWELL_SECONDS = waits.MAX_DWELL_SECONDS = 0
+    set_backend(StubBackend(default="Synthetic summary of a fixture post."))
+
+    server, base_url = start_fixture_server(latency=args.latency)
+    driver = instrument_driver(create_benchmark_driver(args.chromedriver))
+    results = []
+    try:
+        for name in args.only or BENCHMARKS:
+            print(f"Running {name}...", file=sys.stderr)
+            results.append(run_benchmark(name, BENCHMARKS[name], driver, base_url, args))
+    finally:
+        driver.quit()
+        server.shutdown()
+
+    print(format_results(results))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
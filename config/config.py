@@ -3,3 +3,73 @@
 RETRY_LIMIT = 3
 HEADLESS = False  # Set to True if running on server
 LOGIN_URL = "https://www.linkedin.com/login"
+
+# Action journal (utils/logger.py)
+ACTION_LOG_FSYNC = "interval"  # "always", "interval" or "never"
+ACTION_LOG_FSYNC_INTERVAL = 5  # Seconds between fsyncs when the policy is "interval"
+ACTION_LOG_MAX_BYTES = 5 * 1024 * 1024  # Rotate the journal once it grows past this size
+ACTION_LOG_BACKUP_COUNT = 5  # Number of rotated journal files to keep
+
+# Contact state store (utils/contact_store.py)
+CONTACT_STORE_BATCH_SIZE = 20  # Commit after this many pending writes
+CONTACT_STORE_COMMIT_INTERVAL = 2  # ...or once this many seconds have passed since the last commit
+
+# Condition-driven waits (automation/waits.py)
+WAIT_TIMEOUT = 10  # Default upper bound in seconds for page/element/network waits
+WAIT_POLL_INTERVAL = 0.1  # Seconds between condition checks
+NETWORK_IDLE_TIME = 0.5  # Seconds without network activity before the page counts as idle
+# Explicit human-like pause between actions, independent of page readiness.
+# Set both to 0 to run as fast as the page allows.
+MIN_DWELL_SECONDS = 0.5
+MAX_DWELL_SECONDS = 1.5
+
+# Chrome driver startup (automation/driver_manager.py)
+DRIVER_PROCESS_EXIT_TIMEOUT = 5  # Max seconds to wait for leftover Chrome processes to exit
+
+# Shared browser session (automation/session_manager.py)
+SESSION_HEALTH_TIMEOUT = 5  # Seconds the browser window has to answer a health check
+
+# AI response cache (ai/response_cache.py)
+AI_CACHE_ENABLED = True
+AI_CACHE_TTL = 7 * 24 * 60 * 60  # Seconds a cached response stays valid
+AI_CACHE_MAX_ENTRIES = 1000  # Least recently used responses are evicted past this
+
+# Concurrent AI calls (ai/ai_generator.py)
+AI_MAX_CONCURRENCY = 4  # Max model calls in flight at once
+AI_CALL_TIMEOUT = 30  # Seconds before a single model call is abandoned
+
+# Image preprocessing before upload (ai/image_preprocessor.py)
+AI_IMAGE_MAX_EDGE = 1024  # Longest edge in pixels of images sent to the model
+AI_IMAGE_QUALITY = 85  # JPEG quality of the re-encoded image
+AI_IMAGE_CACHE_MAX_FILES = 200  # Oldest processed images are removed past this
+
+# GUI startup (gui/run_gui.py); also enabled with --startup-report
+STARTUP_REPORT = False  # Print per-phase and per-module import timings at startup
+STARTUP_REPORT_MODULES = 30  # Modules listed in the per-module import table, slowest first
+
+# GUI log panes (gui/log_sink.py)
+GUI_LOG_MAX_LINES = 5000  # Lines kept per log pane widget; older lines are removed from the widget
+GUI_LOG_HISTORY_SIZE = 5000  # Log records kept in memory per pane; older ones spill to logs/gui/
+GUI_LOG_FLUSH_MS = 50  # Milliseconds between batched writes to a log pane
+GUI_LOG_LOAD_OLDER = 500  # Earlier log records shown per click on a pane's "Load older" button
+
+# Incremental loading of infinite-scroll lists (automation/incremental_loader.py)
+LOADER_MAX_SCROLLS = 30  # Most scrolls spent loading one list
+LOADER_MAX_IDLE_SCROLLS = 3  # Stop after this many scrolls in a row load nothing new
+
+# Selector registry (automation/selector_registry.py)
+SELECTOR_SCORE_DECAY = 0.8  # Weight of the old score per lookup; lower adapts faster to a selector breaking
+SELECTOR_STATS_SAVE_EVERY = 50  # Save logs/selector_stats.json after this many lookups (and at exit)
+
+# Tracing (utils/tracing.py); also enabled with --trace
+TRACING_ENABLED = False  # Record spans of each task run to logs/traces/ and print a summary
+TRACE_SUMMARY_ROWS = 25  # Spans listed in the printed summary table
+
+# WebDriver call instrumentation (automation/instrumented_driver.py)
+INSTRUMENT_DRIVER = False  # Count and time WebDriver calls per call site; dumped after each task
+INSTRUMENT_MAX_SAMPLES = 2000  # Latency samples kept per call site for the percentiles
+INSTRUMENT_REPORT_ROWS = 30  # Call sites listed in a dump
+
+# Lean mode (automation/lean_mode.py)
+LEAN_MODE_BLOCK = ("image", "media", "font", "tracker")  # Resource categories blocked while a task runs lean
+LEAN_MODE_TASKS = ("load_contacts", "read_feed", "find_alumni")  # Read-only steps that run lean; others load pages normally
@@ -1,9 +1,13 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
-from automation.connection_requester import process_connections, reset_counters
+from utils.lazy_import import lazy_import
+from .log_sink import LogSink
 from .utils import create_scrollable_frame, create_tooltip
 
+# Selenium is only imported once a task actually runs
+connection_requester = lazy_import("automation.connection_requester")
+
 class ConnectionTab:
     def __init__(self, parent, app):
         self.parent = parent
@@ -87,13 +91,20 @@ class ConnectionTab:
         log_frame = ttk.LabelFrame(frame, text="Connection Progress")
         log_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
+        log_filter_frame = ttk.Frame(log_frame)
+        log_filter_frame.pack(fill=tk.BOTH, expand=False, padx=5, pady=5)
+
         self.connection_log_text = tk.Text(log_frame, height=15, width=50, wrap=tk.WORD, state='disabled')
         self.connection_log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
         connection_log_scrollbar = ttk.Scrollbar(log_frame, command=self.connection_log_text.yview)
         connection_log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.connection_log_text.config(yscrollcommand=connection_log_scrollbar.set)
 
-        self.connection_log_messages = []
+        self.connection_log = LogSink(self.app.root, self.connection_log_text, name="connection")
+
+        connection_older_button = ttk.Button(log_filter_frame, text="Load older", command=self.connection_log.load_older)
+        connection_older_button.pack(side=tk.RIGHT, padx=5)
+        create_tooltip(connection_older_button, "Show earlier log lines that were removed from this pane")
 
         self.decision_var = tk.StringVar()
         self.running = False
@@ -106,27 +117,7 @@ class ConnectionTab:
         if "👤" in message:
             return
 
-        prefix = "✨ "
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-
-        if clear:
-            self.connection_log_messages = []
-
-        self.connection_log_messages.append((timestamp, message, level, prefix))
-
-        self.connection_log_text.config(state='normal')
-
-        if clear:
-            self.connection_log_text.delete(1.0, tk.END)
-
-        if message:
-            formatted_message = f"[{timestamp}] {prefix}{message}\n"
-            self.connection_log_text.insert(tk.END, formatted_message)
-
-        self.connection_log_text.see(tk.END)
-        self.connection_log_text.config(state='disabled')
-        self.app.root.update_idletasks()
+        self.connection_log.push(message, level=level, clear=clear)
 
     def output_callback(self, message, level="info"):
         self.connection_log_message(message, level=level)
@@ -183,7 +174,7 @@ class ConnectionTab:
         max_requests = self.max_requests_var.get()
 
         self.running = True
-        reset_counters()
+        connection_requester.reset_counters()
 
         # Pack the connection_actions_frame in the correct position (after config_frame)
         self.connection_actions_frame.pack(fill=tk.BOTH, expand=False, padx=10, pady=10, after=self.config_frame)
@@ -197,13 +188,14 @@ class ConnectionTab:
                 def log_callback(message, level="info"):
                     self.connection_log_message(message, level=level)
 
-                processed_count = process_connections(
-                    self.app.driver,
-                    max_requests=max_requests,
-                    output_callback=self.output_callback,
-                    decision_callback=self.decision_callback,
-                    counter_callback=None
-                )
+                with self.app.session.task(name="process_connections") as driver:
+                    processed_count = connection_requester.process_connections(
+                        driver,
+                        max_requests=max_requests,
+                        output_callback=self.output_callback,
+                        decision_callback=self.decision_callback,
+                        counter_callback=None
+                    )
 
                 if processed_count > 0:
                     self.connection_log_message(
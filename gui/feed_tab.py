@@ -3,9 +3,13 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
 from queue import Queue
-from automation.feed_scroller import engage_feed
+from utils.lazy_import import lazy_import
+from .log_sink import LogSink
 from .utils import create_scrollable_frame, create_tooltip
-from PIL import Image, ImageTk
+from .image_cache import load_photo
+
+# Selenium is only imported once a task actually runs
+feed_scroller = lazy_import("automation.feed_scroller")
 
 class FeedTab:
     def __init__(self, parent, app):
@@ -56,7 +60,11 @@ class FeedTab:
         feed_log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.feed_log_text.config(yscrollcommand=feed_log_scrollbar.set)
 
-        self.feed_log_messages = []
+        self.feed_log = LogSink(self.app.root, self.feed_log_text, self.feed_log_level_var, name="feed")
+
+        feed_older_button = ttk.Button(log_filter_frame, text="Load older", command=self.feed_log.load_older)
+        feed_older_button.pack(side=tk.RIGHT, padx=5)
+        create_tooltip(feed_older_button, "Show earlier log lines that were removed from this pane")
 
     def check_login_status(self):
         if not self.app.is_logged_in or not self.app.driver:
@@ -65,64 +73,10 @@ class FeedTab:
         return True
 
     def update_feed_log_display(self, event=None):
-        selected_level = self.feed_log_level_var.get()
-
-        self.feed_log_text.config(state='normal')
-        self.feed_log_text.delete(1.0, tk.END)
-
-        for timestamp, message, level, prefix in self.feed_log_messages:
-            show = False
-            if selected_level == "debug":
-                show = True
-            elif selected_level == "info" and level != "debug":
-                show = True
-            elif selected_level == "user" and level == "user":
-                show = True
-
-            if show:
-                formatted_message = f"[{timestamp}] {prefix}{message}\n"
-                self.feed_log_text.insert(tk.END, formatted_message)
-
-        self.feed_log_text.config(state='disabled')
-        self.feed_log_text.see(tk.END)
+        self.feed_log.refilter()
 
     def feed_log_message(self, message, clear=False, level="info"):
-        if level == "user":
-            prefix = "✨ "
-        elif level == "debug":
-            prefix = "🔍 "
-        else:
-            prefix = ""
-
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-
-        if clear:
-            self.feed_log_messages = []
-
-        self.feed_log_messages.append((timestamp, message, level, prefix))
-
-        selected_level = self.feed_log_level_var.get()
-        show_message = False
-        if selected_level == "debug":
-            show_message = True
-        elif selected_level == "info" and level != "debug":
-            show_message = True
-        elif selected_level == "user" and level == "user":
-            show_message = True
-
-        self.feed_log_text.config(state='normal')
-
-        if clear:
-            self.feed_log_text.delete("1.0", tk.END)
-
-        if message and show_message:
-            formatted_message = f"[{timestamp}] {prefix}{message}\n"
-            self.feed_log_text.insert(tk.END, formatted_message)
-
-        self.feed_log_text.see(tk.END)
-        self.feed_log_text.config(state='disabled')
-        self.app.root.update_idletasks()
+        self.feed_log.push(message, level=level, clear=clear)
 
     def get_action_input(self, summary, post_index, author_name):
         dialog = tk.Toplevel(self.app.root)
@@ -133,9 +87,7 @@ class FeedTab:
         
         logo_path = "assets/logo.png"
         try:
-            logo_img = Image.open(logo_path)
-            logo_img = logo_img.resize((32, 32), Image.Resampling.LANCZOS)
-            logo_photo = ImageTk.PhotoImage(logo_img)
+            logo_photo = load_photo(logo_path, (32, 32))
             dialog.iconphoto(True, logo_photo)
         except Exception as e:
             print(f"Error loading logo: {e}")
@@ -223,7 +175,8 @@ class FeedTab:
                 def log_callback(message, level="info"):
                     self.feed_log_message(message, level=level)
 
-                engage_feed(self.app.driver, max_posts, get_action_callback, log_callback)
+                with self.app.session.task(name="engage_feed", log_callback=log_callback) as driver:
+                    feed_scroller.engage_feed(driver, max_posts, get_action_callback, log_callback)
                 self.feed_log_message("✅ Feed interaction completed", level="user")
                 self.app.root.after(0, lambda: messagebox.showinfo("Success", "Feed interaction completed"))
                 self.app.status_var.set("Feed interaction completed")
@@ -0,0 +1,47 @@
+# gui/image_cache.py
+import os
+from PIL import Image, ImageTk
+
+# Shared PhotoImage objects keyed by (path, mtime, size, fit). Holding the
+# references here also keeps Tk from dropping images that are still shown.
+_photos = {}
+
+
+def load_photo(path, size, fit=False):
+    """
+    Return a shared PhotoImage for ``path`` resized to ``size``.
+
+    Each (path, size) pair is decoded and resized once per process; later
+    calls return the same PhotoImage. A file that changed on disk is loaded
+    again. Must be called from the Tk thread.
+
+    Args:
+        path: Image file path
+        size: (width, height) in pixels
+        fit: Keep the aspect ratio and fit inside ``size`` instead of
+            resizing to exactly ``size``
+
+    Returns:
+        ImageTk.PhotoImage: The resized image
+
+    Raises:
+        OSError: If the image cannot be opened
+    """
+    path = os.path.abspath(path)
+    key = (path, os.path.getmtime(path), tuple(size), fit)
+    photo = _photos.get(key)
+    if photo is None:
+        with Image.open(path) as image:
+            if fit:
+                image.draft("RGB", size)
+                image = image.copy()
+                image.thumbnail(size, Image.Resampling.LANCZOS)
+            else:
+                image = image.resize(size, Image.Resampling.LANCZOS)
+        photo = ImageTk.PhotoImage(image)
+        _photos[key] = photo
+    return photo
+
+
+def clear_photo_cache():
+    _photos.clear()
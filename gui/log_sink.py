@@ -0,0 +1,304 @@
+# gui/log_sink.py
+import os
+import sys
+import json
+import time
+import atexit
+import tkinter as tk
+from array import array
+from collections import deque
+from itertools import islice
+
+from config.config import GUI_LOG_MAX_LINES, GUI_LOG_FLUSH_MS, GUI_LOG_HISTORY_SIZE, GUI_LOG_LOAD_OLDER
+
+# Older log lines of each pane are spilled to logs/gui/<name>.jsonl
+LOG_SPILL_DIR = os.path.join("logs", "gui")
+
+LEVEL_PREFIXES = {"user": "✨ ", "debug": "🔍 "}
+
+# Marker queued by clear()
+_CLEAR = object()
+
+
+def is_visible(level, selected_level):
+    """Return True if a message of ``level`` is shown when ``selected_level`` is selected."""
+    if selected_level == "debug":
+        return True
+    if selected_level == "info":
+        return level != "debug"
+    return level == "user"
+
+
+class LogRecord:
+    """One log line: epoch timestamp, interned level and message."""
+
+    __slots__ = ("timestamp", "level", "message")
+
+    def __init__(self, timestamp, level, message):
+        self.timestamp = timestamp
+        self.level = sys.intern(level)
+        self.message = message
+
+    @property
+    def prefix(self):
+        return LEVEL_PREFIXES.get(self.level, "")
+
+    def format(self):
+        return f"[{time.strftime('%H:%M:%S', time.localtime(self.timestamp))}] {self.prefix}{self.message}\n"
+
+
+class LogHistory:
+    """
+    Log history of one pane: recent records in memory, older ones on disk.
+
+    The newest ``max_records`` records stay in memory; older ones are
+    appended to a JSON Lines file at ``spill_path``. The byte offset of each
+    spilled line is kept, so any record can be read back with one seek.
+    Records are addressed by their index since the last clear (0 is the
+    oldest). Without a ``spill_path`` older records are dropped. The spill
+    file only holds the current session: it is truncated on startup and
+    on clear().
+
+    Args:
+        max_records: Records kept in memory
+        spill_path: File for older records, or None
+    """
+
+    def __init__(self, max_records=GUI_LOG_HISTORY_SIZE, spill_path=None):
+        self.records = deque(maxlen=max_records)
+        self.spilled = 0
+        self._dropped = 0
+        self._offsets = array("q")
+        self._spill = None
+        if spill_path:
+            directory = os.path.dirname(spill_path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            self._spill = open(spill_path, "w+b")
+            atexit.register(self._spill.close)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    @property
+    def total(self):
+        """Records logged since the last clear, in memory, on disk and dropped."""
+        return self._dropped + self.spilled + len(self.records)
+
+    @property
+    def first(self):
+        """Index of the oldest record that can still be read."""
+        return self._dropped
+
+    def append(self, record):
+        if len(self.records) == self.records.maxlen:
+            oldest = self.records[0]
+            if self._spill is not None:
+                line = json.dumps([oldest.timestamp, oldest.level, oldest.message], ensure_ascii=False) + "\n"
+                self._spill.seek(0, os.SEEK_END)
+                self._offsets.append(self._spill.tell())
+                self._spill.write(line.encode("utf-8"))
+                self.spilled += 1
+            else:
+                self._dropped += 1
+        self.records.append(record)
+
+    def get(self, start, stop):
+        """
+        Return the records with index ``start`` up to ``stop``.
+
+        Args:
+            start: Index of the first record
+            stop: Index after the last record
+
+        Returns:
+            list: LogRecord objects, oldest first
+        """
+        start = max(start, self._dropped)
+        stop = min(stop, self.total)
+        if start >= stop:
+            return []
+        in_memory = self._dropped + self.spilled
+        records = []
+        if start < in_memory:
+            self._spill.flush()
+            self._spill.seek(self._offsets[start - self._dropped])
+            for _ in range(min(stop, in_memory) - start):
+                records.append(LogRecord(*json.loads(self._spill.readline())))
+        if stop > in_memory:
+            records.extend(islice(self.records, max(start, in_memory) - in_memory, stop - in_memory))
+        return records
+
+    def clear(self):
+        self.records.clear()
+        if self._spill is not None and self.spilled:
+            self._spill.seek(0)
+            self._spill.truncate()
+        self._offsets = array("q")
+        self.spilled = 0
+        self._dropped = 0
+
+
+class LogSink:
+    """
+    Buffered log pane for a Tk Text widget.
+
+    push() is safe to call from worker threads: it only appends to a deque.
+    The Tk loop drains the queue every ``flush_ms`` milliseconds and writes
+    everything that arrived in one insert. Every line is kept in the widget
+    with a tag for its level; lines above the selected level are elided, so
+    changing the level never re-renders the pane. The widget is capped at
+    ``max_lines``; lines trimmed from it stay in a LogHistory spilling to
+    ``logs/gui/<name>.jsonl`` and load_older() brings them back.
+
+    Args:
+        root: Tk root window
+        text_widget: Text widget showing the log (kept disabled)
+        level_var: Optional StringVar with the selected level ("user", "info" or "debug");
+            without it every pushed message is shown
+        name: Name of the spill file; None keeps no history beyond memory
+        max_lines: Lines kept in the widget
+        flush_ms: Milliseconds between drains
+    """
+
+    def __init__(self, root, text_widget, level_var=None, name=None,
+                 max_lines=GUI_LOG_MAX_LINES, flush_ms=GUI_LOG_FLUSH_MS):
+        self.root = root
+        self.text = text_widget
+        self.level_var = level_var
+        self.max_lines = max_lines
+        self.flush_ms = flush_ms
+        spill_path = os.path.join(LOG_SPILL_DIR, f"{name}.jsonl") if name else None
+        self.history = LogHistory(spill_path=spill_path)
+        self._pending = deque()
+        # Widget lines taken by each record shown, oldest first; messages
+        # can span several lines
+        self._shown = deque()
+        self._line_count = 0
+        # Lines brought back by load_older() raise the cap until a clear
+        self._loaded_lines = 0
+        self._levels = set()
+        self.root.after(self.flush_ms, self._drain)
+
+    def push(self, message, level="info", clear=False):
+        """Queue a message for display. Can be called from any thread."""
+        if clear:
+            self._pending.append(_CLEAR)
+        self._pending.append(LogRecord(time.time(), level, message))
+
+    def clear(self):
+        self._pending.append(_CLEAR)
+
+    def _selected_level(self):
+        return self.level_var.get() if self.level_var is not None else "debug"
+
+    def _drain(self):
+        try:
+            self._flush()
+        finally:
+            self.root.after(self.flush_ms, self._drain)
+
+    def _level_tag(self, level):
+        tag = f"level-{level}"
+        if level not in self._levels:
+            self._levels.add(level)
+            self.text.tag_configure(tag, elide=not is_visible(level, self._selected_level()))
+        return tag
+
+    def _flush(self):
+        if not self._pending:
+            return
+
+        cleared = False
+        records = []
+        while self._pending:
+            record = self._pending.popleft()
+            if record is _CLEAR:
+                cleared = True
+                records = []
+                self.history.clear()
+                continue
+            if record.message:
+                self.history.append(record)
+                records.append(record)
+
+        if not cleared and not records:
+            return
+
+        self.text.config(state='normal')
+        if cleared:
+            self.text.delete("1.0", tk.END)
+            self._shown.clear()
+            self._line_count = 0
+            self._loaded_lines = 0
+        if records:
+            records = records[-self.max_lines:]
+            chunks, line_counts = self._format(records)
+            self.text.insert(tk.END, *chunks)
+            self._shown.extend(line_counts)
+            self._line_count += sum(line_counts)
+            self._trim()
+            self.text.see(tk.END)
+        self.text.config(state='disabled')
+
+    def _format(self, records):
+        """Return the insert() chunks and the line count of each record."""
+        chunks = []
+        line_counts = []
+        for record in records:
+            line = record.format()
+            chunks.append(line)
+            chunks.append(self._level_tag(record.level))
+            line_counts.append(line.count("\n"))
+        return chunks, line_counts
+
+    def load_older(self, count=GUI_LOG_LOAD_OLDER):
+        """
+        Show up to ``count`` earlier records above the oldest line in the pane.
+
+        Must be called from the Tk loop, e.g. as a button command.
+
+        Returns:
+            int: Number of records loaded
+        """
+        self._flush()
+        first_shown = self.history.total - len(self._shown)
+        records = self.history.get(first_shown - count, first_shown)
+        if not records:
+            return 0
+        chunks, line_counts = self._format(records)
+        self.text.config(state='normal')
+        self.text.insert("1.0", *chunks)
+        self.text.config(state='disabled')
+        self._shown.extendleft(reversed(line_counts))
+        loaded = sum(line_counts)
+        self._line_count += loaded
+        self._loaded_lines += loaded
+        self.text.see("1.0")
+        return len(records)
+
+    def _trim(self):
+        """Remove the oldest whole records until the widget is back under its cap."""
+        excess = self._line_count - self.max_lines - self._loaded_lines
+        if excess <= 0:
+            return
+        removed = 0
+        while self._shown and removed < excess:
+            removed += self._shown.popleft()
+        self.text.delete("1.0", f"{removed + 1}.0")
+        self._line_count -= removed
+
+    def refilter(self, event=None):
+        """
+        Show the lines for the currently selected level.
+
+        Every line is inserted with a per-level tag, so this only flips the
+        elide option of each level tag; the widget content is untouched.
+        """
+        selected_level = self._selected_level()
+        for level in self._levels:
+            self.text.tag_configure(f"level-{level}", elide=not is_visible(level, selected_level))
+        self.text.see(tk.END)
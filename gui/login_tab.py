@@ -1,9 +1,12 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
-from automation.linkedin_automation import create_driver, load_credentials, login_linkedin
+from utils.lazy_import import lazy_import
 from .utils import create_tooltip, create_scrollable_frame
-from PIL import Image, ImageTk
+from .image_cache import load_photo
+
+# Selenium is only imported once a task actually runs
+linkedin_automation = lazy_import("automation.linkedin_automation")
 
 class LoginTab:
     def __init__(self, parent, app):
@@ -22,9 +25,7 @@ class LoginTab:
 
         # Logo at the top center
         try:
-            logo_img = Image.open("assets/logo.png")
-            logo_img = logo_img.resize((100, 100), Image.Resampling.LANCZOS)
-            self.logo_photo = ImageTk.PhotoImage(logo_img)
+            self.logo_photo = load_photo("assets/logo.png", (100, 100))
             logo_label = ttk.Label(main_frame, image=self.logo_photo)
             logo_label.pack(pady=(20, 10))  # Padding above and below the logo
         except Exception as e:
@@ -92,41 +93,35 @@ class LoginTab:
                 self.app.status_var.set("Loading credentials...")
                 self.app.root.update_idletasks()
 
-                creds = load_credentials()
+                creds = linkedin_automation.load_credentials()
 
-                self.app.status_var.set("Creating browser driver...")
+                self.app.status_var.set("Starting browser..." if self.app.driver is None else "Reusing browser session...")
                 self.app.root.update_idletasks()
 
-                self.app.driver = create_driver()
+                self.app.session.ensure_healthy()
 
                 self.app.status_var.set("Logging in to LinkedIn...")
                 self.app.root.update_idletasks()
 
-                success = login_linkedin(self.app.driver, creds["username"], creds["password"])
+                success = self.app.session.login(creds["username"], creds["password"])
 
                 if success:
                     self.app.is_logged_in = True
                     self.app.status_var.set("Logged in successfully")
                     self.login_status_var.set("Logged in as: " + creds["username"])
                 else:
+                    # Keep the browser open so the next attempt can reuse it
                     self.app.status_var.set("Login failed")
                     self.login_status_var.set("Login failed")
-                    if self.app.driver:
-                        self.app.driver.quit()
-                        self.app.driver = None
             except Exception as e:
                 self.app.status_var.set(f"Error: {str(e)}")
                 self.login_status_var.set("Login error")
-                if self.app.driver:
-                    self.app.driver.quit()
-                    self.app.driver = None
 
         threading.Thread(target=login_process, daemon=True).start()
 
     def logout_from_linkedin(self):
         if self.app.driver:
-            self.app.driver.quit()
-            self.app.driver = None
+            self.app.session.close()
             self.app.is_logged_in = False
             self.app.status_var.set("Logged out")
             self.login_status_var.set("Not logged in")
\ No newline at end of file
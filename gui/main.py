@@ -3,13 +3,19 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import os
 import sys
-from PIL import Image, ImageTk
+import threading
 from gui.login_tab import LoginTab
 from gui.connection_tab import ConnectionTab
 from gui.post_tab import PostTab
 from gui.message_tab import MessageTab
 from gui.feed_tab import FeedTab
 from gui.utils import create_tooltip
+from gui.image_cache import load_photo
+from utils.lazy_import import lazy_import, timed_phase
+
+# Selenium is only imported once the browser session is first needed
+session_manager = lazy_import("automation.session_manager")
+instrumented_driver = lazy_import("automation.instrumented_driver")
 
 # Add the project root directory to the Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -26,14 +32,13 @@ class LinkedInAutomatorGUI:
         try:
             logo_path = os.path.join(project_root, "assets/logo.png")
             if os.path.exists(logo_path):
-                logo_img = Image.open(logo_path)
-                logo_img = logo_img.resize((32, 32), Image.Resampling.LANCZOS)
-                logo_photo = ImageTk.PhotoImage(logo_img)
+                logo_photo = load_photo(logo_path, (32, 32))
                 self.root.iconphoto(True, logo_photo)
         except Exception as e:
             print(f"Note: Using default icon (logo not found at {logo_path})")
 
-        self.driver = None
+        # One browser session shared by every tab, created on first use
+        self._session = None
         self.is_logged_in = False
 
         # Create notebook for tabs
@@ -59,21 +64,99 @@ class LinkedInAutomatorGUI:
         self.status_var.set("Not logged in")
         self.status_bar = ttk.Label(root, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.status_bar.bind("<Double-Button-1>", self.dump_driver_stats)
+        create_tooltip(self.status_bar, "Double-click to show WebDriver call stats")
 
-        # Initialize tab modules
-        self.login_tab_module = LoginTab(self.login_tab, self)
-        self.connection_tab_module = ConnectionTab(self.connection_tab, self)
-        self.post_tab_module = PostTab(self.post_tab, self)
-        self.message_tab_module = MessageTab(self.message_tab, self)
-        self.feed_tab_module = FeedTab(self.feed_tab, self)
+        # Tab modules are built the first time their tab is selected
+        self.login_tab_module = None
+        self.connection_tab_module = None
+        self.post_tab_module = None
+        self.message_tab_module = None
+        self.feed_tab_module = None
+        self._tab_modules = {
+            str(self.login_tab): ("login_tab_module", LoginTab),
+            str(self.connection_tab): ("connection_tab_module", ConnectionTab),
+            str(self.post_tab): ("post_tab_module", PostTab),
+            str(self.message_tab): ("message_tab_module", MessageTab),
+            str(self.feed_tab): ("feed_tab_module", FeedTab),
+        }
+        self.build_tab(self.login_tab)
 
-    def on_closing(self):
-        """Handle window closing event."""
-        if self.driver:
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+
+    def build_tab(self, frame):
+        """Build the module for a tab frame if it has not been built yet."""
+        attr, tab_class = self._tab_modules[str(frame)]
+        if getattr(self, attr) is None:
+            with timed_phase(f"build {tab_class.__name__}"):
+                setattr(self, attr, tab_class(self.root.nametowidget(str(frame)), self))
+        return getattr(self, attr)
+
+    @property
+    def session(self):
+        if self._session is None:
+            self._session = session_manager.SessionManager()
+        return self._session
+
+    @property
+    def driver(self):
+        """The shared browser driver, or None if no session has been started."""
+        return self._session.driver if self._session else None
+
+    def dump_driver_stats(self, event=None):
+        """
+        Print and save the WebDriver call stats of the shared browser (needs
+        INSTRUMENT_DRIVER). The dump runs in the background, since a task may
+        be using the browser, and a summary is shown when it is done.
+        """
+        driver = self.driver
+        if driver is None:
+            messagebox.showinfo("WebDriver calls", "No browser session yet")
+            return
+        stats = instrumented_driver.get_call_stats(driver)
+        if stats is None:
+            messagebox.showinfo("WebDriver calls", "WebDriver call stats are off (set INSTRUMENT_DRIVER in config)")
+            return
+
+        def dump():
+            calls = stats.count()
+            instrumented_driver.dump_call_stats(driver, "on_demand", reset=False)
+            self.root.after(0, lambda: messagebox.showinfo(
+                "WebDriver calls",
+                f"{calls} WebDriver calls since the last task.\n\nPer call site details were printed "
+                f"to the console and saved to {instrumented_driver.STATS_DIR}."
+            ))
+
+        threading.Thread(target=dump, daemon=True).start()
+
+    def on_tab_changed(self, event=None):
+        """
+        Build the selected tab on first use, then check the shared browser in
+        the background so the next task can reuse it.
+        """
+        self.build_tab(self.notebook.select())
+        if not self.is_logged_in:
+            return
+
+        def check_session():
             try:
-                self.driver.quit()
+                if not self.session.check_idle():
+                    return  # A task is running on the browser right now
+                self.is_logged_in = self.session.logged_in
+                if not self.is_logged_in:
+                    self.status_var.set("Browser session lost - please log in again")
             except Exception as e:
-                print(f"Error closing browser: {e}")
+                self.status_var.set(f"Browser session error: {str(e)}")
+
+        threading.Thread(target=check_session, daemon=True).start()
+
+    def on_closing(self):
+        """Handle window closing event."""
+        try:
+            if self._session:
+                self._session.close()
+        except Exception as e:
+            print(f"Error closing browser: {e}")
         
         # Save any necessary state or cleanup
         try:
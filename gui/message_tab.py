@@ -1,10 +1,14 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
-from automation.message_bot import open_messaging_page, send_message, get_contacts
-from .utils import create_scrollable_frame, create_tooltip
+from utils.lazy_import import lazy_import
+from .log_sink import LogSink
+from .utils import create_scrollable_frame, create_tooltip, stream_to_text
 import os
 
+# Selenium is only imported once a task actually runs
+message_bot = lazy_import("automation.message_bot")
+
 class MessageTab:
     def __init__(self, parent, app):
         self.parent = parent
@@ -150,7 +154,11 @@ class MessageTab:
         messaging_log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.messaging_log_text.config(yscrollcommand=messaging_log_scrollbar.set)
 
-        self.messaging_log_messages = []
+        self.messaging_log = LogSink(self.app.root, self.messaging_log_text, self.messaging_log_level_var, name="messaging")
+
+        messaging_older_button = ttk.Button(log_filter_frame, text="Load older", command=self.messaging_log.load_older)
+        messaging_older_button.pack(side=tk.RIGHT, padx=5)
+        create_tooltip(messaging_older_button, "Show earlier log lines that were removed from this pane")
 
     def check_login_status(self):
         if not self.app.is_logged_in or not self.app.driver:
@@ -166,11 +174,12 @@ class MessageTab:
 
         def load_contacts_process():
             try:
-                self.messaging_log_message("Opening LinkedIn messaging page...", level="info")
-                open_messaging_page(self.app.driver)
+                with self.app.session.task(name="load_contacts", log_callback=self.messaging_log_message) as driver:
+                    self.messaging_log_message("Opening LinkedIn messaging page...", level="info")
+                    message_bot.open_messaging_page(driver)
 
-                self.messaging_log_message("Finding recent conversations...", level="info")
-                contacts = get_contacts(self.app.driver)
+                    self.messaging_log_message("Finding recent conversations...", level="info")
+                    contacts = message_bot.get_contacts(driver)
 
                 if not contacts:
                     self.messaging_log_message(
@@ -219,7 +228,7 @@ class MessageTab:
 
         try:
             self.messaging_log_message("Creating message with AI...", level="info")
-            from ai.ai_generator import generate_text
+            from ai.ai_generator import stream_text
 
             selected_indices = self.contacts_listbox.curselection()
             recipient_name = "{name}"
@@ -248,24 +257,34 @@ class MessageTab:
             Return only the message text.
             """
 
-            message = generate_text(prompt)
+            fallback_message = f"{recipient_name}, I'm interested in {topic}. Could we discuss this? I've attached my resume."
 
-            if message:
-                message = message.strip('"\'')
+            def show_fallback():
                 self.message_preview_text.config(state='normal')
                 self.message_preview_text.delete("1.0", tk.END)
-                self.message_preview_text.insert(tk.END, message)
+                self.message_preview_text.insert(tk.END, fallback_message)
                 self.message_preview_text.config(state='disabled')
 
-                self.messaging_log_message("✅ Preview message generated with AI", level="user")
-            else:
-                self.message_preview_text.config(state='normal')
-                self.message_preview_text.delete("1.0", tk.END)
-                simple_message = f"{recipient_name}, I'm interested in {topic}. Could we discuss this? I've attached my resume."
-                self.message_preview_text.insert(tk.END, simple_message)
-                self.message_preview_text.config(state='disabled')
+            def on_done(message):
+                message = message.strip().strip('"\'')
+                if message:
+                    if message != self.message_preview_text.get("1.0", tk.END).strip():
+                        self.message_preview_text.config(state='normal')
+                        self.message_preview_text.delete("1.0", tk.END)
+                        self.message_preview_text.insert(tk.END, message)
+                        self.message_preview_text.config(state='disabled')
+                    self.messaging_log_message("✅ Preview message generated with AI", level="user")
+                else:
+                    show_fallback()
+                    self.messaging_log_message("⚠️ Could not generate message with AI, using default message", level="user")
+
+            def on_error(e):
+                self.messaging_log_message(f"Failed to generate message: {e}", level="user")
+                show_fallback()
 
-                self.messaging_log_message("⚠️ Could not generate message with AI, using default message", level="user")
+            # Stream the message into the preview as it is generated
+            stream_to_text(self.app.root, self.message_preview_text, lambda: stream_text(prompt),
+                           on_done=on_done, on_error=on_error)
 
         except Exception as e:
             error_message = str(e)
@@ -295,64 +314,10 @@ class MessageTab:
             self.resume_path_var.set(file_path)
 
     def messaging_log_message(self, message, clear=False, level="info"):
-        if level == "user":
-            prefix = "✨ "
-        elif level == "debug":
-            prefix = "🔍 "
-        else:
-            prefix = ""
-
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-
-        if clear:
-            self.messaging_log_messages = []
-
-        self.messaging_log_messages.append((timestamp, message, level, prefix))
-
-        selected_level = self.messaging_log_level_var.get()
-        show_message = False
-        if selected_level == "debug":
-            show_message = True
-        elif selected_level == "info" and level != "debug":
-            show_message = True
-        elif selected_level == "user" and level == "user":
-            show_message = True
-
-        self.messaging_log_text.config(state='normal')
-
-        if clear:
-            self.messaging_log_text.delete(1.0, tk.END)
-
-        if message and show_message:
-            formatted_message = f"[{timestamp}] {prefix}{message}\n"
-            self.messaging_log_text.insert(tk.END, formatted_message)
-
-        self.messaging_log_text.see(tk.END)
-        self.messaging_log_text.config(state='disabled')
-        self.app.root.update_idletasks()
+        self.messaging_log.push(message, level=level, clear=clear)
 
     def update_messaging_log_display(self, event=None):
-        selected_level = self.messaging_log_level_var.get()
-
-        self.messaging_log_text.config(state='normal')
-        self.messaging_log_text.delete(1.0, tk.END)
-
-        for timestamp, message, level, prefix in self.messaging_log_messages:
-            show = False
-            if selected_level == "debug":
-                show = True
-            elif selected_level == "info" and level != "debug":
-                show = True
-            elif selected_level == "user" and level == "user":
-                show = True
-
-            if show:
-                formatted_message = f"[{timestamp}] {prefix}{message}\n"
-                self.messaging_log_text.insert(tk.END, formatted_message)
-
-        self.messaging_log_text.config(state='disabled')
-        self.messaging_log_text.see(tk.END)
+        self.messaging_log.refilter()
 
     def start_messaging(self):
         if not self.check_login_status():
@@ -407,7 +372,8 @@ class MessageTab:
                     self.messaging_log_message(f"Processing message for {name}...", level="user")
                     message = message_template.replace("{name}", name)
 
-                    success = send_message(self.app.driver, name, profile_url, message, resume_path, log_callback=self.messaging_log_message)
+                    with self.app.session.task(name="send_message") as driver:
+                        success = message_bot.send_message(driver, name, profile_url, message, resume_path, log_callback=self.messaging_log_message)
                     if success:
                         self.messaging_log_message(f"✅ Message sent to {name}", level="user")
                     else:
@@ -4,8 +4,15 @@ from tkinter import ttk, filedialog, messagebox
 import threading
 import os
 import time
-from automation.post_creator import create_linkedin_post
-from .utils import create_scrollable_frame, create_tooltip
+from utils.lazy_import import lazy_import
+from .log_sink import LogSink
+from .utils import create_scrollable_frame, create_tooltip, TextStreamer
+from .image_cache import load_photo
+
+IMAGE_PREVIEW_SIZE = (80, 80)
+
+# Selenium is only imported once a task actually runs
+post_creator = lazy_import("automation.post_creator")
 
 class PostTab:
     def __init__(self, parent, app):
@@ -42,6 +49,10 @@ class PostTab:
         browse_button.pack(side=tk.LEFT, padx=5)
         create_tooltip(browse_button, "Select an image file from your computer")
 
+        self.image_preview_label = ttk.Label(self.image_frame)
+        self.image_preview_label.pack(side=tk.LEFT, padx=5)
+        self.image_path_var.trace_add("write", lambda *args: self.update_image_preview())
+
         self.smart_hashtags_var = tk.BooleanVar(value=True)
         smart_hashtags_check = ttk.Checkbutton(post_frame, text="Use Smart Hashtags", variable=self.smart_hashtags_var)
         smart_hashtags_check.pack(anchor=tk.W, pady=5)
@@ -68,7 +79,11 @@ class PostTab:
         log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.log_text.config(yscrollcommand=log_scrollbar.set)
 
-        self.log_messages = []
+        self.log_sink = LogSink(self.app.root, self.log_text, self.log_level_var, name="post")
+
+        older_button = ttk.Button(log_filter_frame, text="Load older", command=self.log_sink.load_older)
+        older_button.pack(side=tk.RIGHT, padx=5)
+        create_tooltip(older_button, "Show earlier log lines that were removed from this pane")
 
         self.enhanced_caption_frame = ttk.Frame(frame, relief=tk.RAISED, borderwidth=3)
         self.enhanced_caption_frame.pack(fill=tk.BOTH, expand=False, padx=10, pady=10)
@@ -110,6 +125,14 @@ class PostTab:
         if file_path:
             self.image_path_var.set(file_path)
 
+    def update_image_preview(self):
+        image_path = self.image_path_var.get()
+        try:
+            photo = load_photo(image_path, IMAGE_PREVIEW_SIZE, fit=True) if os.path.isfile(image_path) else None
+        except OSError:
+            photo = None
+        self.image_preview_label.config(image=photo or "")
+
     def respond_to_enhancement(self, accepted):
         self.enhancement_accepted = accepted
         if accepted:
@@ -119,60 +142,10 @@ class PostTab:
         self.enhanced_caption_frame.pack_forget()
 
     def update_log_display(self, event=None):
-        selected_level = self.log_level_var.get()
-        self.log_text.config(state='normal')
-        self.log_text.delete(1.0, tk.END)
-        for timestamp, message, level, prefix in self.log_messages:
-            show = False
-            if selected_level == "debug":
-                show = True
-            elif selected_level == "info" and level != "debug":
-                show = True
-            elif selected_level == "user" and level == "user":
-                show = True
-            if show:
-                formatted_message = f"[{timestamp}] {prefix}{message}\n"
-                self.log_text.insert(tk.END, formatted_message)
-        self.log_text.config(state='disabled')
-        self.log_text.see(tk.END)
+        self.log_sink.refilter()
 
     def log_message(self, message, clear=False, level="info"):
-        if level == "user":
-            prefix = "✨ "
-        elif level == "debug":
-            prefix = "🔍 "
-        else:
-            prefix = ""
-
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-
-        if clear:
-            self.log_messages = []
-
-        self.log_messages.append((timestamp, message, level, prefix))
-
-        selected_level = self.log_level_var.get()
-        show_message = False
-        if selected_level == "debug":
-            show_message = True
-        elif selected_level == "info" and level != "debug":
-            show_message = True
-        elif selected_level == "user" and level == "user":
-            show_message = True
-
-        self.log_text.config(state='normal')
-
-        if clear:
-            self.log_text.delete("1.0", tk.END)
-
-        if message and show_message:
-            formatted_message = f"[{timestamp}] {prefix}{message}\n"
-            self.log_text.insert(tk.END, formatted_message)
-
-        self.log_text.see(tk.END)
-        self.log_text.config(state='disabled')
-        self.app.root.update_idletasks()
+        self.log_sink.push(message, level=level, clear=clear)
 
     def create_post(self):
         if not self.check_login_status():
@@ -197,7 +170,7 @@ class PostTab:
                 self.app.status_var.set("Creating LinkedIn post...")
                 self.log_message("Starting post creation...", clear=True, level="user")
 
-                from ai.ai_generator import enhance_caption, detect_topic_and_hashtags
+                from ai.ai_generator import stream_post_package
 
                 def remove_non_bmp(text):
                     return ''.join(char for char in text if ord(char) < 0x10000)
@@ -205,14 +178,21 @@ class PostTab:
                 clean_caption = remove_non_bmp(caption)
 
                 try:
+                    # Caption, topic and hashtags come back from a single model call;
+                    # the caption is streamed into the text box as it is generated
                     self.log_message("Enhancing caption with AI...", level="info")
-                    enhanced_caption = enhance_caption(clean_caption)
+                    package = {}
+                    stream_done = threading.Event()
+                    streamer = TextStreamer(self.app.root, self.caption_text, final_state='normal',
+                                            on_done=lambda text: stream_done.set())
+                    for chunk in stream_post_package(clean_caption, image_path, result=package):
+                        streamer.put(chunk)
+                    streamer.close(replacement=package["caption"])
+                    stream_done.wait()
+
+                    enhanced_caption, topic, hashtags = package["caption"], package["topic"], package["hashtags"]
                     self.log_message(f"AI-generated caption: {enhanced_caption}", level="user")
 
-                    self.caption_text.config(state='normal')
-                    self.caption_text.delete("1.0", tk.END)
-                    self.caption_text.insert("1.0", enhanced_caption)
-                    self.caption_text.config(state='normal')
                     self.enhanced_caption_frame.pack(fill=tk.BOTH, expand=False, padx=10, pady=10)
 
                     self.enhancement_accepted = None
@@ -230,13 +210,12 @@ class PostTab:
                     final_caption = self.caption_text.get("1.0", tk.END).strip()
 
                     if self.smart_hashtags_var.get():
-                        self.log_message("Generating smart hashtags...", level="info")
-                        topic, hashtags = detect_topic_and_hashtags(final_caption)
                         self.log_message(f"Detected Topic: {topic}", level="info")
                         self.log_message(f"Hashtags: {', '.join(hashtags)}", level="info")
                         final_caption += "\n" + " ".join(hashtags)
 
-                    success = create_linkedin_post(self.app.driver, final_caption, image_path)
+                    with self.app.session.task(name="create_linkedin_post") as driver:
+                        success = post_creator.create_linkedin_post(driver, final_caption, image_path)
                     if success:
                         self.log_message("✅ Post created successfully", level="user")
                         self.app.root.after(0, lambda: messagebox.showinfo("Success", "Post created successfully"))
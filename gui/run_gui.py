@@ -6,12 +6,29 @@ script_path = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(script_path)
 sys.path.insert(0, project_root)
 
-from gui.main import LinkedInAutomatorGUI
+from utils.lazy_import import timed_import, timed_phase, format_startup_report, profile_imports
+from utils import tracing
+from config.config import STARTUP_REPORT
 import tkinter as tk
 
 def main():
-    root = tk.Tk()
-    app = LinkedInAutomatorGUI(root)
+    startup_report = STARTUP_REPORT or "--startup-report" in sys.argv
+    if "--trace" in sys.argv:
+        tracing.enable()
+    if startup_report:
+        # Breaks the gui.main import below (and later lazy imports) down per module
+        profile_imports()
+
+    gui_main = timed_import("gui.main")
+
+    with timed_phase("create window"):
+        root = tk.Tk()
+        app = gui_main.LinkedInAutomatorGUI(root)
+    with timed_phase("first paint"):
+        root.update_idletasks()
+
+    if startup_report:
+        print(format_startup_report())
     
     # Set up window closing protocol
     root.protocol("WM_DELETE_WINDOW", app.on_closing)
@@ -19,5 +36,9 @@ def main():
     # Start the main event loop
     root.mainloop()
 
+    if startup_report:
+        # Includes the modules that were imported lazily while the app was used
+        print(format_startup_report())
+
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
\ No newline at end of file
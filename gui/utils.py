@@ -2,6 +2,8 @@
 import tkinter as tk
 from tkinter import ttk
 import time
+import queue
+import threading
 
 def create_tooltip(widget, text):
     tooltip = None
@@ -62,4 +64,111 @@ def create_scrollable_frame(parent):
 def long_operation(func):
     def wrapper(*args, **kwargs):
         return func(*args, **kwargs)
-    return wrapper
\ No newline at end of file
+    return wrapper
+
+class TextStreamer:
+    """
+    Appends streamed text chunks to a Tk Text widget.
+
+    put() may be called from any thread; the chunks are queued and inserted
+    by a root.after loop on the Tk thread, batching whatever arrived since
+    the last drain into a single insert.
+
+    Args:
+        root: Tk root window
+        widget: Text widget to fill (cleared first)
+        poll_ms: Milliseconds between drains
+        final_state: Widget state to restore once the stream is closed
+        on_done: Optional callback(full_text) run on the Tk thread after close()
+        on_error: Optional callback(exception) run instead of on_done if the
+            stream was closed with an error
+    """
+
+    _CLOSE = object()
+
+    def __init__(self, root, widget, poll_ms=30, final_state="disabled", on_done=None, on_error=None):
+        self.root = root
+        self.widget = widget
+        self.poll_ms = poll_ms
+        self.final_state = final_state
+        self.on_done = on_done
+        self.on_error = on_error
+        self.text = ""
+        self._queue = queue.Queue()
+        self._replacement = None
+        self._error = None
+        root.after(0, self._start)
+
+    def _start(self):
+        self.widget.config(state='normal')
+        self.widget.delete("1.0", tk.END)
+        self._drain()
+
+    def put(self, chunk):
+        self._queue.put(chunk)
+
+    def close(self, replacement=None, error=None):
+        """
+        Finish the stream, optionally replacing the shown text (e.g. with a
+        cleaned-up version) or reporting the error that ended it.
+        """
+        self._replacement = replacement
+        self._error = error
+        self._queue.put(self._CLOSE)
+
+    def _drain(self):
+        chunks, closed = [], False
+        try:
+            while True:
+                item = self._queue.get_nowait()
+                if item is self._CLOSE:
+                    closed = True
+                    break
+                chunks.append(item)
+        except queue.Empty:
+            pass
+
+        if chunks:
+            text = "".join(chunks)
+            self.text += text
+            self.widget.insert(tk.END, text)
+            self.widget.see(tk.END)
+
+        if not closed:
+            self.root.after(self.poll_ms, self._drain)
+            return
+
+        if self._replacement is not None and self._replacement != self.text:
+            self.text = self._replacement
+            self.widget.delete("1.0", tk.END)
+            self.widget.insert("1.0", self.text)
+        self.widget.config(state=self.final_state)
+        if self._error is not None and self.on_error:
+            self.on_error(self._error)
+        elif self.on_done:
+            self.on_done(self.text)
+
+def stream_to_text(root, widget, make_chunks, on_done=None, on_error=None, final_state="disabled"):
+    """
+    Run a chunk generator on a worker thread and stream its output into ``widget``.
+
+    Args:
+        root: Tk root window
+        widget: Text widget to fill
+        make_chunks: Callable returning the chunk iterator (called on the worker thread)
+        on_done: Optional callback(full_text) run on the Tk thread
+        on_error: Optional callback(exception) run on the Tk thread if the stream fails
+    """
+    streamer = TextStreamer(root, widget, final_state=final_state, on_done=on_done, on_error=on_error)
+
+    def worker():
+        try:
+            for chunk in make_chunks():
+                streamer.put(chunk)
+        except Exception as e:
+            streamer.close(error=e)
+        else:
+            streamer.close()
+
+    threading.Thread(target=worker, daemon=True).start()
+    return streamer
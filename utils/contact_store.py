@@ -0,0 +1,224 @@
+import os
+import json
+import time
+import atexit
+import sqlite3
+import datetime
+import threading
+from urllib.parse import urlsplit
+
+from config.config import CONTACT_STORE_BATCH_SIZE, CONTACT_STORE_COMMIT_INTERVAL
+
+# Define the store location
+STORE_DIR = "logs"
+STORE_FILE = os.path.join(STORE_DIR, "contacts.sqlite3")
+
+# Legacy JSON files imported on first use
+LEGACY_ALUMNI_FILE = os.path.join(STORE_DIR, "sent_alumni.json")
+LEGACY_MESSAGE_FILE = os.path.join(STORE_DIR, "message_log.json")
+
+# Contact kinds
+ALUMNI_MESSAGED = "alumni_messaged"
+MESSAGED = "messaged"
+CONNECTION_SENT = "connection_sent"
+CONNECTION_SKIPPED = "connection_skipped"
+CONNECTION_SAVED = "connection_saved"
+
+
+def normalize_profile_url(url):
+    """
+    Normalize a LinkedIn profile URL so the same profile always maps to one key.
+
+    Query strings, fragments, trailing slashes, the scheme and "www." are
+    dropped and the result is lowercased, e.g.
+    "https://www.linkedin.com/in/Jane-Doe/?miniProfile=1" -> "linkedin.com/in/jane-doe".
+    Values that are not URLs (such as contact names) are only stripped.
+    """
+    if not url:
+        return ""
+    url = url.strip()
+    if "linkedin.com" not in url.lower() and not url.startswith("/in/"):
+        return url
+
+    if url.startswith("/"):
+        url = "linkedin.com" + url
+    parts = urlsplit(url if "://" in url else "https://" + url)
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    path = parts.path.rstrip("/")
+    return f"{host}{path}".lower()
+
+
+class ContactStore:
+    """
+    SQLite-backed (WAL mode) record of who has already been contacted.
+
+    Keys of each kind are cached in memory as sets, so membership checks never
+    touch the database. Writes are committed in batches of ``batch_size`` or
+    every ``commit_interval`` seconds, whichever comes first, and on ``flush()``.
+    A background timer commits pending writes ``commit_interval`` seconds
+    after the first of them, so a lone write is never left uncommitted.
+    """
+
+    def __init__(self, path=STORE_FILE, batch_size=CONTACT_STORE_BATCH_SIZE,
+                 commit_interval=CONTACT_STORE_COMMIT_INTERVAL):
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self.path = path
+        self.batch_size = batch_size
+        self.commit_interval = commit_interval
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS contacts (
+                kind TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (kind, key)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
+        self._cache = {}
+        self._pending = 0
+        self._last_commit = time.monotonic()
+        self._commit_timer = None
+
+    def _keys(self, kind):
+        keys = self._cache.get(kind)
+        if keys is None:
+            rows = self._conn.execute("SELECT key FROM contacts WHERE kind = ?", (kind,))
+            keys = {row[0] for row in rows}
+            self._cache[kind] = keys
+        return keys
+
+    def contains(self, kind, key):
+        """Return True if ``key`` has been recorded for ``kind``."""
+        key = normalize_profile_url(key)
+        with self._lock:
+            return key in self._keys(kind)
+
+    def add(self, kind, key, value=None):
+        """Record ``key`` for ``kind`` with an optional JSON-serializable value."""
+        key = normalize_profile_url(key)
+        if not key:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO contacts (kind, key, value, updated_at) VALUES (?, ?, ?, ?)",
+                (kind, key, json.dumps(value), datetime.datetime.now().isoformat()),
+            )
+            self._keys(kind).add(key)
+            self._pending += 1
+            if (self._pending >= self.batch_size
+                    or time.monotonic() - self._last_commit >= self.commit_interval):
+                self._commit()
+            elif self._commit_timer is None:
+                self._commit_timer = threading.Timer(self.commit_interval, self.flush)
+                self._commit_timer.daemon = True
+                self._commit_timer.start()
+
+    def get(self, kind, key, default=None):
+        """Return the value stored for ``key``, or ``default`` if it is unknown."""
+        key = normalize_profile_url(key)
+        with self._lock:
+            if key not in self._keys(kind):
+                return default
+            row = self._conn.execute(
+                "SELECT value FROM contacts WHERE kind = ? AND key = ?", (kind, key)
+            ).fetchone()
+        return json.loads(row[0]) if row and row[0] is not None else default
+
+    def items(self, kind):
+        """Return a dict of every key and value recorded for ``kind``."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, value FROM contacts WHERE kind = ?", (kind,)
+            ).fetchall()
+        return {key: json.loads(value) if value is not None else None for key, value in rows}
+
+    def _commit(self):
+        self._conn.commit()
+        self._pending = 0
+        self._last_commit = time.monotonic()
+        if self._commit_timer is not None:
+            self._commit_timer.cancel()
+            self._commit_timer = None
+
+    def flush(self):
+        """Commit any pending writes."""
+        with self._lock:
+            if self._pending:
+                self._commit()
+            elif self._commit_timer is not None:
+                self._commit_timer.cancel()
+                self._commit_timer = None
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            self._conn.close()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def migrate_legacy_files(store, alumni_file=LEGACY_ALUMNI_FILE, message_file=LEGACY_MESSAGE_FILE):
+    """
+    Import the old sent_alumni.json and message_log.json files into the store.
+
+    Each file is renamed to ``<file>.migrated`` afterwards so the import only
+    ever runs once.
+
+    Returns:
+        int: Number of imported records
+    """
+    count = 0
+
+    if os.path.exists(alumni_file):
+        try:
+            with open(alumni_file, "r") as f:
+                urls = json.load(f).get("sent", [])
+        except (json.JSONDecodeError, AttributeError):
+            urls = []
+        for url in urls:
+            store.add(ALUMNI_MESSAGED, url)
+            count += 1
+        os.replace(alumni_file, alumni_file + ".migrated")
+
+    if os.path.exists(message_file):
+        try:
+            with open(message_file, "r") as f:
+                messages = json.load(f)
+        except json.JSONDecodeError:
+            messages = {}
+        if isinstance(messages, dict):
+            for name, message in messages.items():
+                store.add(MESSAGED, name, message)
+                count += 1
+        os.replace(message_file, message_file + ".migrated")
+
+    store.flush()
+    if count:
+        print(f"✅ Migrated {count} contact records into {store.path}")
+    return count
+
+
+def get_contact_store():
+    """Return the process-wide contact store, importing legacy JSON logs on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                store = ContactStore()
+                migrate_legacy_files(store)
+                atexit.register(store.close)
+                _store = store
+    return _store
@@ -0,0 +1,176 @@
+import sys
+import time
+import importlib
+import importlib.abc
+import importlib.machinery
+import threading
+
+from config.config import STARTUP_REPORT_MODULES
+
+_timings_lock = threading.Lock()
+# (label, seconds, phase) in the order they were recorded
+_timings = []
+# module name -> [self seconds, cumulative seconds], filled by profile_imports()
+_module_timings = {}
+_start = time.perf_counter()
+
+
+def record_timing(label, seconds, phase="import"):
+    with _timings_lock:
+        _timings.append((label, seconds, phase))
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access.
+
+    The import time is recorded for the startup report. Usage:
+
+        connection_requester = lazy_import("automation.connection_requester")
+        connection_requester.process_connections(...)  # imported here
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    already_loaded = self._name in sys.modules
+                    start = time.perf_counter()
+                    module = importlib.import_module(self._name)
+                    if not already_loaded:
+                        record_timing(self._name, time.perf_counter() - start, "lazy import")
+                    self._module = module
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name} ({state})>"
+
+
+def lazy_import(name):
+    """Return a LazyModule facade for ``name``; nothing is imported yet."""
+    return LazyModule(name)
+
+
+def timed_import(name):
+    """Import ``name`` now and record how long it took."""
+    already_loaded = name in sys.modules
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    if not already_loaded:
+        record_timing(name, time.perf_counter() - start)
+    return module
+
+
+class timed_phase:
+    """Context manager recording how long a startup phase took."""
+
+    def __init__(self, label):
+        self.label = label
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record_timing(self.label, time.perf_counter() - self._start, "phase")
+        return False
+
+
+class _ImportProfiler(importlib.abc.MetaPathFinder):
+    """
+    Times the execution of every module imported from a file, like
+    ``python -X importtime``: self time excludes the modules it imported,
+    cumulative time includes them.
+    """
+
+    # Loaders created per module, so timing one instance times one module
+    TIMED_LOADERS = (
+        importlib.machinery.SourceFileLoader,
+        importlib.machinery.SourcelessFileLoader,
+        importlib.machinery.ExtensionFileLoader,
+    )
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def find_spec(self, name, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                if isinstance(spec.loader, self.TIMED_LOADERS):
+                    self._wrap(spec.loader, name)
+                return spec
+        return None
+
+    def _wrap(self, loader, name):
+        exec_module = loader.exec_module
+
+        def timed_exec_module(module):
+            stack = self._local.__dict__.setdefault("stack", [])
+            stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                return exec_module(module)
+            finally:
+                total = time.perf_counter() - start
+                children = stack.pop()
+                if stack:
+                    stack[-1] += total
+                with _timings_lock:
+                    _module_timings[name] = [total - children, total]
+
+        loader.exec_module = timed_exec_module
+
+
+_profiler = None
+
+
+def profile_imports():
+    """Time every module imported from now on, for the startup report."""
+    global _profiler
+    if _profiler is None:
+        _profiler = _ImportProfiler()
+        sys.meta_path.insert(0, _profiler)
+
+
+def get_timings():
+    with _timings_lock:
+        return list(_timings)
+
+
+def get_module_timings():
+    """Return (module, self seconds, cumulative seconds) tuples, slowest cumulative first."""
+    with _timings_lock:
+        rows = [(name, own, total) for name, (own, total) in _module_timings.items()]
+    return sorted(rows, key=lambda row: -row[2])
+
+
+def format_startup_report(module_rows=STARTUP_REPORT_MODULES):
+    """Return the recorded phases and module imports as a printable table."""
+    lines = [
+        f"Startup report ({time.perf_counter() - _start:.3f}s since utils.lazy_import was loaded)",
+        f"{'what':<44}{'kind':<14}{'ms':>9}",
+    ]
+    for label, seconds, phase in get_timings():
+        lines.append(f"{label:<44}{phase:<14}{seconds * 1000:>9.1f}")
+
+    modules = get_module_timings()
+    if modules:
+        lines.append("")
+        lines.append(f"{'module':<44}{'self ms':>14}{'cumulative ms':>15}")
+        for name, own, total in modules[:module_rows]:
+            lines.append(f"{name[:43]:<44}{own * 1000:>14.1f}{total * 1000:>15.1f}")
+        if len(modules) > module_rows:
+            lines.append(f"... {len(modules) - module_rows} more modules")
+    return "\n".join(lines)
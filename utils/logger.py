@@ -1,19 +1,196 @@
 import os
 import json
+import atexit
+import time
 import datetime
+import threading
+
+from config.config import (
+    ACTION_LOG_FSYNC,
+    ACTION_LOG_FSYNC_INTERVAL,
+    ACTION_LOG_MAX_BYTES,
+    ACTION_LOG_BACKUP_COUNT,
+)
 
 # Define the log directory
 LOG_DIR = "logs"
 if not os.path.exists(LOG_DIR):
     os.makedirs(LOG_DIR)
 
-# Define the log file path
-LOG_FILE = os.path.join(LOG_DIR, "action_log.json")
+# Define the log file paths
+LOG_FILE = os.path.join(LOG_DIR, "action_log.jsonl")
+LEGACY_LOG_FILE = os.path.join(LOG_DIR, "action_log.json")
+
+
+class ActionJournal:
+    """
+    Append-only JSON Lines journal.
+
+    Each record is written as one line to a file kept open in append mode,
+    so the cost of an append does not depend on how much history exists.
+    The file is rotated to ``<path>.1`` ... ``<path>.N`` once it grows past
+    ``max_bytes``.
+
+    Args:
+        path: Path of the journal file
+        fsync: "always" (fsync every record), "interval" (at most every
+            ``fsync_interval`` seconds) or "never" (leave it to the OS)
+        fsync_interval: Seconds between fsyncs for the "interval" policy
+        max_bytes: Size after which the file is rotated (0 disables rotation)
+        backup_count: Number of rotated files to keep
+    """
+
+    def __init__(self, path, fsync=ACTION_LOG_FSYNC, fsync_interval=ACTION_LOG_FSYNC_INTERVAL,
+                 max_bytes=ACTION_LOG_MAX_BYTES, backup_count=ACTION_LOG_BACKUP_COUNT):
+        if fsync not in ("always", "interval", "never"):
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+        self.path = path
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._lock = threading.Lock()
+        self._file = None
+        self._size = 0
+        self._last_sync = time.monotonic()
+
+    def _open(self):
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._size = self._file.tell()
+
+    def _sync(self, force=False):
+        self._file.flush()
+        if self.fsync == "never":
+            return
+        now = time.monotonic()
+        if force or self.fsync == "always" or now - self._last_sync >= self.fsync_interval:
+            os.fsync(self._file.fileno())
+            self._last_sync = now
+
+    def _rotate(self):
+        self._sync(force=True)
+        self._file.close()
+        self._file = None
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = f"{self.path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{index + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._open()
+
+    def append(self, record):
+        """Append one record (any JSON-serializable object) to the journal."""
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        line_size = len(line.encode("utf-8"))
+        with self._lock:
+            if self._file is None:
+                self._open()
+            if self.max_bytes and self._size and self._size + line_size > self.max_bytes:
+                self._rotate()
+            self._file.write(line)
+            self._size += line_size
+            self._sync()
+
+    def files(self):
+        """Return the journal files that exist, oldest first."""
+        paths = [f"{self.path}.{index}" for index in range(self.backup_count, 0, -1)]
+        paths.append(self.path)
+        return [path for path in paths if os.path.exists(path)]
+
+    def read(self):
+        """Lazily yield records from the rotated files and the live file, oldest first."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+        for path in self.files():
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn final line from a crash; skip it
+                        continue
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._sync(force=True)
+                self._file.close()
+                self._file = None
+
+
+_journal = None
+_journal_lock = threading.Lock()
+
+
+def migrate_legacy_log(legacy_path=LEGACY_LOG_FILE, journal=None):
+    """
+    Move entries from the old JSON array log into the journal.
+
+    The legacy file is renamed to ``<legacy_path>.migrated`` afterwards so the
+    migration only ever runs once.
+
+    Returns:
+        int: Number of migrated entries
+    """
+    if not os.path.exists(legacy_path):
+        return 0
+    journal = journal or get_journal()
+
+    try:
+        with open(legacy_path, "r") as f:
+            entries = json.load(f)
+    except json.JSONDecodeError:
+        # Corrupted legacy file, nothing usable to migrate
+        entries = []
+
+    if not isinstance(entries, list):
+        entries = []
+
+    for entry in entries:
+        journal.append(entry)
+
+    os.replace(legacy_path, legacy_path + ".migrated")
+    print(f"✅ Migrated {len(entries)} entries from {legacy_path} to {journal.path}")
+    return len(entries)
+
+
+def get_journal():
+    """Return the process-wide action journal, migrating the legacy log on first use."""
+    global _journal
+    if _journal is None:
+        with _journal_lock:
+            if _journal is None:
+                journal = ActionJournal(LOG_FILE)
+                migrate_legacy_log(LEGACY_LOG_FILE, journal)
+                atexit.register(journal.close)
+                _journal = journal
+    return _journal
+
+
+def read_actions():
+    """
+    Stream logged actions, oldest first.
+
+    Yields:
+        dict: Log entries with timestamp, action, target and details
+    """
+    return get_journal().read()
+
 
 def log_action(action_type, target, details=None):
     """
     Log an action performed by the automation.
-    
+
     Args:
         action_type: Type of action (e.g., "MessageSent", "ConnectionRequested")
         target: Target of the action (e.g., person name, profile URL)
@@ -26,22 +203,8 @@ def log_action(action_type, target, details=None):
         "target": target,
         "details": details
     }
-    
-    # Load existing logs
-    logs = []
-    if os.path.exists(LOG_FILE):
-        try:
-            with open(LOG_FILE, "r") as f:
-                logs = json.load(f)
-        except json.JSONDecodeError:
-            # If the file is corrupted, start with an empty list
-            logs = []
-    
-    # Add the new log entry
-    logs.append(log_entry)
-    
-    # Save the updated logs
-    with open(LOG_FILE, "w") as f:
-        json.dump(logs, f, indent=2)
-    
+
+    # Append the entry to the journal
+    get_journal().append(log_entry)
+
     print(f"✅ Logged action: {action_type} - {target}")
@@ -0,0 +1,238 @@
+import os
+import json
+import time
+import datetime
+import functools
+import threading
+
+from config.config import TRACING_ENABLED, TRACE_SUMMARY_ROWS
+
+# Define the trace location
+TRACE_DIR = os.path.join("logs", "traces")
+
+_enabled = TRACING_ENABLED
+# Spans are only collected while at least one trace_run is active
+_active_runs = 0
+_events = []
+_events_lock = threading.Lock()
+_origin = time.perf_counter()
+_pid = os.getpid()
+
+
+def enable(flag=True):
+    """Turn tracing on or off for the whole process."""
+    global _enabled
+    _enabled = flag
+
+
+def is_enabled():
+    return _enabled
+
+
+def is_recording():
+    return _enabled and _active_runs > 0
+
+
+def record(name, category, start, duration, **args):
+    """
+    Record a finished span.
+
+    Args:
+        name: Span name
+        category: Span category, e.g. "wait", "ai" or "webdriver"
+        start: time.perf_counter() value when the span started
+        duration: Seconds the span took
+        **args: Extra values shown with the span in the trace viewer
+    """
+    if not (_enabled and _active_runs):
+        return
+    event = {
+        "name": name,
+        "cat": category,
+        "ph": "X",
+        "ts": round((start - _origin) * 1e6),
+        "dur": round(duration * 1e6),
+        "pid": _pid,
+        "tid": threading.get_ident(),
+    }
+    if args:
+        event["args"] = args
+    with _events_lock:
+        _events.append(event)
+
+
+class _NoopSpan:
+    """Shared span returned while tracing is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("name", "category", "args", "start")
+
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        record(self.name, self.category, self.start, time.perf_counter() - self.start, **self.args)
+        return False
+
+    def set(self, **args):
+        """Attach extra values to the span."""
+        self.args.update(args)
+
+
+def span(name, category="app", **args):
+    """
+    Context manager timing the enclosed block as a span. Spans nest.
+
+    While tracing is off this returns a shared no-op object, so leaving
+    spans in hot paths costs one flag check.
+
+        with span("open messaging", "navigation", url=url) as s:
+            ...
+            s.set(contacts=len(contacts))
+    """
+    if not (_enabled and _active_runs):
+        return _NOOP_SPAN
+    return _Span(name, category, args)
+
+
+def traced(name=None, category="app"):
+    """Decorator recording each call of the function as a span."""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not (_enabled and _active_runs):
+                return func(*args, **kwargs)
+            with _Span(label, category, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class trace_run:
+    """
+    Collect the spans of one task run.
+
+    On exit the spans are written to ``logs/traces/<label>_<time>.json`` in
+    Chrome trace-event format (open it in chrome://tracing or Perfetto) and
+    a summary table is printed. Runs that overlap in time share spans.
+    Does nothing while tracing is off.
+
+    Args:
+        label: Name of the run, e.g. "engage_feed"
+    """
+
+    def __init__(self, label):
+        self.label = label
+        self.path = None
+        self.summary = None
+        self._active = False
+
+    def __enter__(self):
+        global _active_runs
+        if not _enabled:
+            return self
+        with _events_lock:
+            _active_runs += 1
+            self._first_event = len(_events)
+        self._active = True
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        global _active_runs
+        if not self._active:
+            return False
+        duration = time.perf_counter() - self._start
+        args = {"error": exc_type.__name__} if exc_type is not None else {}
+        record(self.label, "run", self._start, duration, **args)
+        with _events_lock:
+            events = _events[self._first_event:]
+            _active_runs -= 1
+            if not _active_runs:
+                _events.clear()
+        self._active = False
+
+        try:
+            self.path = write_trace(events, self.label)
+        except OSError as e:
+            print(f"[⚠️] Could not write trace for {self.label}: {e}")
+        self.summary = format_summary(events, duration)
+        print(f"Trace of {self.label} ({duration:.2f}s){f' written to {self.path}' if self.path else ''}")
+        print(self.summary)
+        return False
+
+
+def traced_run(label=None):
+    """Decorator wrapping each call of the function in a trace_run."""
+    def decorator(func):
+        run_label = label or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with trace_run(run_label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def write_trace(events, label, trace_dir=TRACE_DIR):
+    """Write events as a Chrome trace-event JSON file and return its path."""
+    if not os.path.exists(trace_dir):
+        os.makedirs(trace_dir)
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = os.path.join(trace_dir, f"{label}_{timestamp}.json")
+    with open(path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    return path
+
+
+def format_summary(events, run_seconds=None, rows=TRACE_SUMMARY_ROWS):
+    """Return per-span totals (count, total, mean, max, share of the run) as a table."""
+    totals = {}
+    for event in events:
+        if event["cat"] == "run":
+            continue
+        row = totals.setdefault((event["cat"], event["name"]), [0, 0, 0])
+        row[0] += 1
+        row[1] += event["dur"]
+        row[2] = max(row[2], event["dur"])
+    if not totals:
+        return "No spans recorded."
+
+    run_us = run_seconds * 1e6 if run_seconds else None
+    lines = [f"{'category':<12}{'span':<36}{'count':>7}{'total ms':>11}{'mean ms':>10}{'max ms':>10}{'% run':>7}"]
+    ordered = sorted(totals.items(), key=lambda item: -item[1][1])
+    for (category, name), (count, total, longest) in ordered[:rows]:
+        share = f"{total / run_us * 100:>7.1f}" if run_us else f"{'':>7}"
+        lines.append(
+            f"{category:<12}{name[:35]:<36}{count:>7}{total / 1000:>11.1f}"
+            f"{total / count / 1000:>10.1f}{longest / 1000:>10.1f}{share}"
+        )
+    if len(ordered) > rows:
+        lines.append(f"... {len(ordered) - rows} more spans in the trace file")
+    return "\n".join(lines)